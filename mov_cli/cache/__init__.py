@@ -0,0 +1,5 @@
+from .cache import *
+from .backend import *
+from .sqlite import *
+from .json_file import *
+from .memory import *
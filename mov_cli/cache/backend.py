@@ -0,0 +1,139 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Tuple, Iterator, Optional, Generator, Any
+
+    from pathlib import Path
+
+    StatsT = Dict[Tuple[str, str], int]
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+__all__ = (
+    "CacheEntry",
+    "CacheBackend",
+)
+
+STAT_COLUMNS = ("hits", "misses", "evictions", "expired")
+
+@dataclass
+class CacheEntry:
+    """A single cache entry as it's handed to and from cache backends."""
+    value: str
+    """The JSON encoded value."""
+    expiring_date: Optional[float]
+    last_accessed: float = 0
+    size: int = 0
+
+class CacheBackend(ABC):
+    """
+    A base class for the storage backends :class:`~mov_cli.cache.Cache` can be built on.
+
+    Sections are plain strings, cache without a section is stored under an empty string.
+    Mutations done inside :meth:`transaction` must be committed together.
+    """
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+
+        super().__init__()
+
+    @property
+    def display_name(self) -> str:
+        return self.__class__.__name__
+
+    @abstractmethod
+    def get(self, section: str, ids: List[str], now: float) -> Dict[str, str]:
+        """Returns the JSON encoded values of the ids that exist and haven't expired."""
+        ...
+
+    @abstractmethod
+    def set(self, section: str, entries: Dict[str, CacheEntry]) -> None:
+        """Inserts or replaces entries."""
+        ...
+
+    @abstractmethod
+    def delete(self, section: str, ids: List[str]) -> None:
+        ...
+
+    @abstractmethod
+    def clear_section(self, section: Optional[str]) -> None:
+        """Deletes every entry in a section or every entry in the cache if section is None."""
+        ...
+
+    @abstractmethod
+    def iterate(self, section: Optional[str] = None) -> Iterator[Tuple[str, str, CacheEntry]]:
+        """Yields (section, id, entry) for every entry in a section or the whole cache if section is None."""
+        ...
+
+    @abstractmethod
+    def expire(self, now: float, limit: int) -> List[Tuple[str, str]]:
+        """Deletes at most ``limit`` entries that have expired by ``now`` and returns their (section, id)."""
+        ...
+
+    @abstractmethod
+    def touch(self, section: str, accessed: Dict[str, float]) -> None:
+        """Updates the last accessed time of entries."""
+        ...
+
+    @abstractmethod
+    def add_stats(self, stats: StatsT) -> None:
+        """Adds to the (section, stat) counters stored alongside the cache."""
+        ...
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Returns the stat counters of each section."""
+        ...
+
+    @abstractmethod
+    def delete_storage(self) -> None:
+        """Deletes everything this backend has stored (files and all)."""
+        ...
+
+    @contextmanager
+    def transaction(self) -> Generator[CacheBackend, Any, None]:
+        """Groups mutations so they get committed together. Nested transactions join the outer one."""
+        yield self
+
+    def evict(self, section: str, max_entries: Optional[int], max_bytes: Optional[int]) -> int:
+        """Evicts the least recently used entries of a section until it's within the quota. Returns how many were evicted."""
+        entries = sorted(
+            ((id, entry) for _, id, entry in self.iterate(section)), key = lambda x: x[1].last_accessed
+        )
+
+        entries_over = 0 if max_entries is None else max(len(entries) - max_entries, 0)
+        bytes_over = 0 if max_bytes is None else max(sum(entry.size for _, entry in entries) - max_bytes, 0)
+
+        to_evict = []
+
+        for id, entry in entries:
+
+            if entries_over <= 0 and bytes_over <= 0:
+                break
+
+            to_evict.append(id)
+
+            entries_over -= 1
+            bytes_over -= entry.size
+
+        if to_evict:
+            self.delete(section, to_evict)
+
+        return len(to_evict)
+
+    def section_sizes(self) -> Dict[str, Tuple[int, int]]:
+        """Returns the amount of entries and the size in bytes of each section."""
+        sizes: Dict[str, Tuple[int, int]] = {}
+
+        for section, _, entry in self.iterate():
+            entries, size = sizes.get(section, (0, 0))
+            sizes[section] = (entries + 1, size + entry.size)
+
+        return sizes
+
+    def close(self) -> None:
+        """Releases anything the backend holds open."""
+        return None
\ No newline at end of file
@@ -0,0 +1,342 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Any, Optional, TypeVar, TypedDict, Iterable, Generator, Tuple, Type
+
+    from ..config import Config
+    from ..utils.platform import SUPPORTED_PLATFORMS
+
+    T = TypeVar("T", Any)
+
+    class CacheSectionStats(TypedDict):
+        entries: int
+        size: int
+        hits: int
+        misses: int
+        evictions: int
+        expired: int
+
+import json
+import atexit
+import weakref
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from devgoldyutils import LoggerAdapter, Colours
+
+from ..logger import mov_cli_logger
+from ..utils import get_cache_directory
+
+from .backend import CacheBackend, CacheEntry, STAT_COLUMNS
+from .sqlite import SQLiteCacheBackend
+from .json_file import JSONCacheBackend
+from .memory import MemoryCacheBackend
+
+__all__ = (
+    "Cache",
+    "CACHE_BACKEND_TABLE",
+)
+
+logger = LoggerAdapter(
+    mov_cli_logger, prefix = Colours.BLUE.apply("Cache")
+)
+
+CACHE_BACKEND_TABLE: Dict[str, Type[CacheBackend]] = {
+    "sqlite": SQLiteCacheBackend,
+    "json": JSONCacheBackend,
+    "memory": MemoryCacheBackend
+}
+
+NO_SECTION = ""
+"""The section name cache without a section is stored under by backends."""
+GLOBAL_SECTION_NAME = "global"
+"""What cache without a section (e.g. watch history) is called in the config and stats."""
+
+EXPIRY_SWEEP_LIMIT = 256
+"""The most expired entries a single write will sweep, so a big backlog is spread across writes."""
+
+_open_caches: weakref.WeakSet[Cache] = weakref.WeakSet()
+
+class Cache():
+    """
+    An API for caching text based data on mov-cli cross platform respectively.
+
+    The storage is handled by a :class:`~mov_cli.cache.CacheBackend`, picked with the ``backend``
+    key under ``[mov-cli.cache]`` when a ``config`` is passed, otherwise SQLite is used.
+
+    When a ``config`` is passed the section's quota from ``[mov-cli.cache.quotas]`` is
+    enforced on every write by evicting the least recently used entries.
+    """
+    def __init__(
+        self,
+        platform: SUPPORTED_PLATFORMS,
+        section: Optional[str] = None,
+        config: Optional[Config] = None,
+        backend: Optional[CacheBackend] = None
+    ) -> None:
+        self.section = section
+
+        quota = {} if config is None else config.cache_quotas.get(self._section_name, {})
+
+        self.max_entries: Optional[int] = quota.get("max_entries")
+        self.max_bytes: Optional[int] = quota.get("max_bytes")
+
+        if backend is None:
+            backend_class = SQLiteCacheBackend
+
+            if config is not None:
+                backend_class = CACHE_BACKEND_TABLE.get(config.cache_backend)
+
+                if backend_class is None:
+                    logger.warning(
+                        f"The cache backend '{config.cache_backend}' doesn't exist so we're falling back to SQLite! " \
+                            f"Available backends: {', '.join(CACHE_BACKEND_TABLE)}"
+                    )
+                    backend_class = SQLiteCacheBackend
+
+            backend = backend_class(get_cache_directory(platform))
+
+        self.backend = backend
+
+        self.__lock = threading.RLock()
+
+        self.__batch_depth = 0
+        self.__pending: Dict[str, Tuple[Optional[str], Optional[float]]] = {}
+
+        # Reads only note down what they touched, it gets written with the next write (or on exit)
+        # so reading never has to take the backend's write lock.
+        self.__touched: Dict[str, float] = {}
+        self.__stats: Dict[Tuple[str, str], int] = {}
+
+        _open_caches.add(self)
+
+        super().__init__()
+
+    @property
+    def _section(self) -> str:
+        return NO_SECTION if self.section is None else self.section
+
+    @property
+    def _section_name(self) -> str:
+        return GLOBAL_SECTION_NAME if self.section is None else self.section
+
+    def get_cache(self, id: str) -> Optional[Any]:
+        logger.debug(
+            f"Getting '{id}' cache" + ("..." if self.section is None else f" from '{self.section}' section...")
+        )
+
+        return self.get_many([id]).get(id)
+
+    def get_many(self, ids: Iterable[str]) -> Dict[str, Any]:
+        """Returns the cache of multiple ids at once. Ids with no cache (or expired cache) are left out."""
+        values: Dict[str, Any] = {}
+        ids_to_query = []
+
+        now = datetime.now().timestamp()
+
+        with self.__lock:
+
+            for id in ids:
+                pending = self.__pending.get(id)
+
+                if pending is None:
+                    ids_to_query.append(id)
+                    continue
+
+                value, expiring_date = pending
+
+                if value is not None and (expiring_date is None or expiring_date > now):
+                    values[id] = json.loads(value)
+
+            if ids_to_query:
+                found = self.backend.get(self._section, ids_to_query, now)
+
+                for id, value in found.items():
+                    values[id] = json.loads(value)
+                    self.__touched[id] = now
+
+                self.__count(self._section, "hits", len(found))
+                self.__count(self._section, "misses", len(ids_to_query) - len(found))
+
+        return values
+
+    def set_cache(
+        self,
+        id: str,
+        value: T,
+        seconds_until_expired: Optional[int] = None
+    ) -> T:
+        logger.debug(
+            f"Setting '{id}' cache" + ("..." if self.section is None else f" in '{self.section}' section...")
+        )
+
+        self.set_many({id: value}, seconds_until_expired)
+
+        return value
+
+    def set_many(self, values: Dict[str, T], seconds_until_expired: Optional[int] = None) -> Dict[str, T]:
+        """Sets the cache of multiple ids at once in a single write."""
+        timestamp = None
+
+        if seconds_until_expired is not None:
+            timestamp = datetime.now().timestamp() + float(seconds_until_expired)
+
+        with self.__lock:
+
+            for id, value in values.items():
+                self.__pending[id] = (json.dumps(value), timestamp)
+
+            if self.__batch_depth == 0:
+                self.flush()
+
+        return values
+
+    def clear_cache(self, id: str) -> None:
+        logger.debug(
+            f"Clearing '{id}' cache" + ("..." if self.section is None else f" from '{self.section}' section...")
+        )
+
+        with self.__lock:
+            self.__pending[id] = (None, None)
+
+            if self.__batch_depth == 0:
+                self.flush()
+
+        return None
+
+    def clear_all_cache(self) -> None:
+        logger.debug("Clearing all cache" + ("..." if self.section is None else f" in '{self.section}' section..."))
+
+        with self.__lock:
+            self.__pending.clear()
+            self.__touched.clear()
+
+            self.backend.clear_section(self.section)
+
+        return None
+
+    def delete_cache_file(self) -> None:
+        logger.info(f"Deleting cache stored by the {self.backend.display_name} cache backend...")
+
+        with self.__lock:
+            self.__touched.clear()
+            self.__stats.clear()
+
+            self.backend.delete_storage()
+
+    @contextmanager
+    def batch(self) -> Generator[Cache, Any, None]:
+        """
+        Buffers every cache mutation made inside the ``with`` block in memory and
+        commits them all together in one transaction once the block exits.
+
+        Reads inside the block will see the buffered mutations. Batches can be nested,
+        only the outer most batch commits.
+        """
+        with self.__lock:
+            self.__batch_depth += 1
+
+        try:
+            yield self
+
+        finally:
+
+            with self.__lock:
+                self.__batch_depth -= 1
+
+                if self.__batch_depth == 0:
+                    self.flush()
+
+    def flush(self) -> None:
+        """Commits mutations buffered by :meth:`batch` right away instead of waiting for the batch to exit."""
+        with self.__lock:
+
+            if not self.__pending and not self.__touched and not self.__stats:
+                return None
+
+            now = datetime.now().timestamp()
+
+            to_set: Dict[str, CacheEntry] = {}
+            to_delete = []
+
+            for id, (value, expiring_date) in self.__pending.items():
+
+                if value is None:
+                    to_delete.append(id)
+                else:
+                    to_set[id] = CacheEntry(value, expiring_date, now, len(id) + len(value.encode()))
+
+            to_touch = {id: last_accessed for id, last_accessed in self.__touched.items() if id not in self.__pending}
+
+            if self.__pending:
+                logger.debug(f"Committing {len(self.__pending)} cache mutation(s)...")
+
+            with self.backend.transaction():
+
+                if to_set:
+                    self.backend.set(self._section, to_set)
+
+                if to_delete:
+                    self.backend.delete(self._section, to_delete)
+
+                if to_touch:
+                    self.backend.touch(self._section, to_touch)
+
+                if to_set:
+                    for section, _ in self.backend.expire(now, EXPIRY_SWEEP_LIMIT):
+                        self.__count(section, "expired", 1)
+
+                    if self.max_entries is not None or self.max_bytes is not None:
+                        evicted = self.backend.evict(self._section, self.max_entries, self.max_bytes)
+
+                        if evicted > 0:
+                            logger.debug(f"Evicted {evicted} least recently used entries from '{self._section_name}' section...")
+                            self.__count(self._section, "evictions", evicted)
+
+                if self.__stats:
+                    self.backend.add_stats(self.__stats)
+
+            self.__pending.clear()
+            self.__touched.clear()
+            self.__stats.clear()
+
+        return None
+
+    def stats(self) -> Dict[str, CacheSectionStats]:
+        """Returns the size, entry count, hits, misses, evictions and expired count of every cache section."""
+        self.flush()
+
+        section_stats: Dict[str, CacheSectionStats] = {}
+
+        def get_section_stats(section: str) -> CacheSectionStats:
+            section_name = GLOBAL_SECTION_NAME if section == NO_SECTION else section
+
+            return section_stats.setdefault(
+                section_name, {"entries": 0, "size": 0, **{column: 0 for column in STAT_COLUMNS}}
+            )
+
+        for section, (entries, size) in self.backend.section_sizes().items():
+            stats = get_section_stats(section)
+            stats["entries"] = entries
+            stats["size"] = size
+
+        for section, counts in self.backend.get_stats().items():
+            get_section_stats(section).update(counts)
+
+        return section_stats
+
+    def __count(self, section: str, stat: str, amount: int) -> None:
+
+        if amount > 0:
+            self.__stats[(section, stat)] = self.__stats.get((section, stat), 0) + amount
+
+@atexit.register
+def _flush_open_caches() -> None:
+    """Writes the access times and stats that reads noted down before the process exits."""
+    for cache in list(_open_caches):
+
+        try:
+            cache.flush()
+        except Exception as e:
+            logger.debug(f"Failed to flush cache on exit. Error: {e}")
\ No newline at end of file
@@ -0,0 +1,241 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Tuple, Iterator, Optional, Generator, Any
+
+    from pathlib import Path
+
+    from .backend import StatsT
+
+    JSONCacheDataT = Dict[str, Dict[str, Dict[str, Any]]]
+
+import json
+import threading
+from contextlib import contextmanager
+from devgoldyutils import LoggerAdapter, Colours
+
+from ..logger import mov_cli_logger
+from ..utils import FileLock, replace_file_atomically
+from .backend import CacheBackend, CacheEntry
+
+__all__ = ("JSONCacheBackend",)
+
+logger = LoggerAdapter(
+    mov_cli_logger, prefix = Colours.BLUE.apply("Cache")
+)
+
+class JSONCacheBackend(CacheBackend):
+    """
+    Stores cache in the single JSON file (``osaka_cache``) mov-cli used before SQLite, in the same layout.
+
+    Every operation loads the whole file so it gets slower as the cache grows. Writes go to a temporary
+    file that's renamed over the cache file and are done under an exclusive lock while reads take a
+    shared lock, so concurrent mov-cli processes never see a half written file.
+    """
+    def __init__(self, cache_dir: Path) -> None:
+        self.file_path = cache_dir.joinpath("osaka_cache")
+        self._stats_file_path = cache_dir.joinpath("osaka_cache_stats")
+        self._lock_file_path = cache_dir.joinpath("osaka_cache.lock")
+
+        self.__lock = threading.RLock()
+        self.__data: Optional[JSONCacheDataT] = None
+        self.__stats: Optional[Dict[str, Dict[str, int]]] = None
+
+        super().__init__(cache_dir)
+
+    @property
+    def display_name(self) -> str:
+        return "JSON"
+
+    def get(self, section: str, ids: List[str], now: float) -> Dict[str, str]:
+        values: Dict[str, str] = {}
+
+        with self.__read() as data:
+            section_data = data.get(section, {})
+
+            for id in ids:
+                basic_cache = section_data.get(id)
+
+                if basic_cache is None:
+                    continue
+
+                expiring_date = basic_cache["expiring_date"]
+
+                if expiring_date is None or expiring_date > now:
+                    values[id] = json.dumps(basic_cache["value"])
+
+        return values
+
+    def set(self, section: str, entries: Dict[str, CacheEntry]) -> None:
+
+        with self.transaction():
+            section_data = self.__data.setdefault(section, {})
+
+            for id, entry in entries.items():
+                section_data[id] = {
+                    "value": json.loads(entry.value),
+                    "expiring_date": entry.expiring_date,
+                    "last_accessed": entry.last_accessed,
+                    "size": entry.size
+                }
+
+    def delete(self, section: str, ids: List[str]) -> None:
+
+        with self.transaction():
+            section_data = self.__data.get(section, {})
+
+            for id in ids:
+                section_data.pop(id, None)
+
+    def clear_section(self, section: Optional[str]) -> None:
+
+        with self.transaction():
+
+            if section is None:
+                self.__data.clear()
+            else:
+                self.__data.pop(section, None)
+
+    def iterate(self, section: Optional[str] = None) -> Iterator[Tuple[str, str, CacheEntry]]:
+        entries = []
+
+        with self.__read() as data:
+
+            for data_section, section_data in data.items():
+
+                if section is not None and data_section != section:
+                    continue
+
+                for id, basic_cache in section_data.items():
+                    entries.append((data_section, id, self.__to_entry(id, basic_cache)))
+
+        yield from entries
+
+    def expire(self, now: float, limit: int) -> List[Tuple[str, str]]:
+        expired = []
+
+        with self.transaction():
+
+            for section, id, entry in self.iterate():
+
+                if len(expired) >= limit:
+                    break
+
+                if entry.expiring_date is not None and entry.expiring_date <= now:
+                    expired.append((section, id))
+
+            for section, id in expired:
+                self.__data[section].pop(id, None)
+
+        return expired
+
+    def touch(self, section: str, accessed: Dict[str, float]) -> None:
+
+        with self.transaction():
+            section_data = self.__data.get(section, {})
+
+            for id, last_accessed in accessed.items():
+
+                if id in section_data:
+                    section_data[id]["last_accessed"] = last_accessed
+
+    def add_stats(self, stats: StatsT) -> None:
+
+        with self.transaction():
+
+            for (section, stat), amount in stats.items():
+                section_stats = self.__stats.setdefault(section, {})
+                section_stats[stat] = section_stats.get(stat, 0) + amount
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+
+        with FileLock(self._lock_file_path, shared = True):
+            return self.__load(self._stats_file_path)
+
+    def delete_storage(self) -> None:
+
+        with self.__lock:
+
+            for path in (self.file_path, self._stats_file_path, self._lock_file_path):
+                path.unlink(True)
+
+    @contextmanager
+    def transaction(self) -> Generator[JSONCacheBackend, Any, None]:
+
+        with self.__lock:
+
+            if self.__data is not None:
+                yield self
+                return
+
+            with FileLock(self._lock_file_path):
+                self.__data = self.__load_cache()
+                self.__stats = self.__load(self._stats_file_path)
+
+                try:
+                    yield self
+
+                    replace_file_atomically(self.file_path, json.dumps(self.__dump_cache(self.__data)).encode())
+                    replace_file_atomically(self._stats_file_path, json.dumps(self.__stats).encode())
+
+                finally:
+                    self.__data = None
+                    self.__stats = None
+
+    @contextmanager
+    def __read(self) -> Generator[JSONCacheDataT, Any, None]:
+
+        with self.__lock:
+
+            # Reads inside a transaction see it's uncommitted data.
+            if self.__data is not None:
+                yield self.__data
+                return
+
+            with FileLock(self._lock_file_path, shared = True):
+                data = self.__load_cache()
+
+            yield data
+
+    def __load_cache(self) -> JSONCacheDataT:
+        """Loads the cache file with cache that has no section (which sits at the root of the file) moved under an empty section."""
+        data: JSONCacheDataT = {"": {}}
+
+        for key, value in self.__load(self.file_path).items():
+
+            if "value" in value and "expiring_date" in value:
+                data[""][key] = value
+            else:
+                data[key] = value
+
+        return data
+
+    def __dump_cache(self, data: JSONCacheDataT) -> Dict[str, Any]:
+        json_data = {section: section_data for section, section_data in data.items() if section != ""}
+        json_data.update(data.get("", {}))
+
+        return json_data
+
+    def __load(self, path: Path) -> Dict[str, Any]:
+
+        if not path.exists():
+            return {}
+
+        try:
+            with path.open("r", encoding = "utf-8") as file:
+                return json.load(file)
+
+        except ValueError as e:
+            logger.warning(f"The cache file '{path}' is corrupted so it'll be reset. Error: {e}")
+            return {}
+
+    def __to_entry(self, id: str, basic_cache: Dict[str, Any]) -> CacheEntry:
+        value = json.dumps(basic_cache["value"])
+
+        return CacheEntry(
+            value = value,
+            expiring_date = basic_cache["expiring_date"],
+            last_accessed = basic_cache.get("last_accessed", 0),
+            size = basic_cache.get("size", len(id) + len(value.encode()))
+        )
\ No newline at end of file
@@ -0,0 +1,141 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Tuple, Iterator, Optional, Generator, Any
+
+    from pathlib import Path
+
+    from .backend import StatsT
+
+import threading
+from contextlib import contextmanager
+
+from .backend import CacheBackend, CacheEntry
+
+__all__ = ("MemoryCacheBackend",)
+
+class _MemoryStore():
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.sections: Dict[str, Dict[str, CacheEntry]] = {}
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Stores cache in a dict that lives for as long as the process does. Useful for tests,
+    benchmarks and long running processes. Every instance in a process with the same
+    cache directory shares the same data but nothing is shared with other processes.
+    """
+    _stores: Dict[Path, _MemoryStore] = {}
+    _stores_lock = threading.Lock()
+
+    def __init__(self, cache_dir: Path) -> None:
+
+        with self._stores_lock:
+            self.__store = self._stores.setdefault(cache_dir, _MemoryStore())
+
+        super().__init__(cache_dir)
+
+    @property
+    def display_name(self) -> str:
+        return "Memory"
+
+    def get(self, section: str, ids: List[str], now: float) -> Dict[str, str]:
+        values: Dict[str, str] = {}
+
+        with self.__store.lock:
+            section_data = self.__store.sections.get(section, {})
+
+            for id in ids:
+                entry = section_data.get(id)
+
+                if entry is not None and (entry.expiring_date is None or entry.expiring_date > now):
+                    values[id] = entry.value
+
+        return values
+
+    def set(self, section: str, entries: Dict[str, CacheEntry]) -> None:
+
+        with self.__store.lock:
+            self.__store.sections.setdefault(section, {}).update(entries)
+
+    def delete(self, section: str, ids: List[str]) -> None:
+
+        with self.__store.lock:
+            section_data = self.__store.sections.get(section, {})
+
+            for id in ids:
+                section_data.pop(id, None)
+
+    def clear_section(self, section: Optional[str]) -> None:
+
+        with self.__store.lock:
+
+            if section is None:
+                self.__store.sections.clear()
+            else:
+                self.__store.sections.pop(section, None)
+
+    def iterate(self, section: Optional[str] = None) -> Iterator[Tuple[str, str, CacheEntry]]:
+
+        with self.__store.lock:
+            entries = [
+                (data_section, id, entry) for data_section, section_data in self.__store.sections.items()
+                    if section is None or data_section == section for id, entry in section_data.items()
+            ]
+
+        yield from entries
+
+    def expire(self, now: float, limit: int) -> List[Tuple[str, str]]:
+        expired = []
+
+        with self.__store.lock:
+
+            for section, id, entry in self.iterate():
+
+                if len(expired) >= limit:
+                    break
+
+                if entry.expiring_date is not None and entry.expiring_date <= now:
+                    expired.append((section, id))
+
+            for section, id in expired:
+                self.__store.sections[section].pop(id, None)
+
+        return expired
+
+    def touch(self, section: str, accessed: Dict[str, float]) -> None:
+
+        with self.__store.lock:
+            section_data = self.__store.sections.get(section, {})
+
+            for id, last_accessed in accessed.items():
+
+                if id in section_data:
+                    section_data[id].last_accessed = last_accessed
+
+    def add_stats(self, stats: StatsT) -> None:
+
+        with self.__store.lock:
+
+            for (section, stat), amount in stats.items():
+                section_stats = self.__store.stats.setdefault(section, {})
+                section_stats[stat] = section_stats.get(stat, 0) + amount
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+
+        with self.__store.lock:
+            return {section: dict(stats) for section, stats in self.__store.stats.items()}
+
+    def delete_storage(self) -> None:
+
+        with self.__store.lock:
+            self.__store.sections.clear()
+            self.__store.stats.clear()
+
+    @contextmanager
+    def transaction(self) -> Generator[MemoryCacheBackend, Any, None]:
+
+        with self.__store.lock:
+            yield self
\ No newline at end of file
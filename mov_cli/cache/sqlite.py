@@ -0,0 +1,324 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Tuple, Iterator, Optional, Generator, Any
+
+    from pathlib import Path
+
+    from .backend import StatsT
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from devgoldyutils import LoggerAdapter, Colours
+
+from ..logger import mov_cli_logger
+from .backend import CacheBackend, CacheEntry, STAT_COLUMNS
+
+__all__ = ("SQLiteCacheBackend",)
+
+logger = LoggerAdapter(
+    mov_cli_logger, prefix = Colours.BLUE.apply("Cache")
+)
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Stores cache in a single SQLite table keyed by (section, id) so reads and
+    writes are point lookups on the primary key rather than loading the whole cache.
+
+    The database runs in WAL mode, so it is safe to use from multiple mov-cli processes
+    at once (e.g. fzf preview subprocesses): writes are committed atomically, readers
+    never see a half written cache and readers and the writer don't block each other.
+    """
+    def __init__(self, cache_dir: Path) -> None:
+        self.file_path = cache_dir.joinpath("osaka_cache.db") # ◔_◔ https://static.wikia.nocookie.net/parody/images/f/fd/Osaka.png/revision/latest
+        self._legacy_cache_file_path = cache_dir.joinpath("osaka_cache")
+
+        self.__connection: Optional[sqlite3.Connection] = None
+        self.__lock = threading.RLock()
+        self.__transaction_depth = 0
+
+        super().__init__(cache_dir)
+
+    @property
+    def display_name(self) -> str:
+        return "SQLite"
+
+    def get(self, section: str, ids: List[str], now: float) -> Dict[str, str]:
+        values: Dict[str, str] = {}
+
+        with self.__lock:
+            connection = self.__get_connection()
+
+            # Chunked so we stay under SQLite's bound parameter limit.
+            for index in range(0, len(ids), 500):
+                chunk = ids[index:index + 500]
+
+                rows = connection.execute(
+                    f"SELECT id, value FROM cache WHERE section = ? AND id IN ({', '.join('?' * len(chunk))}) " \
+                        "AND (expiring_date IS NULL OR expiring_date > ?)",
+                    (section, *chunk, now)
+                ).fetchall()
+
+                values.update(rows)
+
+        return values
+
+    def set(self, section: str, entries: Dict[str, CacheEntry]) -> None:
+
+        with self.transaction():
+            self.__get_connection().executemany(
+                "INSERT OR REPLACE INTO cache (section, id, value, expiring_date, size, last_accessed) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (section, id, entry.value, entry.expiring_date, entry.size, entry.last_accessed) for id, entry in entries.items()
+                ]
+            )
+
+    def delete(self, section: str, ids: List[str]) -> None:
+
+        with self.transaction():
+            self.__get_connection().executemany(
+                "DELETE FROM cache WHERE section = ? AND id = ?", [(section, id) for id in ids]
+            )
+
+    def clear_section(self, section: Optional[str]) -> None:
+
+        with self.transaction():
+
+            if section is not None:
+                self.__get_connection().execute("DELETE FROM cache WHERE section = ?", (section,))
+            else:
+                self.__get_connection().execute("DELETE FROM cache")
+
+    def iterate(self, section: Optional[str] = None) -> Iterator[Tuple[str, str, CacheEntry]]:
+        query = "SELECT section, id, value, expiring_date, last_accessed, size FROM cache"
+
+        with self.__lock:
+
+            if section is None:
+                rows = self.__get_connection().execute(query).fetchall()
+            else:
+                rows = self.__get_connection().execute(query + " WHERE section = ?", (section,)).fetchall()
+
+        for section, id, *entry in rows:
+            yield section, id, CacheEntry(*entry)
+
+    def expire(self, now: float, limit: int) -> List[Tuple[str, str]]:
+
+        with self.transaction():
+            connection = self.__get_connection()
+
+            # Uses the 'expiring_date' index so only the expired rows are ever visited.
+            expired_rows = connection.execute(
+                "SELECT section, id FROM cache WHERE expiring_date IS NOT NULL AND expiring_date <= ? LIMIT ?",
+                (now, limit)
+            ).fetchall()
+
+            connection.executemany("DELETE FROM cache WHERE section = ? AND id = ?", expired_rows)
+
+        return expired_rows
+
+    def touch(self, section: str, accessed: Dict[str, float]) -> None:
+
+        with self.transaction():
+            self.__get_connection().executemany(
+                "UPDATE cache SET last_accessed = ? WHERE section = ? AND id = ?",
+                [(last_accessed, section, id) for id, last_accessed in accessed.items()]
+            )
+
+    def evict(self, section: str, max_entries: Optional[int], max_bytes: Optional[int]) -> int:
+
+        with self.transaction():
+            connection = self.__get_connection()
+
+            entries, size = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache WHERE section = ?", (section,)
+            ).fetchone()
+
+            entries_over = 0 if max_entries is None else max(entries - max_entries, 0)
+            bytes_over = 0 if max_bytes is None else max(size - max_bytes, 0)
+
+            if entries_over == 0 and bytes_over == 0:
+                return 0
+
+            to_evict = []
+
+            # Walks the (section, last_accessed) index from the least recently used entry.
+            for id, entry_size in connection.execute(
+                "SELECT id, size FROM cache WHERE section = ? ORDER BY last_accessed", (section,)
+            ):
+
+                if entries_over <= 0 and bytes_over <= 0:
+                    break
+
+                to_evict.append((section, id))
+
+                entries_over -= 1
+                bytes_over -= entry_size
+
+            connection.executemany("DELETE FROM cache WHERE section = ? AND id = ?", to_evict)
+
+        return len(to_evict)
+
+    def section_sizes(self) -> Dict[str, Tuple[int, int]]:
+
+        with self.__lock:
+            rows = self.__get_connection().execute(
+                "SELECT section, COUNT(*), COALESCE(SUM(size), 0) FROM cache GROUP BY section"
+            ).fetchall()
+
+        return {section: (entries, size) for section, entries, size in rows}
+
+    def add_stats(self, stats: StatsT) -> None:
+
+        with self.transaction():
+            connection = self.__get_connection()
+
+            connection.executemany(
+                "INSERT OR IGNORE INTO cache_stats (section) VALUES (?)", {(section,) for section, _ in stats}
+            )
+
+            for (section, stat), amount in stats.items():
+                connection.execute(f"UPDATE cache_stats SET {stat} = {stat} + ? WHERE section = ?", (amount, section))
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+
+        with self.__lock:
+            rows = self.__get_connection().execute(f"SELECT section, {', '.join(STAT_COLUMNS)} FROM cache_stats").fetchall()
+
+        return {section: dict(zip(STAT_COLUMNS, counts)) for section, *counts in rows}
+
+    def delete_storage(self) -> None:
+
+        with self.__lock:
+            self.close()
+
+            for path in (self.file_path, self.file_path.with_name(self.file_path.name + "-wal"), self.file_path.with_name(self.file_path.name + "-shm")):
+                path.unlink(True)
+
+    def close(self) -> None:
+
+        with self.__lock:
+
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+
+    @contextmanager
+    def transaction(self) -> Generator[SQLiteCacheBackend, Any, None]:
+
+        with self.__lock:
+            connection = self.__get_connection()
+
+            self.__transaction_depth += 1
+
+            try:
+
+                if self.__transaction_depth > 1:
+                    yield self
+                    return
+
+                with connection:
+                    yield self
+
+            finally:
+                self.__transaction_depth -= 1
+
+    def __get_connection(self) -> sqlite3.Connection:
+
+        if self.__connection is not None:
+            return self.__connection
+
+        new_database = not self.file_path.exists()
+
+        if new_database:
+            logger.debug(
+                f"Cache file doesn't exist, creating one at '{self.file_path}'..."
+            )
+
+        # "IMMEDIATE" makes write transactions take the write lock up front so a concurrent
+        # writer waits on the busy timeout instead of failing to upgrade a read lock midway.
+        connection = sqlite3.connect(
+            self.file_path,
+            timeout = 10,
+            isolation_level = "IMMEDIATE",
+            check_same_thread = False
+        )
+
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache (" \
+                    "section TEXT NOT NULL, id TEXT NOT NULL, value TEXT NOT NULL, expiring_date REAL, " \
+                        "size INTEGER NOT NULL DEFAULT 0, last_accessed REAL NOT NULL DEFAULT 0, " \
+                            "PRIMARY KEY (section, id)" \
+                                ") WITHOUT ROWID"
+            )
+
+            columns = [column[1] for column in connection.execute("PRAGMA table_info(cache)")]
+
+            # Databases created before LRU eviction existed.
+            if "size" not in columns:
+                connection.execute("ALTER TABLE cache ADD COLUMN size INTEGER NOT NULL DEFAULT 0")
+                connection.execute("ALTER TABLE cache ADD COLUMN last_accessed REAL NOT NULL DEFAULT 0")
+                connection.execute("UPDATE cache SET size = length(id) + length(CAST(value AS BLOB))")
+
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_expiring_date ON cache (expiring_date) WHERE expiring_date IS NOT NULL"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_last_accessed ON cache (section, last_accessed)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_stats (" \
+                    "section TEXT PRIMARY KEY, hits INTEGER NOT NULL DEFAULT 0, misses INTEGER NOT NULL DEFAULT 0, " \
+                        "evictions INTEGER NOT NULL DEFAULT 0, expired INTEGER NOT NULL DEFAULT 0" \
+                            ")"
+            )
+
+        if new_database:
+            self.__migrate_legacy_cache_file(connection)
+
+        self.__connection = connection
+        return connection
+
+    def __migrate_legacy_cache_file(self, connection: sqlite3.Connection) -> None:
+        """
+        Copies cache from the single JSON cache file mov-cli used before SQLite into a new database.
+
+        The JSON file is left alone as it's still used by the JSON cache backend.
+        """
+        if not self._legacy_cache_file_path.exists():
+            return None
+
+        logger.debug(f"Migrating legacy cache file '{self._legacy_cache_file_path}' to the database...")
+
+        json_data: Dict[str, Any] = {}
+
+        try:
+            with self._legacy_cache_file_path.open("r", encoding = "utf-8") as file:
+                json_data = json.load(file)
+
+        except (OSError, ValueError) as e:
+            logger.debug(f"Legacy cache file couldn't be read so it'll be discarded. Error: {e}")
+
+        rows = []
+
+        for key, data in json_data.items():
+
+            if "value" in data and "expiring_date" in data:
+                rows.append(("", key, json.dumps(data["value"]), data["expiring_date"]))
+                continue
+
+            for id, basic_cache in data.items():
+                rows.append((key, id, json.dumps(basic_cache["value"]), basic_cache["expiring_date"]))
+
+        with connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO cache (section, id, value, expiring_date, size) VALUES (?, ?, ?, ?, ?)",
+                [(*row, len(row[1]) + len(row[2].encode())) for row in rows]
+            )
\ No newline at end of file
@@ -13,6 +13,7 @@ from pathlib import Path
 from .play import play
 from .ui import welcome_msg
 from .plugins import show_all_plugins
+from .http_client import get_http_client
 from .main_loop import query_and_grab_content
 from .scraper import select_scraper, use_scraper, steal_scraper_args
 from .configuration import open_config_file, set_cli_config
@@ -20,7 +21,6 @@ from .configuration import open_config_file, set_cli_config
 from ..config import Config
 from ..download import Download
 from ..logger import mov_cli_logger
-from ..http_client import HTTPClient
 from ..utils import hide_ip, get_temp_directory, what_platform, get_cache_directory
 
 __all__ = ("mov_cli",)
@@ -47,6 +47,9 @@ def mov_cli(
     list_plugins: bool = typer.Option(False, "--list-plugins", "-lp", help = "Prints all configured plugins and their scrapers."), 
     clear_cache: bool = typer.Option(False, "--no-cache", "--clear-cache", help = "Clears ALL cache stored by mov-cli, including the temp directory cache."),
     no_auto_try_next_scraper: bool = typer.Option(False, "--no-auto-try-next-scraper", "--no-atns", help = "Disables auto try next scraper."),
+    http_record: Optional[Path] = typer.Option(None, "--http-record", envvar = "MOV_CLI_HTTP_RECORD", help = "Records every http request and response to this file so the run can be replayed offline."),
+    http_replay: Optional[Path] = typer.Option(None, "--http-replay", envvar = "MOV_CLI_HTTP_REPLAY", help = "Replays http responses from a file recorded with --http-record instead of using the network."),
+    http_replay_latency: Optional[bool] = typer.Option(None, "--http-replay-latency", envvar = "MOV_CLI_HTTP_REPLAY_LATENCY", help = "Makes replayed responses take as long as they did when they were recorded."),
 ):
     config = Config()
     platform = what_platform()
@@ -60,7 +63,10 @@ def mov_cli(
         preview = (preview, ["ui", "preview"]),
         limit = (limit, ["ui", "limit"]),
         auto_try_next_scraper = not no_auto_try_next_scraper,
-        auto_continue = continue_watching
+        auto_continue = continue_watching,
+        http_record = (None if http_record is None else str(http_record), ["http", "record"]),
+        http_replay = (None if http_replay is None else str(http_replay), ["http", "replay"]),
+        http_replay_latency = (http_replay_latency, ["http", "replay_latency"])
     )
 
     if config.debug:
@@ -97,7 +103,8 @@ def mov_cli(
         platform = platform, 
         check_for_updates = True if query is None and config.skip_update_checker is False else False, 
         display_tip = True if query is None else False, 
-        display_version = version
+        display_version = version, 
+        config = config
     )
 
     print(welcome_message)
@@ -106,18 +113,15 @@ def mov_cli(
         # This allows passing arguments to scrapers like this: 
         # https://github.com/mov-cli/mov-cli-youtube/commit/b538d82745a743cd74a02530d6a3d476cd60b808#diff-4e5b064838aa74a5375265f4dfbd94024b655ee24a191290aacd3673abed921a
 
-        http_client = HTTPClient(
-            headers = config.http_headers, 
-            timeout = config.http_timeout, 
-            hide_ip = config.hide_ip
-        )
+        http_client = get_http_client(platform, config)
 
         selected_scraper = select_scraper(
             plugins = plugins, 
             scrapers = config.scrapers, 
             platform = platform, 
             fzf_enabled = config.fzf_enabled, 
-            default_scraper = config.default_scraper
+            default_scraper = config.default_scraper, 
+            http_client = http_client
         )
 
         if selected_scraper is None:
@@ -146,7 +150,7 @@ def mov_cli(
         if content_or_bool is False:
             raise typer.Exit(1)
 
-        media, metadata, chosen_episode = content_or_bool
+        media, metadata, chosen_episode, chosen_scraper = content_or_bool
 
         if download:
             dl = Download(config)
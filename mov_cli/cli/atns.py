@@ -0,0 +1,129 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional, Tuple, List, Dict
+
+    from .scraper import SelectedScraperT
+
+    from ..media import Metadata
+    from ..scraper import Scraper
+    from ..config import Config, ConfigATNSData
+    from ..utils.platform import SUPPORTED_PLATFORMS
+
+    SearchedT = Tuple[Optional[Scraper], SelectedScraperT, List[Metadata]]
+
+from devgoldyutils import Colours, LoggerAdapter
+
+from .scraper import get_candidate_scrapers
+from .multi_search import stream_search
+
+from ..logger import mov_cli_logger
+
+__all__ = ()
+
+atns_logger = LoggerAdapter(mov_cli_logger, prefix = Colours.PURPLE.apply("ATNS")) # Auto try next scraper
+
+ATNS_POLICIES = ("first", "priority", "most")
+
+def race_search(
+    query: str,
+    limit: Optional[int],
+    scraper: Scraper,
+    selected_scraper: SelectedScraperT,
+    platform: SUPPORTED_PLATFORMS,
+    config: Config,
+    atns_config: ConfigATNSData
+) -> Optional[Tuple[Scraper, SelectedScraperT, List[Metadata]]]:
+    """
+    Searches with the top candidate scrapers across every plugin at once (see :func:`get_candidate_scrapers`)
+    and returns the scraper picked by the ``policy`` with its results, or None if none of them found anything before the deadline.
+
+    - ``first``: the first scraper to find anything.
+    - ``priority``: the highest ranked scraper that found anything, so the selected scraper wins whenever it has results.
+    - ``most``: the scraper that found the most.
+
+    The searches run through :func:`~mov_cli.cli.multi_search.stream_search`, the ones that lose are cancelled.
+    """
+    policy = atns_config["policy"]
+
+    if policy not in ATNS_POLICIES:
+        atns_logger.warning(f"The policy '{policy}' doesn't exist so 'first' will be used! Available policies: {', '.join(ATNS_POLICIES)}")
+        policy = "first"
+
+    candidates = get_candidate_scrapers(selected_scraper, config.plugins, platform, atns_config["max_scrapers"])
+
+    atns_logger.info(
+        f"Searching for '{Colours.ORANGE.apply(query)}' with " \
+            f"{', '.join(Colours.PURPLE.apply(candidate[0]) for candidate in candidates)} at once..."
+    )
+
+    results: Dict[int, List[Metadata]] = {rank: [] for rank in range(len(candidates))}
+    finished: Dict[int, SearchedT] = {}
+    winner: Optional[int] = None
+
+    search_results = stream_search(
+        query, limit, scraper, candidates, config, atns_config["deadline"], include_finished = True
+    )
+
+    try:
+
+        for metadata, candidate_scraper, candidate in search_results:
+            rank = candidates.index(candidate)
+
+            if metadata is not None:
+                results[rank].append(metadata)
+                continue
+
+            finished[rank] = (candidate_scraper, candidate, results[rank])
+
+            if results[rank] and policy == "first":
+                winner = rank
+
+            elif policy == "priority":
+                winner = _best_ranked(finished, wait = True)
+
+            if winner is not None:
+                break
+
+    finally:
+        # Stops the searches that lost.
+        search_results.close()
+
+    if winner is None:
+        winner = _most_results(finished) if policy == "most" else _best_ranked(finished, wait = False)
+
+    if winner is None:
+        return None
+
+    winning_scraper, winning_candidate, winning_results = finished[winner]
+
+    atns_logger.info(
+        f"Going with the {len(winning_results)} results of '{Colours.PURPLE.apply(winning_candidate[0])}'."
+    )
+
+    return winning_scraper, winning_candidate, winning_results
+
+def _best_ranked(finished: Dict[int, SearchedT], wait: bool) -> Optional[int]:
+    """The highest ranked scraper with results, None if ``wait`` and a higher ranked scraper is still searching."""
+    for rank in range(max(finished, default = -1) + 1):
+
+        if rank not in finished:
+
+            if wait:
+                return None
+
+            continue
+
+        if finished[rank][2]:
+            return rank
+
+    return None
+
+def _most_results(finished: Dict[int, SearchedT]) -> Optional[int]:
+    ranks = [rank for rank, result in finished.items() if result[2]]
+
+    if not ranks:
+        return None
+
+    return max(ranks, key = lambda rank: (len(finished[rank][2]), -rank))
@@ -35,7 +35,7 @@ def set_cli_config(config: Config, **kwargs: Any | Tuple[Any, List[str]]) -> Con
                         config_data[dict_key] = actual_value
                         break
 
-                    config_data = config_data.get(dict_key, {})
+                    config_data = config_data.setdefault(dict_key, {})
 
             else:
                 config.data[key] = actual_value
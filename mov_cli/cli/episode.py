@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from typing import Optional
     from ..media import Metadata
+    from ..config import Config
     from ..scraper import Scraper
 
 from devgoldyutils import Colours
@@ -16,12 +17,19 @@ from ..cache import Cache
 from ..utils import what_platform
 from ..logger import mov_cli_logger
 
-def handle_episode(episode_string: Optional[str], scraper: Scraper, choice: Metadata, fzf_enabled: bool, continue_watching: bool) -> Optional[EpisodeSelector]:
+def handle_episode(
+    episode_string: Optional[str], 
+    scraper: Scraper, 
+    choice: Metadata, 
+    fzf_enabled: bool, 
+    continue_watching: bool, 
+    config: Optional[Config] = None
+) -> Optional[EpisodeSelector]:
     if choice.type == MetadataType.SINGLE:
         return EpisodeSelector()
 
     if continue_watching:
-        cache = Cache(what_platform())
+        cache = Cache(what_platform(), config = config)
 
         cached_episode = cache.get_cache(str(choice.id))
 
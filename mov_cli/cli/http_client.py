@@ -0,0 +1,97 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..config import Config
+    from ..utils.platform import SUPPORTED_PLATFORMS
+
+from pathlib import Path
+from devgoldyutils import LoggerAdapter
+
+from ..cache import Cache
+from ..logger import mov_cli_logger
+from ..utils import get_cache_directory
+from ..http_client import HTTPClient, HTTPCache, RetryPolicy, CircuitBreaker, RateLimiter, Cassette, LatencyTracker, HedgePolicy, CookieStore, AdaptiveTimeout, PoolPartitions, ProcessSingleFlight
+
+__all__ = ()
+
+logger = LoggerAdapter(mov_cli_logger, prefix = "HTTPClient")
+
+def get_http_client(platform: SUPPORTED_PLATFORMS, config: Config) -> HTTPClient:
+    """Builds the http client scrapers get with everything under ``[mov-cli.http]`` applied."""
+    cassette = None
+
+    if config.http_replay is not None:
+
+        if config.http_record is not None:
+            logger.warning("Both recording and replaying http was requested, only replaying will happen.")
+
+        cassette = Cassette(Path(config.http_replay), "replay", config.http_replay_latency)
+
+    elif config.http_record is not None:
+        cassette = Cassette(Path(config.http_record), "record")
+
+    circuit_breaker = None
+    circuit_breaker_config = config.http_circuit_breaker
+
+    if circuit_breaker_config is not None:
+        # Hosts blocked in earlier runs would make replays behave differently every time.
+        persist = circuit_breaker_config.pop("persist", False) and cassette is None
+
+        circuit_breaker = CircuitBreaker(
+            **circuit_breaker_config, 
+            cache = Cache(platform, section = "circuit_breaker", config = config) if persist else None
+        )
+
+    retry_policy = None
+    retry_config = config.http_retry
+
+    if retry_config is not None:
+        retry_policy = RetryPolicy(**retry_config)
+
+    hedge_policy = None
+    hedging_config = config.http_hedging
+
+    if hedging_config is not None:
+        hedge_policy = HedgePolicy(**hedging_config)
+
+    adaptive_timeout = None
+    adaptive_timeout_config = config.http_adaptive_timeout
+
+    if adaptive_timeout_config is not None:
+        adaptive_timeout = AdaptiveTimeout(**adaptive_timeout_config)
+
+    cookie_store = None
+
+    # Cookies from earlier runs would make replays behave differently too.
+    if config.http_persist_cookies and cassette is None:
+        cookie_store = CookieStore(Cache(platform, section = "cookies", config = config))
+
+    # The http cache would answer requests that then never reach the cassette.
+    http_cache = HTTPCache(platform, config) if config.http_cache and cassette is None else None
+
+    process_single_flight = None
+
+    # Other processes pick up shared responses from the http cache.
+    if config.http_process_single_flight and http_cache is not None:
+        process_single_flight = ProcessSingleFlight(get_cache_directory(platform).joinpath("http", "locks"))
+
+    return HTTPClient(
+        headers = config.http_headers, 
+        timeout = config.http_timeout, 
+        hide_ip = config.hide_ip, 
+        cache = http_cache, 
+        http2 = config.http2, 
+        limits = config.http_limits, 
+        retry_policy = retry_policy, 
+        circuit_breaker = circuit_breaker, 
+        rate_limiter = RateLimiter(config.http_rate_limits), 
+        cassette = cassette, 
+        # Replayed latencies aren't real so they shouldn't end up in the history.
+        latency_tracker = LatencyTracker(Cache(platform, section = "http_latency", config = config) if cassette is None else None), 
+        hedge_policy = hedge_policy, 
+        cookie_store = cookie_store, 
+        adaptive_timeout = adaptive_timeout, 
+        pool_partitions = PoolPartitions(**config.http_pools, default_limits = config.http_limits), 
+        process_single_flight = process_single_flight
+    )
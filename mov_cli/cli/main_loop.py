@@ -13,11 +13,13 @@ if TYPE_CHECKING:
     from ..utils.platform import SUPPORTED_PLATFORMS
     from ..media.episode_selector import EpisodeSelector
 
-from devgoldyutils import Colours, LoggerAdapter
+from devgoldyutils import Colours
 
 from .search import search
 from .episode import handle_episode
-from .scraper import use_next_scraper, scrape
+from .atns import atns_logger, race_search
+from .multi_search import multi_search
+from .scraper import use_next_scraper, scrape, hedged_scrape
 
 from ..media import MetadataType
 from ..logger import mov_cli_logger
@@ -25,8 +27,6 @@ from ..errors import InternalPluginError
 
 __all__ = ()
 
-atns_logger = LoggerAdapter(mov_cli_logger, prefix = Colours.PURPLE.apply("ATNS")) # Auto try next scraper
-
 def query_and_grab_content(
     query: str,
     auto_select: Optional[int],
@@ -35,47 +35,94 @@ def query_and_grab_content(
     selected_scraper: SelectedScraperT,
     platform: SUPPORTED_PLATFORMS,
     config: Config,
-) -> Literal[False] | Tuple[Media, Metadata, EpisodeSelector]:
+    search_concurrently: bool = True
+) -> Literal[False] | Tuple[Media, Metadata, EpisodeSelector, Scraper]:
     reason_for_auto_try = f"🫥 Query not found with '{Colours.PURPLE.apply(selected_scraper[0])}'!"
 
-    try:
-        choice = search(
+    # Only the first search is made with several scrapers at once, scrapers tried 
+    # after it are tried one by one or the fastest scraper would keep getting picked.
+    multi_search_config = config.multi_search if search_concurrently else None
+
+    if multi_search_config is not None:
+        sourced_choice = multi_search(
             query = query,
             auto_select = auto_select,
             scraper = scraper,
+            selected_scraper = selected_scraper,
             platform = platform,
-            fzf_enabled = config.fzf_enabled,
-            preview = config.preview,
-            limit = config.limit
+            config = config,
+            multi_search_config = multi_search_config
         )
 
-    except InternalPluginError as e:
+        if sourced_choice is None:
+            mov_cli_logger.error("There was no results or you didn't select anything.")
+            return False
 
-        if config.debug:
-            mov_cli_logger.critical(e.message)
+        # The chosen result is scraped with the scraper that found it.
+        choice, scraper, selected_scraper = sourced_choice
 
-        if not config.auto_try_next_scraper:
-            raise e
+    else:
+        search_results = None
+        atns_config = config.atns if search_concurrently else None
+
+        if atns_config is not None:
+            raced = race_search(
+                query = query,
+                limit = config.limit,
+                scraper = scraper,
+                selected_scraper = selected_scraper,
+                platform = platform,
+                config = config,
+                atns_config = atns_config
+            )
 
-        choice = None
-        reason_for_auto_try = f"❌ Error occurred while searching with '{Colours.PURPLE.apply(selected_scraper[0])}'!"
+            if raced is None:
+                mov_cli_logger.error("None of the scrapers found any results.")
+                return False
 
-    if choice is None:
+            scraper, selected_scraper, search_results = raced
 
-        if config.auto_try_next_scraper:
-            return try_again_with_next_scraper(
-                reason_for_auto_try = reason_for_auto_try,
+        try:
+            choice = search(
                 query = query,
                 auto_select = auto_select,
-                episode = episode,
                 scraper = scraper,
-                selected_scraper = selected_scraper,
                 platform = platform,
-                config = config
+                fzf_enabled = config.fzf_enabled,
+                preview = config.preview,
+                limit = config.limit,
+                config = config,
+                search_results = search_results
             )
 
-        mov_cli_logger.error("There was no results or you didn't select anything.")
-        return False
+        except InternalPluginError as e:
+
+            if config.debug:
+                mov_cli_logger.critical(e.message)
+
+            if not config.auto_try_next_scraper:
+                raise e
+
+            choice = None
+            reason_for_auto_try = f"❌ Error occurred while searching with '{Colours.PURPLE.apply(selected_scraper[0])}'!"
+
+        if choice is None:
+
+            # The other scrapers were already searched with.
+            if config.auto_try_next_scraper and search_results is None:
+                return try_again_with_next_scraper(
+                    reason_for_auto_try = reason_for_auto_try,
+                    query = query,
+                    auto_select = auto_select,
+                    episode = episode,
+                    scraper = scraper,
+                    selected_scraper = selected_scraper,
+                    platform = platform,
+                    config = config
+                )
+
+            mov_cli_logger.error("There was no results or you didn't select anything.")
+            return False
 
     reason_for_auto_try = f"🫥 Episode not selected with '{Colours.PURPLE.apply(selected_scraper[0])}'!"
 
@@ -84,15 +131,29 @@ def query_and_grab_content(
         scraper = scraper, 
         choice = choice, 
         fzf_enabled = config.fzf_enabled,
-        continue_watching = config.auto_continue
+        continue_watching = config.auto_continue,
+        config = config
     )
 
     if chosen_episode is None:
         mov_cli_logger.error("You didn't select an episode!")
         return False
 
+    hedged_scrape_config = config.hedged_scrape
+
     try:
-        media = scrape(choice, chosen_episode, scraper)
+
+        if hedged_scrape_config is None:
+            media = scrape(choice, chosen_episode, scraper)
+        else:
+            media, scraper, choice = hedged_scrape(
+                choice = choice,
+                episode = chosen_episode,
+                scraper = scraper,
+                selected_scraper = selected_scraper,
+                platform = platform,
+                hedged_scrape_config = hedged_scrape_config
+            )
 
     except InternalPluginError as e:
 
@@ -113,7 +174,6 @@ def query_and_grab_content(
                 query = query,
                 auto_select = auto_select,
                 episode = episode,
-                continue_watching = config.auto_continue,
                 scraper = scraper,
                 selected_scraper = selected_scraper,
                 platform = platform,
@@ -128,7 +188,8 @@ def query_and_grab_content(
         )
         return False
 
-    return media, choice, chosen_episode
+    # The scraper may not be the one we were given (e.g. auto try next scraper moved on) and it's needed for the metadata.
+    return media, choice, chosen_episode, scraper
 
 def try_again_with_next_scraper(
     reason_for_auto_try: str,
@@ -139,7 +200,7 @@ def try_again_with_next_scraper(
     selected_scraper: SelectedScraperT,
     platform: SUPPORTED_PLATFORMS,
     config: Config
-) -> Tuple[Media, Metadata, EpisodeSelector] | Literal[False]:
+) -> Tuple[Media, Metadata, EpisodeSelector, Scraper] | Literal[False]:
     atns_logger.info(
        f"{reason_for_auto_try} Trying the next scraper..."
     )
@@ -162,5 +223,6 @@ def try_again_with_next_scraper(
         scraper = next_chosen_scraper,
         selected_scraper = next_selected_scraper,
         platform = platform,
-        config = config
+        config = config,
+        search_concurrently = False
     )
\ No newline at end of file
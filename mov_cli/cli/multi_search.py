@@ -0,0 +1,163 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional, Tuple, List, Dict, Generator, Iterable, Any
+
+    from .scraper import SelectedScraperT
+
+    from ..media import Metadata
+    from ..scraper import Scraper
+    from ..config import Config, ConfigMultiSearchData
+    from ..utils.platform import SUPPORTED_PLATFORMS
+
+    SourcedMetadataT = Tuple[Metadata, Scraper, SelectedScraperT]
+
+import time
+import queue
+import threading
+from devgoldyutils import Colours, LoggerAdapter
+
+from .ui import prompt
+from .auto_select import auto_select_choice
+from .search import cache_metadata_for_preview
+from .scraper import use_scraper, get_candidate_scrapers
+
+from ..cache import Cache
+from ..logger import mov_cli_logger
+
+__all__ = ()
+
+logger = LoggerAdapter(mov_cli_logger, prefix = Colours.PURPLE.apply("MultiSearch"))
+
+def multi_search(
+    query: str,
+    auto_select: Optional[int],
+    scraper: Scraper,
+    selected_scraper: SelectedScraperT,
+    platform: SUPPORTED_PLATFORMS,
+    config: Config,
+    multi_search_config: ConfigMultiSearchData
+) -> Optional[SourcedMetadataT]:
+    """
+    Searches with the top candidate scrapers (see :func:`get_candidate_scrapers`) at once and lists their results together,
+    tagged with the scraper they came from, as they come in. Returns the chosen metadata with the scraper that found it.
+    """
+    candidates = get_candidate_scrapers(selected_scraper, config.plugins, platform, multi_search_config["max_scrapers"])
+
+    logger.info(
+        f"Searching for '{Colours.ORANGE.apply(query)}' with " \
+            f"{', '.join(Colours.PURPLE.apply(candidate[0]) for candidate in candidates)} at once..."
+    )
+
+    # Keyed by id as metadata isn't hashable, the metadata is kept in here so its id can't be reused.
+    sources: Dict[int, SourcedMetadataT] = {}
+
+    def tag_sources(search_results: Iterable[SourcedMetadataT]) -> Generator[Metadata, Any, None]:
+
+        for sourced_metadata in search_results:
+            sources[id(sourced_metadata[0])] = sourced_metadata
+            yield sourced_metadata[0]
+
+    def display(metadata: Metadata) -> str:
+        return f"{metadata.display_name} {Colours.GREY.apply(f'[{sources[id(metadata)][2][0]}]')}"
+
+    cache = Cache(platform, section = "metadata_preview", config = config)
+
+    search_results = stream_search(query, config.limit, scraper, candidates, config, multi_search_config["deadline"])
+
+    try:
+
+        if auto_select is not None:
+            choice = auto_select_choice(tag_sources(search_results), auto_select)
+        else:
+            cached_search_results = cache_metadata_for_preview(cache, tag_sources(search_results), display)
+
+            choice = prompt(
+                "Choose Result",
+                choices = cached_search_results,
+                display = display,
+                fzf_enabled = config.fzf_enabled,
+                preview = "mov-cli-dev preview metadata -- {}" if config.preview else None
+            )
+
+            cached_search_results.close()
+
+    finally:
+        # Stops the scrapers still searching.
+        search_results.close()
+
+    cache.clear_all_cache()
+
+    if choice is None:
+        return None
+
+    return sources[id(choice)]
+
+def stream_search(
+    query: str,
+    limit: Optional[int],
+    scraper: Scraper,
+    candidates: List[SelectedScraperT],
+    config: Config,
+    deadline: float,
+    include_finished: bool = False
+) -> Generator[SourcedMetadataT, Any, None]:
+    """
+    Searches with every candidate scraper in a thread of its own (the first being ``scraper``) and yields their results
+    in the order they arrive until they've all finished or ``deadline`` seconds have passed. Closing the generator stops the searches.
+
+    With ``include_finished`` a ``(None, scraper, candidate)`` is also yielded when a candidate is done searching, 
+    the scraper being None if it couldn't be used.
+    """
+    cancelled = threading.Event()
+    found: queue.Queue[SourcedMetadataT] = queue.Queue()
+
+    def search_with(rank: int, candidate: SelectedScraperT) -> None:
+        candidate_scraper = None
+
+        try:
+            candidate_scraper = scraper if rank == 0 else use_scraper(candidate, config, scraper.http_client)
+
+            for metadata in candidate_scraper.search(query, limit):
+
+                if cancelled.is_set():
+                    break
+
+                found.put((metadata, candidate_scraper, candidate))
+
+        except Exception as e:
+            logger.debug(f"Searching with '{candidate[0]}' failed. Error: {e}")
+
+        finally:
+            found.put((None, candidate_scraper, candidate))
+
+    # Daemon threads so a search that's hung up on a slow host can't hold up mov-cli exiting.
+    for rank, candidate in enumerate(candidates):
+        threading.Thread(target = search_with, args = (rank, candidate), name = "mov-cli-multi-search", daemon = True).start()
+
+    deadline_time = time.monotonic() + deadline
+    searching = len(candidates)
+
+    try:
+
+        while searching > 0:
+
+            try:
+                sourced_metadata = found.get(timeout = max(deadline_time - time.monotonic(), 0))
+            except queue.Empty:
+                logger.debug(f"Stopped waiting on {searching} scraper(s) after {deadline} seconds.")
+                break
+
+            if sourced_metadata[0] is None:
+                searching -= 1
+
+                if include_finished:
+                    yield sourced_metadata
+
+                continue
+
+            yield sourced_metadata
+
+    finally:
+        cancelled.set()
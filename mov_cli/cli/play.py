@@ -2,16 +2,20 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Type, cast
 
 if TYPE_CHECKING:
-    from typing import Optional, Literal
+    from typing import Optional, Literal, Tuple
 
     from ..config import Config
     from ..media import Media, Metadata
     from ..scraper import Scraper, ScrapeEpisodesT
     from ..players import Player
+    from ..http_client import HTTPClient
 
     from ..utils.platform import SUPPORTED_PLATFORMS
     from ..media.episode_selector import EpisodeSelector
 
+import copy
+import threading
+from concurrent.futures import Future
 from devgoldyutils import Colours
 
 from .scraper import scrape
@@ -24,13 +28,16 @@ from ..cache import Cache
 from ..utils import what_platform, hide_ip
 from ..players import PLAYER_TABLE, CustomPlayer
 
+EXPIRED_MEDIA_STATUS_CODES = (401, 403, 404, 410)
+"""Status codes a prefetched media url responding with means it has expired and has to be scraped again."""
+
 def play(media: Media, metadata: Metadata, scraper: Scraper, episode: EpisodeSelector, config: Config) -> Optional[Literal["search"]]:
     platform = what_platform()
-    cache = Cache(platform)
+    cache = Cache(platform, config = config)
 
     cache.set_cache(str(metadata.id), episode.__dict__)
 
-    chosen_player = __get_player(config, platform)
+    chosen_player = __get_player(config, platform, scraper.http_client)
 
     quality_string = ""
     episode_details_string = ""
@@ -72,8 +79,35 @@ def play(media: Media, metadata: Metadata, scraper: Scraper, episode: EpisodeSel
         return None
 
     if config.watch_options:
+        next_episode = None
+
+        if config.prefetch_next_episode and metadata.type == MetadataType.MULTI:
+            next_episode = __prefetch_next_episode(metadata, scraper, episode)
+
         option = watch_options(popen, chosen_player, platform, media, config.fzf_enabled)
 
+        if option == "next" and next_episode is not None:
+            popen.kill()
+
+            try:
+                prefetched = next_episode.result()
+
+            except Exception as e:
+                mov_cli_logger.debug(f"Failed to prefetch the next episode so it'll be scraped now. Error: {e}")
+
+            else:
+
+                if prefetched is None:
+                    mov_cli_logger.info("No more episodes :(")
+                    return None
+
+                next_episode_selector, next_media = prefetched
+
+                if next_media is None or not __media_still_valid(next_media, scraper.http_client):
+                    next_media = scrape(metadata, next_episode_selector, scraper)
+
+                return play(next_media, metadata, scraper, next_episode_selector, config)
+
         if option == "next" or option == "previous":
             popen.kill()
 
@@ -103,7 +137,7 @@ def play(media: Media, metadata: Metadata, scraper: Scraper, episode: EpisodeSel
         elif option == "select":
             popen.kill()
 
-            episode = handle_episode(None, scraper, metadata, config.fzf_enabled)
+            episode = handle_episode(None, scraper, metadata, config.fzf_enabled, False, config)
 
             if episode is None:
                 return None
@@ -116,7 +150,7 @@ def play(media: Media, metadata: Metadata, scraper: Scraper, episode: EpisodeSel
 
     return None
 
-def __get_player(config: Config, platform: SUPPORTED_PLATFORMS) -> Player:
+def __get_player(config: Config, platform: SUPPORTED_PLATFORMS, http_client: HTTPClient) -> Player:
     player = PLAYER_TABLE.get(config.player, CustomPlayer)
 
     if player == CustomPlayer:
@@ -131,9 +165,62 @@ def __get_player(config: Config, platform: SUPPORTED_PLATFORMS) -> Player:
         platform = platform, 
         args = config.player_args, 
         debug = config.debug_player, 
-        args_override = config.player_args_override
+        args_override = config.player_args_override, 
+        http_client = http_client
     )
 
+def __prefetch_next_episode(metadata: Metadata, scraper: Scraper, episode: EpisodeSelector) -> Future[Optional[Tuple[EpisodeSelector, Optional[Media]]]]:
+    """
+    Scrapes the episode after ``episode`` in a background thread, rolling over to the next season like "next" does. 
+    The future's result is None if there's no next episode.
+    """
+    future: Future[Optional[Tuple[EpisodeSelector, Optional[Media]]]] = Future()
+
+    def prefetch() -> None:
+
+        try:
+            media_episodes = scraper.scrape_episodes(metadata)
+
+            next_episode = copy.copy(episode)
+            next_episode.episode += 1
+
+            season_episode_count = media_episodes.get(next_episode.season)
+
+            if season_episode_count is None or __handle_next_season(next_episode, season_episode_count, media_episodes) is False:
+                future.set_result(None)
+                return None
+
+            mov_cli_logger.debug(f"Prefetching episode {next_episode.episode} of season {next_episode.season}...")
+
+            future.set_result((next_episode, scraper.scrape(metadata, next_episode)))
+
+        except Exception as e:
+            future.set_exception(e)
+
+    # A daemon thread so quitting isn't held up by the prefetch.
+    threading.Thread(target = prefetch, name = "mov-cli-prefetch", daemon = True).start()
+
+    return future
+
+def __media_still_valid(media: Media, http_client: HTTPClient) -> bool:
+    """Checks a prefetched media's url hasn't expired (e.g. a signed url) while the previous episode played."""
+    if not media.url.startswith(("http://", "https://")):
+        return True
+
+    headers = {} if media.referrer is None else {"Referer": media.referrer}
+
+    try:
+        response = http_client.request("HEAD", media.url, headers = headers, redirect = True, cache = False, retry = False, timeout = 5)
+    except Exception as e:
+        mov_cli_logger.debug(f"Couldn't check the prefetched url so it'll be scraped again. Error: {e}")
+        return False
+
+    if response.status_code in EXPIRED_MEDIA_STATUS_CODES:
+        mov_cli_logger.debug(f"The prefetched url responded with {response.status_code} so it'll be scraped again.")
+        return False
+
+    return True
+
 def __handle_next_season(episode: EpisodeSelector, season_episode_count: int, media_episodes: ScrapeEpisodesT) -> bool:
 
     if episode.episode > season_episode_count:
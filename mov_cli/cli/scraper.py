@@ -2,20 +2,23 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Type, Optional, Tuple, List, Dict
+    from typing import Type, Optional, Tuple, List, Dict, Iterable
 
     from .plugins import PluginsDataT
 
     from ..plugins import Plugin
     from ..media import Metadata, Media
     from ..http_client import HTTPClient
-    from ..config import Config, ScrapersConfigT
+    from ..config import Config, ScrapersConfigT, ConfigHedgedScrapeData
     from ..utils.platform import SUPPORTED_PLATFORMS
     from ..media.episode_selector import EpisodeSelector
     from ..scraper import Scraper, ScraperOptionsT
 
     SelectedScraperT = Tuple[str, Type[Scraper], ScraperOptionsT, Plugin]
 
+import queue
+import itertools
+import threading
 from thefuzz import fuzz
 from devgoldyutils import Colours
 
@@ -25,6 +28,12 @@ from .plugins import get_plugins_data
 from ..utils import what_platform
 from ..logger import mov_cli_logger
 from ..errors import InternalPluginError
+from ..scraper import AsyncScraper, AsyncScraperAdapter
+
+HEDGED_SCRAPE_SEARCH_LIMIT = 10
+"""How many search results of another scraper are looked through for the title being scraped."""
+TITLE_MATCH_RATIO = 90
+"""How alike (out of 100) titles from different scrapers have to be to be taken as the same title."""
 
 def scrape(choice: Metadata, episode: EpisodeSelector, scraper: Scraper) -> Optional[Media]:
     mov_cli_logger.info(f"Scraping '{Colours.CLAY.apply(choice.title)}'...")
@@ -36,20 +45,130 @@ def scrape(choice: Metadata, episode: EpisodeSelector, scraper: Scraper) -> Opti
 
     return media
 
+def hedged_scrape(
+    choice: Metadata,
+    episode: EpisodeSelector,
+    scraper: Scraper,
+    selected_scraper: SelectedScraperT,
+    platform: SUPPORTED_PLATFORMS,
+    hedged_scrape_config: ConfigHedgedScrapeData
+) -> Tuple[Optional[Media], Scraper, Metadata]:
+    """
+    Scrapes like :func:`scrape` but if the scraper hasn't returned after ``delay`` seconds the title is also looked for with 
+    the next candidate scrapers (see :func:`get_candidate_scrapers`) one after another and scraped with the first one that has it. 
+    Returns whichever media arrives first along with the scraper and metadata it came from.
+    """
+    mov_cli_logger.info(f"Scraping '{Colours.CLAY.apply(choice.title)}'...")
+
+    scraped: queue.Queue[Optional[Tuple[Scraper, Metadata, Optional[Media] | Exception]]] = queue.Queue()
+
+    def scrape_with_scraper() -> None:
+
+        try:
+            scraped.put((scraper, choice, scraper.scrape(choice, episode)))
+        except Exception as e:
+            scraped.put((scraper, choice, e))
+
+    def scrape_with_other_scrapers() -> None:
+        candidates = get_candidate_scrapers(
+            selected_scraper, scraper.config.plugins, platform, hedged_scrape_config["max_scrapers"] + 1
+        )
+
+        for candidate in candidates[1:]:
+
+            try:
+                other_scraper = use_scraper(candidate, scraper.config, scraper.http_client)
+
+                search_results = other_scraper.search(choice.title, HEDGED_SCRAPE_SEARCH_LIMIT)
+                metadata = _find_same_title(choice, itertools.islice(search_results, HEDGED_SCRAPE_SEARCH_LIMIT))
+
+                if metadata is None:
+                    mov_cli_logger.debug(f"'{candidate[0]}' doesn't have '{choice.title}'.")
+                    continue
+
+                media = other_scraper.scrape(metadata, episode)
+
+            except Exception as e:
+                mov_cli_logger.debug(f"Hedged scrape with '{candidate[0]}' failed. Error: {e}")
+                continue
+
+            if media is not None:
+                scraped.put((other_scraper, metadata, media))
+                return None
+
+        scraped.put(None)
+
+    # Daemon threads so the scrape that loses can't hold up mov-cli exiting.
+    threading.Thread(target = scrape_with_scraper, name = "mov-cli-scrape", daemon = True).start()
+
+    scraping = 1
+    hedged = False
+    scraper_outcome: Optional[Exception] = None
+
+    while scraping > 0:
+
+        try:
+            result = scraped.get(timeout = None if hedged else hedged_scrape_config["delay"])
+
+        except queue.Empty:
+            mov_cli_logger.info(
+                f"'{Colours.PURPLE.apply(selected_scraper[0])}' is taking a while, looking for '{Colours.CLAY.apply(choice.title)}' with other scrapers too..."
+            )
+
+            threading.Thread(target = scrape_with_other_scrapers, name = "mov-cli-hedged-scrape", daemon = True).start()
+
+            scraping += 1
+            hedged = True
+            continue
+
+        scraping -= 1
+
+        if result is None:
+            continue
+
+        result_scraper, metadata, media = result
+
+        if media is not None and not isinstance(media, Exception):
+
+            if result_scraper is not scraper:
+                mov_cli_logger.info(f"Got '{Colours.CLAY.apply(metadata.title)}' from '{Colours.BLUE.apply(result_scraper.__class__.__name__)}' first.")
+
+            return media, result_scraper, metadata
+
+        if result_scraper is scraper:
+            scraper_outcome = media
+
+    if scraper_outcome is not None:
+        raise InternalPluginError(scraper_outcome)
+
+    return None, scraper, choice
+
 def use_scraper(
     selected_scraper: SelectedScraperT,
     config: Config,
     http_client: HTTPClient
 ) -> Scraper:
-    scraper_name, scraper_class, scraper_options, _ = selected_scraper
+    scraper_name, scraper_class, scraper_options, plugin = selected_scraper
 
     mov_cli_logger.info(f"Using '{Colours.BLUE.apply(scraper_name)}' scraper...")
 
+    if http_client.rate_limiter is not None:
+        http_client.rate_limiter.add_limits(plugin.hook_data.get("rate_limits", {}), override = False)
+
+    plugin_namespace = scraper_name.split(".")[0].lower()
+
+    http_client = http_client.for_namespace(plugin_namespace)
+    http_client.prewarm(plugin.hook_data.get("hosts", []))
+
     try:
         chosen_scraper = scraper_class(config, http_client, scraper_options)
     except Exception as e:
         raise InternalPluginError(e)
 
+    # The rest of mov-cli calls scrapers from blocking code.
+    if isinstance(chosen_scraper, AsyncScraper):
+        chosen_scraper = AsyncScraperAdapter(chosen_scraper)
+
     return chosen_scraper
 
 def use_next_scraper(
@@ -120,12 +239,59 @@ def use_next_scraper(
 
     return next_plugin_scraper, next_selected_Scraper
 
+def get_candidate_scrapers(
+    selected_scraper: SelectedScraperT,
+    plugins: Dict[str, str],
+    platform: SUPPORTED_PLATFORMS,
+    amount: int
+) -> List[SelectedScraperT]:
+    """
+    Returns the top ``amount`` scrapers to try a query with, starting with the selected scraper. The rest are taken
+    from every plugin in turn, default scrapers first, so one plugin with lots of scrapers doesn't crowd the others out.
+    """
+    selected_plugin = selected_scraper[3]
+    plugins_scrapers: List[List[SelectedScraperT]] = []
+
+    for plugin_namespace, _, plugin in get_plugins_data(plugins):
+        is_selected_plugin = plugin.module is selected_plugin.module
+        default_scraper = plugin.default_scraper(platform)
+
+        plugin_scrapers = sorted(plugin.scrapers, key = lambda x: x[1] != default_scraper)
+
+        # Default scrapers that aren't also under a name of their own.
+        if default_scraper is not None and default_scraper not in [scraper_class for _, scraper_class in plugin_scrapers]:
+            default_scraper_name = f"{platform}.DEFAULT" if f"{platform}.DEFAULT" in plugin.hook_data["scrapers"] else "DEFAULT"
+            plugin_scrapers.insert(0, (default_scraper_name, default_scraper))
+
+        candidates = [
+            (
+                # Default namespaces keep their case like in 'get_scraper' as 'use_next_scraper' looks for them.
+                f"{plugin_namespace}.{scraper_name}" if scraper_name.endswith("DEFAULT") else f"{plugin_namespace}.{scraper_name}".lower(), 
+                scraper_class, 
+                selected_scraper[2] if is_selected_plugin else {}, 
+                plugin
+            ) for scraper_name, scraper_class in plugin_scrapers if not (is_selected_plugin and scraper_class is selected_scraper[1])
+        ]
+
+        if is_selected_plugin:
+            plugins_scrapers.insert(0, candidates)
+        else:
+            plugins_scrapers.append(candidates)
+
+    candidate_scrapers = [selected_scraper]
+
+    for plugin_candidates in itertools.zip_longest(*plugins_scrapers):
+        candidate_scrapers.extend(candidate for candidate in plugin_candidates if candidate is not None)
+
+    return candidate_scrapers[:amount]
+
 def select_scraper(
     plugins: Dict[str, str],
     scrapers: ScrapersConfigT,
     platform: SUPPORTED_PLATFORMS,
     fzf_enabled: bool,
-    default_scraper: Optional[str] = None
+    default_scraper: Optional[str] = None,
+    http_client: Optional[HTTPClient] = None
 ) -> Optional[SelectedScraperT]:
     plugins_data = get_plugins_data(plugins)
 
@@ -162,6 +328,10 @@ def select_scraper(
     if chosen_plugin is not None:
         plugin_namespace, _, plugin = chosen_plugin
 
+        # Connections get opened (in the plugin's pool) while the user picks a scraper.
+        if http_client is not None:
+            http_client.for_namespace(plugin_namespace.lower()).prewarm(plugin.hook_data.get("hosts", []))
+
         plugin_default_scraper = plugin.default_scraper(platform)
 
         chosen_scraper = prompt(
@@ -293,4 +463,21 @@ def get_scraper(
             if scraper_id.lower() == id:
                 return id, scraper, scraper_options, plugin
 
-    return None, available_scrapers, scraper_options, plugin
\ No newline at end of file
+    return None, available_scrapers, scraper_options, plugin
+
+def _find_same_title(choice: Metadata, search_results: Iterable[Metadata]) -> Optional[Metadata]:
+
+    for metadata in search_results:
+
+        if metadata.type != choice.type:
+            continue
+
+        if choice.release_date is not None and metadata.release_date is not None and choice.release_date.year != metadata.release_date.year:
+            continue
+
+        titles = [metadata.title, *(metadata.alternate_titles or [])]
+
+        if any(fuzz.ratio(choice.title.lower(), title.lower()) >= TITLE_MATCH_RATIO for title in titles):
+            return metadata
+
+    return None
\ No newline at end of file
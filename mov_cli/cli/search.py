@@ -2,9 +2,10 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Optional, Callable
+    from typing import Optional, Iterable, Generator, Callable, Any
 
     from ..media import Metadata
+    from ..config import Config
     from ..scraper import Scraper
     from ..utils.platform import SUPPORTED_PLATFORMS
 
@@ -18,20 +19,29 @@ from ..cache import Cache
 from ..logger import mov_cli_logger
 from ..errors import InternalPluginError
 
-def cache_metadata_for_preview(cache: Cache) -> Callable[[Metadata], Metadata]:
+def cache_metadata_for_preview(
+    cache: Cache,
+    search_results: Iterable[Metadata],
+    display: Callable[[Metadata], str] = lambda x: x.display_name
+) -> Generator[Metadata, Any, None]:
     ansi_remover = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])') # Remove colours
 
-    def before_display_callable(metadata: Metadata) -> Metadata:
-        preview_data = {
-            "image_url": metadata.image_url,
-            "details": metadata.preview_details
-        }
+    # Preview data is buffered and committed on every power of two results, so the first results 
+    # are previewable straight away while a 200 result search only costs a handful of writes.
+    with cache.batch():
 
-        cache.set_cache(ansi_remover.sub("", metadata.display_name), preview_data)
+        for index, metadata in enumerate(search_results, start = 1):
+            preview_data = {
+                "image_url": metadata.image_url,
+                "details": metadata.preview_details
+            }
 
-        return metadata
+            cache.set_cache(ansi_remover.sub("", display(metadata)), preview_data)
 
-    return before_display_callable
+            if index & (index - 1) == 0:
+                cache.flush()
+
+            yield metadata
 
 def search(
     query: str,
@@ -40,29 +50,37 @@ def search(
     platform: SUPPORTED_PLATFORMS,
     fzf_enabled: bool,
     preview: bool,
-    limit: Optional[int]
+    limit: Optional[int],
+    config: Optional[Config] = None,
+    search_results: Optional[Iterable[Metadata]] = None
 ) -> Optional[Metadata]:
     choice = None
 
-    cache = Cache(platform, section = "metadata_preview")
+    cache = Cache(platform, section = "metadata_preview", config = config)
 
-    mov_cli_logger.info(f"Searching for '{Colours.ORANGE.apply(query)}'...")
+    if search_results is None:
+        mov_cli_logger.info(f"Searching for '{Colours.ORANGE.apply(query)}'...")
 
     try:
-        search_results = scraper.search(query, limit)
+
+        if search_results is None:
+            search_results = scraper.search(query, limit)
 
         if auto_select is not None:
             choice = auto_select_choice((choice for choice in search_results), auto_select)
         else:
+            cached_search_results = cache_metadata_for_preview(cache, search_results)
+
             choice = prompt(
                 "Choose Result", 
-                choices = (choice for choice in search_results), 
+                choices = cached_search_results, 
                 display = lambda x: x.display_name, 
                 fzf_enabled = fzf_enabled,
-                before_display = cache_metadata_for_preview(cache),
                 preview = "mov-cli-dev preview metadata -- {}" if preview else None
             )
 
+            cached_search_results.close()
+
     except Exception as e:
         raise InternalPluginError(e)
 
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
 
     T = TypeVar("T")
 
+    from ..config import Config
     from ..utils.platform import SUPPORTED_PLATFORMS
 
 import re
@@ -175,7 +176,8 @@ def welcome_msg(
     platform: SUPPORTED_PLATFORMS, 
     check_for_updates: bool = False, 
     display_tip: bool = False, 
-    display_version: bool = False
+    display_version: bool = False, 
+    config: Optional[Config] = None
 ) -> str:
     """Returns cli welcome message."""
     now = datetime.now()
@@ -209,7 +211,7 @@ def welcome_msg(
         text += f"\n\n{Colours.CLAY}-> {Colours.RESET}Version: {Colours.BLUE}{mov_cli.__version__}{Colours.RESET}"
 
     if check_for_updates:
-        cache = Cache(platform, section = "update_checker")
+        cache = Cache(platform, section = "update_checker", config = config)
 
         if update_available(cache):
             update = update_command(mov_cli_path)
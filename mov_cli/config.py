@@ -16,6 +16,7 @@ if TYPE_CHECKING:
 
 import os
 import toml
+import httpx
 import shutil
 from pathlib import Path
 from decouple import AutoConfig
@@ -38,12 +39,95 @@ class PlayerData(TypedDict):
 class ConfigUIData(TypedDict):
     fzf: bool
     watch_options: bool
+    prefetch_next_episode: bool
     limit: int
     display_quality: bool
 
+@final
+class ConfigHTTPTimeoutData(TypedDict):
+    connect: NotRequired[float]
+    read: NotRequired[float]
+    write: NotRequired[float]
+    pool: NotRequired[float]
+
+@final
+class ConfigHTTPRetryData(TypedDict):
+    enabled: NotRequired[bool]
+    attempts: NotRequired[int]
+    backoff_factor: NotRequired[float]
+    max_backoff: NotRequired[float]
+    statuses: NotRequired[List[int]]
+
+@final
+class ConfigHTTPCircuitBreakerData(TypedDict):
+    enabled: NotRequired[bool]
+    failure_threshold: NotRequired[int]
+    window: NotRequired[float]
+    cooldown: NotRequired[float]
+    persist: NotRequired[bool]
+
+@final
+class ConfigHTTPRateLimitData(TypedDict):
+    rate: float
+    burst: NotRequired[int]
+
+@final
+class ConfigHTTPHedgingData(TypedDict):
+    enabled: NotRequired[bool]
+    percentile: NotRequired[float]
+    min_delay: NotRequired[float]
+    max_hedges: NotRequired[int]
+
+@final
+class ConfigHTTPAdaptiveTimeoutData(TypedDict):
+    enabled: NotRequired[bool]
+    percentile: NotRequired[float]
+    multiplier: NotRequired[float]
+    min_timeout: NotRequired[float]
+    max_timeout: NotRequired[float]
+
+@final
+class ConfigHTTPPoolLimitsData(TypedDict):
+    max_connections: NotRequired[int]
+    max_keepalive_connections: NotRequired[int]
+    keepalive_expiry: NotRequired[float]
+
+@final
+class ConfigHTTPPoolsData(TypedDict):
+    per_plugin: NotRequired[bool]
+    hosts: NotRequired[Dict[str, ConfigHTTPPoolLimitsData]]
+    plugins: NotRequired[Dict[str, ConfigHTTPPoolLimitsData]]
+
 @final
 class ConfigHTTPData(TypedDict):
     headers: Dict[str, str]
+    timeout: int | ConfigHTTPTimeoutData
+    adaptive_timeout: ConfigHTTPAdaptiveTimeoutData
+    cache: bool
+    http2: bool
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry: float
+    pools: ConfigHTTPPoolsData
+    retry: ConfigHTTPRetryData
+    circuit_breaker: ConfigHTTPCircuitBreakerData
+    rate_limits: Dict[str, float | ConfigHTTPRateLimitData]
+    hedging: ConfigHTTPHedgingData
+    persist_cookies: bool
+    process_single_flight: bool
+    record: str
+    replay: str
+    replay_latency: bool
+
+@final
+class ConfigCacheQuotaData(TypedDict):
+    max_entries: NotRequired[int]
+    max_bytes: NotRequired[int]
+
+@final
+class ConfigCacheData(TypedDict):
+    backend: Literal["sqlite", "json", "memory"]
+    quotas: Dict[str, ConfigCacheQuotaData]
 
 @final
 class ConfigDownloadsData(TypedDict):
@@ -58,6 +142,25 @@ class ConfigQualityData(TypedDict):
 class ConfigSubtitleData(TypedDict):
     language: str
 
+@final
+class ConfigATNSData(TypedDict):
+    concurrent: bool
+    max_scrapers: int
+    deadline: float
+    policy: Literal["first", "priority", "most"]
+
+@final
+class ConfigMultiSearchData(TypedDict):
+    enabled: bool
+    max_scrapers: int
+    deadline: float
+
+@final
+class ConfigHedgedScrapeData(TypedDict):
+    enabled: bool
+    delay: float
+    max_scrapers: int
+
 ConfigDebugData = TypedDict("ConfigDebugData", {"global": bool, "player": bool})
 
 @final
@@ -71,12 +174,16 @@ class ConfigData(TypedDict):
     hide_ip: bool
     ui: ConfigUIData
     http: ConfigHTTPData
+    cache: ConfigCacheData
     downloads: ConfigDownloadsData
     scrapers: ScrapersConfigT | Dict[str, str]
     plugins: Dict[str, str]
     quality: ConfigQualityData | str
     subtitle: ConfigSubtitleData
     auto_try_next_scraper: bool
+    atns: ConfigATNSData
+    multi_search: ConfigMultiSearchData
+    hedged_scrape: ConfigHedgedScrapeData
     auto_continue: bool
 
 HttpHeadersData = TypedDict(
@@ -189,6 +296,58 @@ class Config():
     def auto_try_next_scraper(self) -> bool:
         return self.data.get("auto_try_next_scraper", True)
 
+    @property
+    def atns(self) -> Optional[ConfigATNSData]:
+        """
+        Returns how many scrapers auto try next scraper should search with at once, how long it waits for them and 
+        how it picks between their results. None if scrapers should be tried one by one (the default).
+        """
+        atns = self.data.get("atns", {})
+
+        if not self.auto_try_next_scraper or not atns.get("concurrent", False):
+            return None
+
+        return {
+            "concurrent": True,
+            "max_scrapers": atns.get("max_scrapers", 4),
+            "deadline": atns.get("deadline", 15),
+            "policy": atns.get("policy", "first")
+        }
+
+    @property
+    def multi_search(self) -> Optional[ConfigMultiSearchData]:
+        """
+        Returns how many scrapers should be searched with at once for a single list of results 
+        and how long to wait for them. None if only the selected scraper should be searched with (the default).
+        """
+        multi_search = self.data.get("multi_search", {})
+
+        if not multi_search.get("enabled", False):
+            return None
+
+        return {
+            "enabled": True,
+            "max_scrapers": multi_search.get("max_scrapers", 4),
+            "deadline": multi_search.get("deadline", 15)
+        }
+
+    @property
+    def hedged_scrape(self) -> Optional[ConfigHedgedScrapeData]:
+        """
+        Returns how long a scrape can take before the title is looked for with other scrapers and 
+        how many of them to try, None if scrapes shouldn't be hedged (the default).
+        """
+        hedged_scrape = self.data.get("hedged_scrape", {})
+
+        if not hedged_scrape.get("enabled", False):
+            return None
+
+        return {
+            "enabled": True,
+            "delay": hedged_scrape.get("delay", 8),
+            "max_scrapers": hedged_scrape.get("max_scrapers", 3)
+        }
+
     @property
     def auto_continue(self) -> bool:
         return self.data.get("auto_continue", False)
@@ -251,10 +410,47 @@ class Config():
         return debug.get("deprecation_warnings", True) 
 
     @property
-    def http_timeout(self) -> int:
-        """Returns the http timeout delay that should be set."""
+    def http_timeout(self) -> int | ConfigHTTPTimeoutData:
+        """
+        Returns the http timeout delay that should be set. Either one timeout for everything 
+        or separate connect, read, write and pool timeouts (the ones left out default to 15).
+        """
         return self.data.get("http", {}).get("timeout", 15)
 
+    @property
+    def http2(self) -> bool:
+        """Returns whether HTTP/2 should be negotiated with hosts that support it. Requires the 'h2' package."""
+        http2 = self.data.get("http", {}).get("http2", False)
+
+        if http2 and find_spec("h2") is None:
+            logger.warning(
+                "HTTP/2 is enabled in the config but the 'h2' package isn't installed so HTTP/1.1 will be used! " \
+                    "Install it with 'pip install mov-cli[http2]'."
+            )
+            return False
+
+        return http2
+
+    @property
+    def http_limits(self) -> httpx.Limits:
+        """Returns the connection pool limits and how long idle keep-alive connections are kept for."""
+        return self.__to_limits(self.data.get("http", {}), {})
+
+    @property
+    def http_pools(self) -> Dict[str, bool | Dict[str, httpx.Limits]]:
+        """
+        Returns whether every plugin gets a connection pool of its own and the pool limits of the hosts 
+        and plugins given one, limits that aren't set are taken from 'max_connections', etc under [mov-cli.http].
+        """
+        http_data = self.data.get("http", {})
+        pools_data = http_data.get("pools", {})
+
+        return {
+            "per_plugin": pools_data.get("per_plugin", True), 
+            "hosts": {host: self.__to_limits(limits, http_data) for host, limits in pools_data.get("hosts", {}).items()}, 
+            "plugins": {plugin: self.__to_limits(limits, http_data) for plugin, limits in pools_data.get("plugins", {}).items()}
+        }
+
     @property
     def http_headers(self) -> HttpHeadersData:
         """Returns http headers."""
@@ -266,6 +462,99 @@ class Config():
 
         return self.data.get("http", {}).get("headers", default_headers)
 
+    @property
+    def http_adaptive_timeout(self) -> Optional[ConfigHTTPAdaptiveTimeoutData]:
+        """Returns how timeouts are learned from each host's latency history, None if every host should use 'timeout' (the default)."""
+        adaptive_timeout = dict(self.data.get("http", {}).get("adaptive_timeout", {}))
+
+        if adaptive_timeout.pop("enabled", False) is False:
+            return None
+
+        return adaptive_timeout
+
+    @property
+    def http_cache(self) -> bool:
+        """Returns whether responses should be cached following their Cache-Control, ETag and Last-Modified headers. Defaults to False."""
+        return self.data.get("http", {}).get("cache", False)
+
+    @property
+    def http_retry(self) -> Optional[ConfigHTTPRetryData]:
+        """Returns how failed idempotent requests should be retried, None if they shouldn't be (the default)."""
+        retry = dict(self.data.get("http", {}).get("retry", {}))
+
+        if retry.pop("enabled", False) is False:
+            return None
+
+        return retry
+
+    @property
+    def http_circuit_breaker(self) -> Optional[ConfigHTTPCircuitBreakerData]:
+        """Returns when hosts that keep failing should be blocked and for how long, None if that's disabled (the default)."""
+        circuit_breaker = dict(self.data.get("http", {}).get("circuit_breaker", {}))
+
+        if circuit_breaker.pop("enabled", False) is False:
+            return None
+
+        return circuit_breaker
+
+    @property
+    def http_rate_limits(self) -> Dict[str, float | ConfigHTTPRateLimitData]:
+        """Returns the requests per second allowed to each host or glob of hosts (e.g. '*.example.com')."""
+        return self.data.get("http", {}).get("rate_limits", {})
+
+    @property
+    def http_hedging(self) -> Optional[ConfigHTTPHedgingData]:
+        """Returns when requests scrapers ask to be hedged get a duplicate sent, None if hedging is disabled."""
+        hedging = dict(self.data.get("http", {}).get("hedging", {}))
+
+        if hedging.pop("enabled", True) is False:
+            return None
+
+        return hedging
+
+    @property
+    def http_persist_cookies(self) -> bool:
+        """Returns whether the cookies plugins get should be kept for their next run. Defaults to False."""
+        return self.data.get("http", {}).get("persist_cookies", False)
+
+    @property
+    def http_process_single_flight(self) -> bool:
+        """Returns whether GET requests another mov-cli process is already sending should wait for its response. Defaults to False."""
+        return self.data.get("http", {}).get("process_single_flight", False)
+
+    @property
+    def http_record(self) -> Optional[str]:
+        """Returns the path of the cassette every request and response should be recorded to, if any."""
+        return self.data.get("http", {}).get("record")
+
+    @property
+    def http_replay(self) -> Optional[str]:
+        """Returns the path of the cassette responses should be replayed from instead of the network, if any."""
+        return self.data.get("http", {}).get("replay")
+
+    @property
+    def http_replay_latency(self) -> bool:
+        """Returns whether replayed responses should take as long as they did when they were recorded."""
+        return self.data.get("http", {}).get("replay_latency", False)
+
+    @property
+    def cache_backend(self) -> str:
+        """Returns the storage backend cache should use. Defaults to SQLite."""
+        return self.data.get("cache", {}).get("backend", "sqlite")
+
+    @property
+    def cache_quotas(self) -> Dict[str, ConfigCacheQuotaData]:
+        """
+        Returns the max entries and/or max bytes each cache section is allowed to hold 
+        before least recently used entries get evicted. The 'global' section is watch history.
+        """
+        default_quotas = {
+            "global": {"max_entries": 1000}, 
+            "http_cache": {"max_entries": 5000}
+        }
+
+        return {**default_quotas, **self.data.get("cache", {}).get("quotas", {})}
+
     @property
     def resolution(self) -> Quality:
         resolution_pixel = None
@@ -303,6 +592,11 @@ class Config():
     def watch_options(self) -> bool:
         return self.data.get("ui", {}).get("watch_options", True)
 
+    @property
+    def prefetch_next_episode(self) -> bool:
+        """Returns whether the next episode should be scraped in the background while an episode plays. Defaults to True."""
+        return self.data.get("ui", {}).get("prefetch_next_episode", True)
+
     @property
     def limit(self) -> int | None:
         return self.data.get("ui", {}).get("limit")
@@ -359,4 +653,11 @@ class Config():
             open(env_file_path, "w").close()
             logger.info(f".env file created at '{env_file_path}'.")
 
-        return env_file_path
\ No newline at end of file
+        return env_file_path
+
+    def __to_limits(self, limits_data: ConfigHTTPPoolLimitsData, fallback: ConfigHTTPPoolLimitsData) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections = limits_data.get("max_connections", fallback.get("max_connections", 100)), 
+            max_keepalive_connections = limits_data.get("max_keepalive_connections", fallback.get("max_keepalive_connections", 20)), 
+            keepalive_expiry = limits_data.get("keepalive_expiry", fallback.get("keepalive_expiry", 5))
+        )
@@ -9,6 +9,8 @@ import typer
 from pathlib import Path
 from devgoldyutils import Colours
 
+from .http import http_app
+from .cache import cache_app
 from .preview import preview_app
 
 __all__ = ()
@@ -25,6 +27,8 @@ test_app.add_typer(test_misc_app)
 
 app.add_typer(test_app)
 app.add_typer(preview_app)
+app.add_typer(cache_app)
+app.add_typer(http_app)
 
 @test_misc_app.command(help = "Test how a tip that get's displayed under the mov-cli welcome message is displayed.")
 def tip(tip_index: int):
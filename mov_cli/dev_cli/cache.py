@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import typer
+from devgoldyutils import Colours
+
+from ..cache import Cache
+from ..config import Config
+from ..utils import what_platform
+
+__all__ = ()
+
+cache_app = typer.Typer(
+    name = "cache", 
+    help = "Dev commands to inspect mov-cli's cache."
+)
+
+@cache_app.command(help = "Show the size, hit/miss counts and evictions of each cache section.")
+def stats():
+    config = Config()
+    cache = Cache(what_platform(), config = config)
+
+    section_stats = cache.stats()
+
+    if not section_stats:
+        print("The cache is empty.")
+        return None
+
+    for section, stats in sorted(section_stats.items()):
+        lookups = stats["hits"] + stats["misses"]
+        hit_rate = f"{stats['hits'] / lookups:.0%}" if lookups > 0 else "N/A"
+
+        quota = config.cache_quotas.get(section, {})
+        quota_string = ", ".join(f"{key} = {value}" for key, value in quota.items())
+
+        print(f"- {Colours.PURPLE.apply(section)}" + (f" [{Colours.PINK_GREY.apply(quota_string)}]" if quota_string else ""))
+        print(f"  entries: {Colours.BLUE.apply(str(stats['entries']))}, size: {Colours.BLUE.apply(format_bytes(stats['size']))}")
+        print(
+            f"  hits: {Colours.GREEN.apply(str(stats['hits']))}, misses: {Colours.RED.apply(str(stats['misses']))} ({hit_rate} hit rate)"
+        )
+        print(f"  evictions: {Colours.ORANGE.apply(str(stats['evictions']))}, expired: {Colours.ORANGE.apply(str(stats['expired']))}")
+
+def format_bytes(size: float) -> str:
+
+    for unit in ("B", "KiB", "MiB"):
+
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+
+        size /= 1024
+
+    return f"{size:.1f} GiB"
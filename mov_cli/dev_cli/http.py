@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import typer
+from devgoldyutils import Colours
+
+from ..cache import Cache
+from ..config import Config
+from ..utils import what_platform
+from ..http_client import LatencyTracker, AdaptiveTimeout
+
+__all__ = ()
+
+http_app = typer.Typer(
+    name = "http", 
+    help = "Dev commands to inspect what mov-cli's http client has learned about hosts."
+)
+
+@http_app.command(help = "Show the latency history of each host and the timeouts learned from it.")
+def timeouts():
+    config = Config()
+    platform = what_platform()
+
+    latency_tracker = LatencyTracker(Cache(platform, section = "http_latency", config = config))
+
+    adaptive_timeout_config = config.http_adaptive_timeout
+    configured_timeout = config.http_timeout
+
+    if adaptive_timeout_config is None:
+        print(Colours.ORANGE.apply("Adaptive timeouts are disabled, these are the timeouts hosts would get.\n"))
+
+    adaptive_timeout = AdaptiveTimeout(**(adaptive_timeout_config or {}))
+
+    hosts = latency_tracker.hosts()
+
+    if not hosts:
+        print("No latency history yet.")
+        return None
+
+    for host in hosts:
+        samples = latency_tracker.samples(host)
+
+        median = latency_tracker.percentile(host, 0.5)
+        percentile = latency_tracker.percentile(host, adaptive_timeout.percentile)
+        learned = adaptive_timeout.timeout_for(latency_tracker, host)
+
+        print(f"- {Colours.PURPLE.apply(host)} ({len(samples)} samples)")
+
+        if learned is None:
+            print(
+                f"  too little history (needs {latency_tracker.min_samples} samples), " \
+                    f"timeout: {Colours.PINK_GREY.apply(str(configured_timeout))} (configured)"
+            )
+            continue
+
+        print(
+            f"  p50: {Colours.BLUE.apply(f'{median:.3f}s')}, " \
+                f"p{adaptive_timeout.percentile * 100:g}: {Colours.BLUE.apply(f'{percentile:.3f}s')}"
+        )
+        print(f"  timeout: {Colours.GREEN.apply(f'{learned:.2f}s')} (learned)")
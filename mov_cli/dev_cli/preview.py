@@ -15,6 +15,9 @@ import subprocess
 import unicodedata
 
 from ..cache import Cache
+from ..config import Config
+from ..errors import MovCliException
+from ..cli.http_client import get_http_client
 from ..utils import what_platform, get_temp_directory
 
 __all__ = ()
@@ -32,12 +35,16 @@ def metadata(id: str):
         print("Image preview only works on Linux, Android an FreeBSD atm.")
         return False
 
+    config = Config()
+
     cache = Cache(
         platform = platform, 
-        section = "metadata_preview"
+        section = "metadata_preview", 
+        config = config
     )
 
-    preview_data = cache.get_cache(id) # TODO: Type dict preview data.
+    # The parent mov-cli process may not have committed this result's preview data yet.
+    preview_data = cache.get_cache(id) or {} # TODO: Type dict preview data.
 
     details: Optional[str] = preview_data.get("details")
     image_url: Optional[str] = preview_data.get("image_url")
@@ -66,14 +73,17 @@ def metadata(id: str):
             ])
 
         elif shutil.which("chafa") is not None:
-            file = image_url_to_file(image_url, id, platform).resolve()
-
-            subprocess.call([
-                "chafa", 
-                file, 
-                f"--size={fzf_preview_columns}x{fzf_preview_lines}", 
-                "--clear"
-            ])
+            file = image_url_to_file(image_url, id, platform, config)
+
+            if file is None:
+                print("Failed to download the image to preview. :(")
+            else:
+                subprocess.call([
+                    "chafa", 
+                    file.resolve(), 
+                    f"--size={fzf_preview_columns}x{fzf_preview_lines}", 
+                    "--clear"
+                ])
 
         else:
             print("'chafa' was not found hence image cannot be displayed! :( Please install it: https://github.com/hpjansson/chafa")
@@ -81,21 +91,18 @@ def metadata(id: str):
     if details is not None:
         print("\n" + details)
 
-def image_url_to_file(image_url: str, id: str, platform: str) -> Optional[Path]:
+def image_url_to_file(image_url: str, id: str, platform: str, config: Config) -> Optional[Path]:
     temp = get_temp_directory(platform)
     file = temp.joinpath(slugify(id))
 
     if file.exists():
         return file
 
-    request = httpx.get(image_url)
-
-    if request.is_error:
+    try:
+        get_http_client(platform, config).download_to(image_url, file)
+    except (httpx.HTTPError, MovCliException):
         return None
 
-    with file.open("wb") as f:
-        f.write(request.content)
-
     return file
 
 def slugify(value): # https://github.com/django/django/blob/main/django/utils/text.py#L452-L469
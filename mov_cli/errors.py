@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     import httpx
+    from pathlib import Path
 
 from devgoldyutils import Colours
 
@@ -10,7 +11,10 @@ __all__ = (
     "MovCliException",
     "SiteMaybeBlockedError",
     "ReferrerNotSupportedError",
-    "InternalPluginError"
+    "InternalPluginError",
+    "HostUnavailableError",
+    "IncompleteDownloadError",
+    "CassetteMissError"
 )
 
 class MovCliException(Exception):
@@ -49,4 +53,41 @@ class InternalPluginError(MovCliException):
         message = "An error occurred inside a plugin. This is MOST LIKELY not a mov-cli error, " \
             f"make SURE mov-cli and your plugins are up to date. Also report this to the plugin, not mov-cli! \nError: {error}"
 
+        super().__init__(message)
+
+class HostUnavailableError(MovCliException):
+    """
+    Raised by the http client instead of making a request to a host that has been 
+    failing repeatedly, until its circuit breaker cooldown is over.
+    """
+    def __init__(self, host: str, retry_in: float) -> None:
+        self.host = host
+        self.retry_in = retry_in
+
+        message = f"'{host}' has been failing repeatedly so the request wasn't made. " \
+            f"Requests to it will be tried again in {retry_in:.0f} seconds."
+
+        super().__init__(message)
+
+class IncompleteDownloadError(MovCliException):
+    """Raised when a download ends before all the bytes the server said it would send arrived."""
+    def __init__(self, url: str, received: int, expected: int) -> None:
+        self.url = url
+        self.received = received
+        self.expected = expected
+
+        message = f"The download of '{url}' ended after {received} of {expected} bytes. " \
+            "Downloading it again will resume from where it stopped."
+
+        super().__init__(message)
+
+class CassetteMissError(MovCliException):
+    """Raised when replaying a cassette and a request is made that wasn't recorded."""
+    def __init__(self, method: str, url: str, cassette_path: Path) -> None:
+        self.method = method
+        self.url = url
+
+        message = f"The {method} request to '{url}' isn't in the cassette '{cassette_path}'. " \
+            "Record the cassette again if the scraper's requests have changed."
+
         super().__init__(message)
\ No newline at end of file
@@ -0,0 +1,13 @@
+from .base import *
+from .client import *
+from .async_client import *
+from .cache import *
+from .retry import *
+from .circuit_breaker import *
+from .single_flight import *
+from .rate_limit import *
+from .cassette import *
+from .latency import *
+from .hedging import *
+from .cookie_store import *
+from .pool import *
\ No newline at end of file
@@ -0,0 +1,332 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Literal, Dict, Optional, Any, Awaitable, Tuple, Callable, TypeVar
+
+    from httpx import Response
+
+    from .retry import RetryPolicy
+    from .cache import HTTPCache, CachedResponse
+    from .rate_limit import RateLimiter
+    from .cassette import Cassette
+    from .hedging import HedgePolicy
+    from .latency import LatencyTracker, AdaptiveTimeout
+    from .pool import PoolPartitions
+    from .single_flight import ProcessSingleFlight
+    from .cookie_store import CookieStore
+    from .circuit_breaker import CircuitBreaker
+    from ..config import ConfigHTTPTimeoutData
+    from .client import HTTPClient
+
+    T = TypeVar("T")
+
+import time
+import httpx
+import asyncio
+import functools
+import concurrent.futures
+
+from ..utils import hide_ip
+from .base import BaseHTTPClient
+from .single_flight import AsyncSingleFlight
+
+__all__ = ("AsyncHTTPClient",)
+
+class AsyncHTTPClient(BaseHTTPClient):
+    """
+    An asynchronous version of :class:`~mov_cli.http_client.HTTPClient` built on ``httpx.AsyncClient`` 
+    so scrapers can fan out requests with ``asyncio.gather``. Headers, IP hiding and the HTTP cache work the same.
+
+    The underlying httpx client is bound to an event loop so a new one is made if it's used from a different loop, 
+    the old one is closed on its own loop if that's still running. 
+    Requests aren't coalesced with other processes as waiting on a lock file would block the event loop.
+    """
+    def __init__(
+        self, 
+        headers: Optional[Dict[str, str]] = None, 
+        timeout: int | ConfigHTTPTimeoutData = 15, 
+        hide_ip: bool = True, 
+        cache: Optional[HTTPCache] = None, 
+        http2: bool = False, 
+        limits: Optional[httpx.Limits] = None, 
+        retry_policy: Optional[RetryPolicy] = None, 
+        circuit_breaker: Optional[CircuitBreaker] = None, 
+        rate_limiter: Optional[RateLimiter] = None, 
+        cassette: Optional[Cassette] = None, 
+        latency_tracker: Optional[LatencyTracker] = None, 
+        hedge_policy: Optional[HedgePolicy] = None, 
+        cookie_store: Optional[CookieStore] = None, 
+        adaptive_timeout: Optional[AdaptiveTimeout] = None, 
+        pool_partitions: Optional[PoolPartitions] = None, 
+        process_single_flight: Optional[ProcessSingleFlight] = None
+    ) -> None:
+        self.__httpx_client: Optional[httpx.AsyncClient] = None
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__cookies = httpx.Cookies()
+        self.__single_flight = AsyncSingleFlight()
+
+        super().__init__(headers, timeout, hide_ip, cache, http2, limits, retry_policy, circuit_breaker, rate_limiter, cassette, latency_tracker, hedge_policy, cookie_store, adaptive_timeout, pool_partitions, process_single_flight)
+
+        self.namespace: Optional[str] = None
+        """The plugin namespace of the client it was made from with :meth:`from_http_client`, its requests go through that plugin's pool."""
+
+    @classmethod
+    def from_http_client(cls, http_client: HTTPClient) -> AsyncHTTPClient:
+        """
+        Makes an async client with the same settings and cookie jar as a sync client, so cookies either of them 
+        gets are sent by both and saved along with the sync client's if it's attached to a cookie store.
+        """
+        async_http_client = cls(**http_client._settings())
+        async_http_client.namespace = http_client.namespace
+        async_http_client.__cookies = http_client.cookies
+
+        return async_http_client
+
+    async def request(
+        self, 
+        method: Literal["GET", "HEAD", "POST", "PUT", "DELETE", "CONNECT", "OPTIONS", "TRACE", "PATCH"],
+        url: str, 
+        params: Optional[Dict[str, str]] = None, 
+        headers: Optional[Dict[str, str]] = None, 
+        include_default_headers: bool = False, 
+        redirect: bool = False, 
+        cache: bool = True, 
+        cache_ttl: Optional[int] = None, 
+        retry: bool = True, 
+        hedge: bool = False, 
+        cookies: Optional[Dict[str, str]] = None, 
+        **kwargs
+    ) -> Response:
+        """Performs a request with httpx and returns `httpx.Response`. Takes the same arguments as :meth:`HTTPClient.request`."""
+        httpx_client = self.__get_httpx_client()
+
+        cached, headers, cached_response = await self.__run_blocking(
+            self._before_request, httpx_client, method, url, params, headers, include_default_headers, cache, cache_ttl, cookies
+        )
+
+        if cached is not None:
+            return cached
+
+        await self.__run_blocking(self._check_circuit, url)
+
+        kwargs = await self.__run_blocking(self._learned_timeout, url, kwargs)
+
+        args = (method, url, params, headers, redirect, cached_response, cache, cache_ttl, retry, kwargs)
+        hedge_delay = await self.__run_blocking(self._hedge_delay, method, url, hedge)
+
+        def send() -> Awaitable[Response]:
+
+            if hedge_delay is None:
+                return self.__send(*args)
+
+            return self.__send_hedged(hedge_delay, args)
+
+        single_flight_key = self._single_flight_key(method, url, params, headers, redirect, kwargs)
+
+        if single_flight_key is None:
+            return await send()
+
+        response, leader = await self.__single_flight.do(single_flight_key, send)
+
+        return response if leader else self._copy_response(response)
+
+    @property
+    def cookies(self) -> httpx.Cookies:
+        """The cookies requests are sent with, cookies responses set are added to it."""
+        return self.__cookies
+
+    def set_cookies(self, cookies: dict) -> None:
+        """Sets the cookies every request after this is sent with. Pass ``cookies`` to :meth:`request` for a single request instead."""
+        # Replaced in place as the jar may be shared with a sync client.
+        self.__cookies.clear()
+        self.__cookies.update(cookies)
+
+    async def aclose(self) -> None:
+        """Closes the connections of the underlying httpx client."""
+        if self.__httpx_client is None:
+            return None
+
+        if self.__loop is asyncio.get_running_loop():
+            await self.__httpx_client.aclose()
+
+            self.__httpx_client = None
+            self.__loop = None
+            return None
+
+        closing = self.__close_on_own_loop()
+
+        if closing is not None:
+            await asyncio.wrap_future(closing)
+
+    async def __aenter__(self) -> AsyncHTTPClient:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def __send(
+        self, 
+        method: str, 
+        url: str, 
+        params: Optional[Dict[str, str]], 
+        headers: Dict[str, str], 
+        redirect: bool, 
+        cached_response: Optional[CachedResponse], 
+        cache: bool, 
+        cache_ttl: Optional[int], 
+        retry: bool, 
+        kwargs: Dict[str, Any]
+    ) -> Response:
+        attempt = 0
+
+        while True:
+
+            throttle_delay = await self.__run_blocking(self._throttle_delay, url)
+
+            if throttle_delay > 0:
+                await asyncio.sleep(throttle_delay)
+
+            try:
+                self._log_request(method, url)
+
+                started = time.perf_counter()
+
+                response = await self.__get_httpx_client().request(
+                    method = method, 
+                    url = url, 
+                    params = params, 
+                    headers = headers, 
+                    follow_redirects = redirect, 
+                    **kwargs
+                )
+
+            except httpx.TransportError as e:
+                await self.__run_blocking(self._record_timeout, url, e, kwargs)
+
+                delay = self._retry_delay(method, url, attempt, retry, error = e)
+
+                if delay is None:
+                    await self.__run_blocking(self._record_circuit, url, error = e)
+
+                    if isinstance(e, httpx.ConnectError):
+                        self._raise_connect_error(url, e)
+
+                    raise e
+
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            delay = self._retry_delay(method, url, attempt, retry, response = response)
+
+            if delay is None:
+                elapsed = time.perf_counter() - started
+
+                await self.__run_blocking(self._record_circuit, url, response = response)
+
+                return await self.__run_blocking(
+                    self._after_response, method, url, response, cached_response, cache, cache_ttl, elapsed = elapsed
+                )
+
+            await response.aclose()
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def __send_hedged(self, hedge_delay: float, args: Tuple[Any, ...]) -> Response:
+        """Sends the request and a hedge alongside it if it's slower than ``hedge_delay``, the slower one gets cancelled."""
+        tasks = [asyncio.ensure_future(self.__send(*args))]
+
+        try:
+            done, _ = await asyncio.wait(tasks, timeout = hedge_delay)
+
+            if not done and self.hedge_policy.try_acquire():
+                self.logger.debug(
+                    f"No response from '{hide_ip(args[1], self.hide_ip)}' after {hedge_delay:.2f} seconds, sending a hedged request..."
+                )
+
+                hedge = asyncio.ensure_future(self.__send(*args))
+                hedge.add_done_callback(lambda _: self.hedge_policy.release())
+
+                tasks.append(hedge)
+
+            pending = set(tasks)
+            error = None
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when = asyncio.FIRST_COMPLETED)
+
+                for task in done:
+
+                    if task.exception() is None:
+                        return task.result()
+
+                    error = error or task.exception()
+
+            raise error
+
+        finally:
+
+            for task in tasks:
+                task.cancel()
+
+    def __get_httpx_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+
+        if self.__httpx_client is not None and self.__loop is not loop:
+            self.logger.debug("Event loop changed, making a new httpx client...")
+            self.__close_on_own_loop()
+
+        if self.__httpx_client is None:
+            transport = None
+            plugin_limits = None
+
+            if self.namespace is not None and self.pool_partitions is not None:
+                plugin_limits = self.pool_partitions.plugin_limits(self.namespace)
+
+            # Async pools are bound to their event loop so, unlike the sync client's, they can't be shared between clients.
+            if plugin_limits is not None:
+                transport = self._httpx_transport(asynchronous = True, limits = plugin_limits, name = f"plugin '{self.namespace}' (async)")
+
+            self.__httpx_client = httpx.AsyncClient(
+                # The jar itself rather than a copy of it, so every httpx client shares it.
+                cookies = self.__cookies.jar, 
+                **self._httpx_client_kwargs(asynchronous = True, transport = transport)
+            )
+            self.__loop = loop
+
+        return self.__httpx_client
+
+    def __close_on_own_loop(self) -> Optional[concurrent.futures.Future]:
+        """
+        Closes the httpx client on the event loop it was made on, as its connections can't be closed from any other. 
+        Returns the future of the closing if the loop is still running.
+        """
+        httpx_client, loop = self.__httpx_client, self.__loop
+        closing = None
+
+        if loop.is_running():
+            closing = asyncio.run_coroutine_threadsafe(httpx_client.aclose(), loop)
+
+        elif not loop.is_closed():
+            raise RuntimeError(
+                "The event loop this client's connections belong to isn't running, " \
+                    "await 'aclose()' on that loop before using the client from another one."
+            )
+
+        else:
+            # Nothing can run on a closed loop anymore, its connections are closed as they're garbage collected.
+            self.logger.debug("The event loop the httpx client was made on is closed, dropping its connections...")
+
+        self.__httpx_client = None
+        self.__loop = None
+
+        return closing
+
+    async def __run_blocking(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Runs work that may block on SQLite (the HTTP cache, latency history or a persisted 
+        circuit breaker) in the event loop's executor so other requests aren't held up by it.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, functools.partial(function, *args, **kwargs))
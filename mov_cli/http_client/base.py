@@ -0,0 +1,387 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Optional, Tuple, NoReturn, Set, Hashable, Any
+
+    from httpx import Response, Client, AsyncClient, Limits
+
+    from .retry import RetryPolicy
+    from .cache import HTTPCache, CachedResponse
+    from .rate_limit import RateLimiter
+    from .cassette import Cassette
+    from .hedging import HedgePolicy
+    from .latency import LatencyTracker, AdaptiveTimeout
+    from .pool import PoolPartitions
+    from .single_flight import ProcessSingleFlight
+    from .cookie_store import CookieStore
+    from .circuit_breaker import CircuitBreaker
+    from ..config import ConfigHTTPTimeoutData
+
+import httpx
+from devgoldyutils import LoggerAdapter, Colours
+
+from ..utils import hide_ip
+from .retry import IDEMPOTENT_METHODS
+from .pool import PartitionedTransport
+from .circuit_breaker import HOST_DOWN_ERRORS, HOST_DOWN_STATUS_CODES
+from .cassette import CassetteTransport
+from ..logger import mov_cli_logger
+from ..errors import SiteMaybeBlockedError
+
+__all__ = ("BaseHTTPClient",)
+
+DECODED_BODY_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+"""A response's content is already decoded, so these headers don't describe it anymore."""
+
+class BaseHTTPClient():
+    """The behaviour :class:`~mov_cli.http_client.HTTPClient` and :class:`~mov_cli.http_client.AsyncHTTPClient` share."""
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int | ConfigHTTPTimeoutData = 15,
+        hide_ip: bool = True,
+        cache: Optional[HTTPCache] = None,
+        http2: bool = False,
+        limits: Optional[Limits] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cassette: Optional[Cassette] = None,
+        latency_tracker: Optional[LatencyTracker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        cookie_store: Optional[CookieStore] = None,
+        adaptive_timeout: Optional[AdaptiveTimeout] = None,
+        pool_partitions: Optional[PoolPartitions] = None,
+        process_single_flight: Optional[ProcessSingleFlight] = None
+    ) -> None:
+        self.hide_ip = hide_ip
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.cache = cache
+        self.http2 = http2
+        self.limits = limits or httpx.Limits(max_connections = 100, max_keepalive_connections = 20)
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self.cassette = cassette
+        self.latency_tracker = latency_tracker
+        self.hedge_policy = hedge_policy
+        self.cookie_store = cookie_store
+        self.adaptive_timeout = adaptive_timeout
+        self.pool_partitions = pool_partitions
+        self.process_single_flight = process_single_flight
+
+        self.logger = LoggerAdapter(mov_cli_logger, prefix = self.__class__.__name__)
+
+        self.__logged_protocol_hosts: Set[str] = set()
+
+        super().__init__()
+
+    def _settings(self) -> Dict[str, Any]:
+        """The constructor kwargs that make another client with the same settings."""
+        return {
+            "headers": self.headers, 
+            "timeout": self.timeout, 
+            "hide_ip": self.hide_ip, 
+            "cache": self.cache, 
+            "http2": self.http2, 
+            "limits": self.limits, 
+            "retry_policy": self.retry_policy, 
+            "circuit_breaker": self.circuit_breaker, 
+            "rate_limiter": self.rate_limiter, 
+            "cassette": self.cassette, 
+            "latency_tracker": self.latency_tracker, 
+            "hedge_policy": self.hedge_policy, 
+            "cookie_store": self.cookie_store, 
+            "adaptive_timeout": self.adaptive_timeout, 
+            "pool_partitions": self.pool_partitions, 
+            "process_single_flight": self.process_single_flight
+        }
+
+    def _httpx_client_kwargs(
+        self,
+        asynchronous: bool = False,
+        transport: Optional[httpx.BaseTransport | httpx.AsyncBaseTransport] = None
+    ) -> dict:
+        """The timeout and transport kwargs to build the underlying httpx client with, the default transport is only built if ``transport`` isn't passed."""
+        if transport is None:
+            transport = self._httpx_transport(asynchronous, name = "default (async)" if asynchronous else "default")
+
+        return {"timeout": self._configured_timeout(), "transport": transport}
+
+    def _httpx_transport(
+        self,
+        asynchronous: bool = False,
+        limits: Optional[Limits] = None,
+        name: str = "default"
+    ) -> httpx.BaseTransport | httpx.AsyncBaseTransport:
+        """
+        Builds the transport requests are sent through, it holds the connection pool. With :class:`~mov_cli.http_client.PoolPartitions` 
+        hosts that have a partition get a pool of their own and ``name`` is what the transport's main pool is called in pool stats.
+        """
+        if self.cassette is not None and self.cassette.mode == "replay":
+            return CassetteTransport(self.cassette)
+
+        transport_class = httpx.AsyncHTTPTransport if asynchronous else httpx.HTTPTransport
+
+        def make_transport(limits: Limits) -> httpx.BaseTransport | httpx.AsyncBaseTransport:
+            transport = transport_class(http2 = self.http2, limits = limits)
+
+            if self.cassette is not None:
+                return CassetteTransport(self.cassette, transport)
+
+            return transport
+
+        if self.pool_partitions is None:
+            return make_transport(limits or self.limits)
+
+        return PartitionedTransport(name, make_transport, limits or self.limits, self.pool_partitions)
+
+    def _configured_timeout(self) -> httpx.Timeout:
+
+        if isinstance(self.timeout, dict):
+            return httpx.Timeout(15, **self.timeout)
+
+        return httpx.Timeout(self.timeout)
+
+    def _learned_timeout(self, url: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns the request kwargs with the connect and read timeouts learned for the url's host, unless a timeout was passed."""
+        if "timeout" in kwargs or self.adaptive_timeout is None or self.latency_tracker is None:
+            return kwargs
+
+        learned = self.adaptive_timeout.timeout_for(self.latency_tracker, httpx.URL(url).host)
+
+        if learned is None:
+            return kwargs
+
+        configured = self._configured_timeout()
+
+        return {
+            **kwargs, 
+            "timeout": httpx.Timeout(connect = learned, read = learned, write = configured.write, pool = configured.pool)
+        }
+
+    def _record_timeout(self, url: str, error: Exception, kwargs: Dict[str, Any]) -> None:
+        """Counts a timed out request as a sample of the timeout it hit, so a host that got slower gets longer timeouts."""
+        if not self._tracks_latency() or not isinstance(error, httpx.TimeoutException):
+            return None
+
+        timeout = kwargs.get("timeout", self._configured_timeout())
+
+        if isinstance(timeout, httpx.Timeout):
+            timeout = timeout.read
+
+        if timeout is not None:
+            self.latency_tracker.record(httpx.URL(url).host, timeout)
+
+    def _before_request(
+        self,
+        httpx_client: Client | AsyncClient,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, str]],
+        headers: Optional[Dict[str, str]],
+        include_default_headers: bool,
+        cache: bool,
+        cache_ttl: Optional[int],
+        cookies: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[Response], Dict[str, str], Optional[CachedResponse]]:
+        """
+        Adds the default headers and cookies and looks the request up in the HTTP cache.
+
+        Returns the cached response if it can be used as is, the headers to send
+        and the cached response the request will revalidate (if any).
+
+        The caller's headers are copied rather than modified so nothing leaks between requests.
+        """
+        headers = dict(headers or {})
+
+        if cookies is not None:
+            headers["Cookie"] = "; ".join(f"{name}={value}" for name, value in cookies.items())
+
+        if include_default_headers is True:
+
+            if headers.get("Referer") is None:
+                headers.update({"Referer": url})
+
+            headers.update(self.headers)
+
+        if not cache or self.cache is None or method.upper() != "GET":
+            return None, headers, None
+
+        request = httpx_client.build_request(method, url, params = params, headers = headers)
+
+        cached_response = self.cache.lookup(request)
+
+        if cached_response is None:
+            return None, headers, None
+
+        if self.cache.can_use(cached_response, request, cache_ttl):
+            self.logger.debug(
+                Colours.ORANGE.apply(method.upper()) + f" -> {hide_ip(url, self.hide_ip)} ({Colours.GREEN.apply('cached')})"
+            )
+            return self.cache.to_response(cached_response, request), headers, None
+
+        return None, {**headers, **cached_response.validators()}, cached_response
+
+    def _single_flight_key(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, str]],
+        headers: Dict[str, str],
+        redirect: bool,
+        kwargs: Dict[str, Any]
+    ) -> Optional[Hashable]:
+        """
+        Returns what identical in-flight requests are coalesced on or None if the request shouldn't be, 
+        only GET and HEAD requests without a body, cookies or other per request options are.
+        """
+        if method.upper() not in ("GET", "HEAD") or any(key != "timeout" for key in kwargs):
+            return None
+
+        return (
+            method.upper(),
+            str(httpx.URL(url, params = params)),
+            tuple(sorted((key.lower(), value) for key, value in headers.items())),
+            redirect
+        )
+
+    def _copy_response(self, response: Response) -> Response:
+        """Gives requests that were coalesced onto another their own response object."""
+        return httpx.Response(
+            status_code = response.status_code,
+            # Or else httpx would decode the already decoded content again.
+            headers = [(key, value) for key, value in response.headers.multi_items() if key.lower() not in DECODED_BODY_HEADERS],
+            content = response.content,
+            request = response.request,
+            extensions = response.extensions
+        )
+
+    def _check_circuit(self, url: str) -> None:
+        """Raises :class:`~mov_cli.errors.HostUnavailableError` if the url's host has been failing repeatedly."""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.check(httpx.URL(url).host)
+
+    def _throttle_delay(self, url: str) -> float:
+        """Returns how many seconds the rate limiter wants a request to the url's host to wait."""
+        if self.rate_limiter is None:
+            return 0
+
+        return self.rate_limiter.reserve(httpx.URL(url).host)
+
+    def _retry_delay(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        retry: bool,
+        response: Optional[Response] = None,
+        error: Optional[Exception] = None
+    ) -> Optional[float]:
+        """Returns how many seconds to wait before sending the request again or None if it shouldn't be."""
+        if response is not None and self.rate_limiter is not None:
+            self.rate_limiter.handle_response(httpx.URL(url).host, response)
+
+        if not retry or self.retry_policy is None or not self.retry_policy.should_retry(method, attempt, response, error):
+            return None
+
+        delay = self.retry_policy.backoff(attempt)
+
+        self.logger.debug(
+            f"{method.upper()} request to '{hide_ip(url, self.hide_ip)}' failed ({error or response}), " \
+                f"retrying in {delay:.2f} seconds... ({attempt + 2}/{self.retry_policy.attempts})"
+        )
+
+        return delay
+
+    def _record_circuit(self, url: str, response: Optional[Response] = None, error: Optional[Exception] = None) -> None:
+        """
+        Records how a request went with the circuit breaker, once its retries are used up. Only failing to connect 
+        and gateway errors count against the host, anything else means it's up even if that one request failed.
+        """
+        if self.circuit_breaker is None:
+            return None
+
+        host = httpx.URL(url).host
+
+        if isinstance(error, HOST_DOWN_ERRORS) or (response is not None and response.status_code in HOST_DOWN_STATUS_CODES):
+            self.circuit_breaker.record_failure(host)
+        else:
+            self.circuit_breaker.record_success(host)
+
+    def _hedge_delay(self, method: str, url: str, hedge: bool) -> Optional[float]:
+        """Returns how many seconds to wait for a response before sending a hedged request or None if it shouldn't be hedged."""
+        if not hedge or self.hedge_policy is None or self.latency_tracker is None or method.upper() not in IDEMPOTENT_METHODS:
+            return None
+
+        latency = self.latency_tracker.percentile(httpx.URL(url).host, self.hedge_policy.percentile)
+
+        if latency is None:
+            return None
+
+        return max(latency, self.hedge_policy.min_delay)
+
+    def _log_request(self, method: str, url: str) -> None:
+        self.logger.debug(
+            Colours.ORANGE.apply(method.upper()) + f" -> {hide_ip(url, self.hide_ip)}"
+        )
+
+    def _after_response(
+        self,
+        method: str,
+        url: str,
+        response: Response,
+        cached_response: Optional[CachedResponse],
+        cache: bool,
+        cache_ttl: Optional[int],
+        elapsed: Optional[float] = None
+    ) -> Response:
+        """
+        Logs failed requests and stores, revalidates or invalidates the response's cache. ``elapsed`` is how many seconds
+        the request took, we time it ourselves as ``response.elapsed`` isn't set on responses that come pre-read (e.g. from a cassette).
+        """
+        if response.is_error:
+            self.logger.debug(
+                f"{method.upper()} request to '{response.url}' {Colours.RED.apply('failed!')} ({response})"
+            )
+
+        host = response.url.host
+
+        if elapsed is not None and self._tracks_latency() and not response.is_server_error:
+            self.latency_tracker.record(host, elapsed)
+
+        if host not in self.__logged_protocol_hosts:
+            self.__logged_protocol_hosts.add(host)
+            self.logger.debug(f"Negotiated {Colours.PURPLE.apply(response.http_version)} with '{hide_ip(host, self.hide_ip)}'.")
+
+        if self.cache is None:
+            return response
+
+        if method.upper() == "GET":
+
+            if not cache:
+                return response
+
+            if cached_response is not None and response.status_code == 304:
+                self.logger.debug(f"Revalidated cached response of '{hide_ip(url, self.hide_ip)}'.")
+                return self.cache.revalidated(cached_response, response)
+
+            self.cache.store(response, cache_ttl)
+
+        elif method.upper() not in ("HEAD", "OPTIONS", "TRACE") and not response.is_error:
+            self.cache.invalidate(response.request.url)
+
+        return response
+
+    def _tracks_latency(self) -> bool:
+        # Replayed responses take no time at all so they'd only throw off the real latencies.
+        return self.latency_tracker is not None and (self.cassette is None or self.cassette.mode != "replay")
+
+    def _raise_connect_error(self, url: str, error: httpx.ConnectError) -> NoReturn:
+        # TODO: I think this needs improving. I see people are getting certificate errors that aren't being caught here.
+        if "[SSL: CERTIFICATE_VERIFY_FAILED]" in str(error):
+            raise SiteMaybeBlockedError(url, error)
+
+        raise error
@@ -0,0 +1,437 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Tuple, Optional
+
+    from pathlib import Path
+
+    from httpx import Response, Request, Headers
+
+    from ..config import Config
+    from ..utils.platform import SUPPORTED_PLATFORMS
+
+import time
+import json
+import random
+import hashlib
+from dataclasses import dataclass, field, asdict
+from email.utils import parsedate_to_datetime
+
+import httpx
+from devgoldyutils import LoggerAdapter, Colours
+
+from ..cache import Cache
+from ..logger import mov_cli_logger
+from ..utils import get_cache_directory, replace_file_atomically
+
+__all__ = (
+    "HTTPCache",
+    "CachedResponse",
+)
+
+logger = LoggerAdapter(
+    mov_cli_logger, prefix = Colours.BLUE.apply("HTTPCache")
+)
+
+CACHEABLE_STATUS_CODES = {200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501}
+"""Status codes that are heuristically cacheable (RFC 9110 section 15.1)."""
+
+HEURISTIC_FRESHNESS_CAP = 86400
+"""The longest a response with only a Last-Modified header is considered fresh for."""
+REVALIDATION_WINDOW = 7 * 86400
+"""How long stale responses that have validators are kept around so they can be revalidated with a 304."""
+
+UNSTORED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive", "set-cookie"}
+"""Bodies are stored decoded and cookies shouldn't be replayed, so these headers are dropped."""
+
+SHARED_RESULT_TTL = 30
+"""How long responses shared with other mov-cli processes waiting on the same request are kept."""
+
+BODY_PRUNE_CHANCE = 1 / 32
+"""The chance a store will also delete bodies no cached response refers to anymore."""
+
+@dataclass
+class CachedResponse:
+    """A response stored in the :class:`HTTPCache`."""
+    key: str
+    status_code: int
+    headers: List[Tuple[str, str]]
+    body_hash: str
+    response_time: float
+    """When the response was received or last revalidated."""
+    initial_age: float
+    freshness_lifetime: float
+    vary: Dict[str, Optional[str]] = field(default_factory = dict)
+
+    def age(self, now: float) -> float:
+        return self.initial_age + max(now - self.response_time, 0)
+
+    def is_fresh(self, now: float, freshness_lifetime: Optional[float] = None) -> bool:
+
+        if freshness_lifetime is None:
+            freshness_lifetime = self.freshness_lifetime
+
+        return self.age(now) < freshness_lifetime
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.__get_header("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.__get_header("last-modified")
+
+    def validators(self) -> Dict[str, str]:
+        """Returns the conditional request headers this response can be revalidated with."""
+        headers = {}
+
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+    def __get_header(self, name: str) -> Optional[str]:
+
+        for key, value in self.headers:
+
+            if key.lower() == name:
+                return value
+
+        return None
+
+class HTTPCache():
+    """
+    A private HTTP cache following RFC 9111 that :class:`~mov_cli.http_client.HTTPClient` can use for GET requests.
+
+    Response metadata lives in the ``http_cache`` cache section while bodies are stored content addressed
+    (by their sha256) in the ``http`` folder of the cache directory, so identical pages are only stored once.
+
+    Cache-Control, Expires and Last-Modified decide how long a response is fresh for, stale responses
+    with an ETag or Last-Modified are revalidated with a conditional request and refreshed on a 304.
+    """
+    def __init__(self, platform: SUPPORTED_PLATFORMS, config: Optional[Config] = None) -> None:
+        self.cache = Cache(platform, section = "http_cache", config = config)
+        self.shared_cache = Cache(platform, section = "http_shared", config = config)
+        self.bodies_path = get_cache_directory(platform).joinpath("http")
+
+        super().__init__()
+
+    def lookup(self, request: Request) -> Optional[CachedResponse]:
+        """Returns the stored response for a request if there is one and its variant matches the request."""
+        if "no-store" in parse_cache_control(request.headers):
+            return None
+
+        data = self.cache.get_cache(self.__get_key(request))
+
+        if data is None:
+            return None
+
+        cached_response = CachedResponse(**data)
+        cached_response.headers = [tuple(header) for header in cached_response.headers]
+
+        for name, value in cached_response.vary.items():
+
+            if request.headers.get(name) != value:
+                return None
+
+        if not self.__body_path(cached_response.body_hash).exists():
+            return None
+
+        return cached_response
+
+    def can_use(self, cached_response: CachedResponse, request: Request, ttl: Optional[float] = None) -> bool:
+        """Returns whether a stored response is fresh enough to be used for the request without revalidating."""
+        directives = parse_cache_control(request.headers)
+
+        if "no-cache" in directives:
+            return False
+
+        now = time.time()
+
+        if "max-age" in directives:
+            max_age = _parse_seconds(directives["max-age"])
+
+            if max_age is None or cached_response.age(now) > max_age:
+                return False
+
+        return cached_response.is_fresh(now, ttl)
+
+    def store(self, response: Response, ttl: Optional[float] = None) -> Optional[CachedResponse]:
+        """
+        Stores a response if it's cacheable, returns what was stored.
+
+        ``ttl`` makes a successful response fresh for that many seconds regardless of its headers.
+        """
+        request = response.request
+
+        if request.method != "GET" or response.history:
+            return None
+
+        request_directives = parse_cache_control(request.headers)
+        directives = parse_cache_control(response.headers)
+
+        vary = self.__get_vary(request, response)
+
+        if vary is None or "no-store" in request_directives:
+            return None
+
+        if ttl is None:
+
+            if "no-store" in directives or response.status_code not in CACHEABLE_STATUS_CODES:
+                return None
+
+            freshness_lifetime = 0 if "no-cache" in directives else _freshness_lifetime(response, directives)
+
+        else:
+
+            if not response.is_success:
+                return None
+
+            freshness_lifetime = ttl
+
+        now = time.time()
+
+        cached_response = CachedResponse(
+            key = self.__get_key(request),
+            status_code = response.status_code,
+            headers = [(key, value) for key, value in response.headers.multi_items() if key.lower() not in UNSTORED_HEADERS],
+            body_hash = hashlib.sha256(response.content).hexdigest(),
+            response_time = now,
+            initial_age = _initial_age(response, now),
+            freshness_lifetime = freshness_lifetime,
+            vary = vary
+        )
+
+        if not cached_response.is_fresh(now) and not cached_response.validators():
+            return None
+
+        self.__write_body(cached_response.body_hash, response.content)
+        self.__save(cached_response)
+
+        if random.random() < BODY_PRUNE_CHANCE:
+            self.prune()
+
+        return cached_response
+
+    def revalidated(self, cached_response: CachedResponse, response: Response) -> Response:
+        """Refreshes a stored response with the headers of a 304 it was revalidated with and returns it."""
+        headers = {key.lower(): value for key, value in cached_response.headers}
+
+        for key, value in response.headers.items():
+
+            if key.lower() not in UNSTORED_HEADERS and not key.lower().startswith("content-"):
+                headers[key.lower()] = value
+
+        now = time.time()
+
+        cached_response.headers = list(headers.items())
+        cached_response.response_time = now
+        cached_response.initial_age = _initial_age(response, now)
+        cached_response.freshness_lifetime = _freshness_lifetime(
+            response, parse_cache_control(httpx.Headers(cached_response.headers))
+        )
+
+        self.__save(cached_response)
+
+        return self.to_response(cached_response, response.request)
+
+    def to_response(self, cached_response: CachedResponse, request: Request) -> Response:
+        """Turns a stored response back into an ``httpx.Response``."""
+        return httpx.Response(
+            status_code = cached_response.status_code,
+            headers = cached_response.headers,
+            content = self.__body_path(cached_response.body_hash).read_bytes(),
+            request = request,
+            extensions = {"from_cache": True}
+        )
+
+    def share(self, response: Response) -> None:
+        """
+        Keeps a response for a few seconds, whether it's cacheable or not, so other mov-cli 
+        processes that were waiting on the same request can use it instead of sending it again.
+        """
+        vary = self.__get_vary(response.request, response)
+
+        if vary is None or response.is_server_error or "no-store" in parse_cache_control(response.headers):
+            return None
+
+        cached_response = CachedResponse(
+            key = self.__get_key(response.request),
+            status_code = response.status_code,
+            headers = [(key, value) for key, value in response.headers.multi_items() if key.lower() not in UNSTORED_HEADERS],
+            body_hash = hashlib.sha256(response.content).hexdigest(),
+            response_time = time.time(),
+            initial_age = 0,
+            freshness_lifetime = SHARED_RESULT_TTL,
+            vary = vary
+        )
+
+        self.__write_body(cached_response.body_hash, response.content)
+        self.shared_cache.set_cache(cached_response.key, asdict(cached_response), seconds_until_expired = SHARED_RESULT_TTL)
+
+    def shared(self, request: Request, since: float) -> Optional[Response]:
+        """Returns the response another process shared for the request after ``since`` (a unix timestamp), if there is one."""
+        data = self.shared_cache.get_cache(self.__get_key(request))
+
+        if data is None:
+            return None
+
+        cached_response = CachedResponse(**data)
+
+        if cached_response.response_time < since or not self.__body_path(cached_response.body_hash).exists():
+            return None
+
+        for name, value in cached_response.vary.items():
+
+            if request.headers.get(name) != value:
+                return None
+
+        return self.to_response(cached_response, request)
+
+    def invalidate(self, url: httpx.URL | str) -> None:
+        """Drops the stored response of a URL, used after an unsafe method (e.g. POST) succeeds on it."""
+        self.cache.clear_cache(f"GET {url}")
+
+    def clear(self) -> None:
+        """Deletes every stored response and body."""
+        self.cache.clear_all_cache()
+        self.shared_cache.clear_all_cache()
+        self.prune(min_age = 0)
+
+    def prune(self, min_age: float = 60) -> int:
+        """
+        Deletes bodies that no stored response refers to anymore (e.g. after they were evicted or expired).
+
+        Bodies younger than ``min_age`` seconds are skipped as another process may be about to refer to them, 
+        this also keeps the bodies of shared responses around for as long as they're shared.
+        """
+        if not self.bodies_path.exists():
+            return 0
+
+        self.cache.flush()
+
+        referenced = set()
+
+        for _, _, entry in self.cache.backend.iterate(self.cache.section):
+            referenced.add(json.loads(entry.value)["body_hash"])
+
+        now = time.time()
+        pruned = 0
+
+        for path in self.bodies_path.glob("*/*"):
+
+            try:
+
+                if path.name not in referenced and now - path.stat().st_mtime >= min_age:
+                    path.unlink()
+                    pruned += 1
+
+            except OSError:
+                pass
+
+        if pruned > 0:
+            logger.debug(f"Pruned {pruned} unreferenced response bodies.")
+
+        return pruned
+
+    def __save(self, cached_response: CachedResponse) -> None:
+        keep_for = cached_response.freshness_lifetime - cached_response.initial_age
+
+        if cached_response.validators():
+            keep_for = max(keep_for, REVALIDATION_WINDOW)
+
+        self.cache.set_cache(cached_response.key, asdict(cached_response), seconds_until_expired = max(int(keep_for), 1))
+
+    def __write_body(self, body_hash: str, content: bytes) -> None:
+        body_path = self.__body_path(body_hash)
+
+        if not body_path.exists():
+            body_path.parent.mkdir(parents = True, exist_ok = True)
+            replace_file_atomically(body_path, content)
+
+    def __get_key(self, request: Request) -> str:
+        return f"{request.method} {request.url}"
+
+    def __get_vary(self, request: Request, response: Response) -> Optional[Dict[str, Optional[str]]]:
+        """Returns the request headers the response varies on or None if it varies on everything."""
+        vary = {}
+
+        for value in response.headers.get_list("vary", split_commas = True):
+            name = value.strip().lower()
+
+            if name == "*":
+                return None
+
+            if name:
+                vary[name] = request.headers.get(name)
+
+        return vary
+
+    def __body_path(self, body_hash: str) -> Path:
+        return self.bodies_path.joinpath(body_hash[:2], body_hash)
+
+def parse_cache_control(headers: Headers) -> Dict[str, Optional[str]]:
+    """Parses every Cache-Control header into a dict of lowercase directives and their arguments."""
+    directives = {}
+
+    for directive in headers.get_list("cache-control", split_commas = True):
+        name, _, argument = directive.strip().partition("=")
+
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+
+    return directives
+
+def _freshness_lifetime(response: Response, directives: Dict[str, Optional[str]]) -> float:
+    """Works out how long a response is fresh for (RFC 9111 section 4.2.1)."""
+    if "max-age" in directives:
+        return _parse_seconds(directives["max-age"]) or 0
+
+    date = _parse_date(response.headers.get("date"))
+
+    if "expires" in response.headers:
+        expires = _parse_date(response.headers["expires"])
+
+        # An invalid Expires header means the response has already expired.
+        if expires is None:
+            return 0
+
+        return max(expires - (date or time.time()), 0)
+
+    last_modified = _parse_date(response.headers.get("last-modified"))
+
+    if last_modified is not None:
+        return min(max((date or time.time()) - last_modified, 0) * 0.1, HEURISTIC_FRESHNESS_CAP)
+
+    return 0
+
+def _initial_age(response: Response, now: float) -> float:
+    """Works out how old a response already was when it was received (RFC 9111 section 4.2.3)."""
+    age = _parse_seconds(response.headers.get("age")) or 0
+    date = _parse_date(response.headers.get("date"))
+
+    if date is not None:
+        age = max(age, now - date)
+
+    return age
+
+def _parse_seconds(value: Optional[str]) -> Optional[int]:
+
+    try:
+        return max(int(value), 0)
+    except (TypeError, ValueError):
+        return None
+
+def _parse_date(value: Optional[str]) -> Optional[float]:
+
+    if value is None:
+        return None
+
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
@@ -0,0 +1,210 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Tuple, Optional, Literal, Any
+
+    from pathlib import Path
+    from httpx import Request, Response
+
+    CassetteModeT = Literal["record", "replay"]
+
+import gzip
+import json
+import time
+import base64
+import atexit
+import asyncio
+import hashlib
+import threading
+
+import httpx
+from devgoldyutils import LoggerAdapter, Colours
+
+from ..logger import mov_cli_logger
+from ..utils import replace_file_atomically
+from ..errors import CassetteMissError
+
+__all__ = (
+    "Cassette",
+    "CassetteTransport",
+)
+
+logger = LoggerAdapter(
+    mov_cli_logger, prefix = Colours.PINK_GREY.apply("Cassette")
+)
+
+class Cassette():
+    """
+    A gzipped JSON archive of request and response pairs so scraper runs can be 
+    recorded once and replayed deterministically offline.
+
+    Requests are matched on method, URL and body. Identical requests are played back in the 
+    order they were recorded, once they run out the last one is played again.
+    """
+    def __init__(self, path: Path, mode: CassetteModeT, replay_latency: bool = False) -> None:
+        self.path = path
+        self.mode = mode
+        self.replay_latency = replay_latency
+        """Whether replayed responses should take as long as they did when they were recorded."""
+
+        self.__lock = threading.Lock()
+        self.__interactions: List[Dict[str, Any]] = []
+        self.__recorded: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+        self.__played: Dict[Tuple[str, str, str], int] = {}
+
+        if mode == "replay":
+
+            with path.open("rb") as file:
+                self.__interactions = json.loads(gzip.decompress(file.read()))["interactions"]
+
+            for interaction in self.__interactions:
+                recorded_request = interaction["request"]
+
+                self.__recorded.setdefault(
+                    (recorded_request["method"], recorded_request["url"], recorded_request["body"]), []
+                ).append(interaction)
+
+            logger.info(f"Replaying {len(self.__interactions)} recorded requests from '{path}'...")
+
+        else:
+            logger.info(f"Recording requests to '{path}'...")
+            atexit.register(self.save)
+
+        super().__init__()
+
+    def record(self, request: Request, response: Response, content: bytes, latency: float) -> None:
+        interaction = {
+            "request": {
+                "method": request.method, 
+                "url": str(request.url), 
+                "body": _hash_body(request.content)
+            }, 
+            "response": {
+                "status_code": response.status_code, 
+                "http_version": response.http_version, 
+                "headers": response.headers.multi_items(), 
+                "content": base64.b64encode(content).decode()
+            }, 
+            "latency": latency
+        }
+
+        with self.__lock:
+            self.__interactions.append(interaction)
+
+    def play(self, request: Request) -> Tuple[Response, float]:
+        """Returns the recorded response for a request and how long it took when it was recorded."""
+        key = (request.method, str(request.url), _hash_body(request.content))
+
+        with self.__lock:
+            matches = self.__recorded.get(key)
+
+            if matches is None:
+                raise CassetteMissError(request.method, str(request.url), self.path)
+
+            played = self.__played.get(key, 0)
+            self.__played[key] = played + 1
+
+        interaction = matches[min(played, len(matches) - 1)]
+        recorded_response = interaction["response"]
+
+        response = httpx.Response(
+            status_code = recorded_response["status_code"], 
+            headers = recorded_response["headers"], 
+            content = base64.b64decode(recorded_response["content"]), 
+            extensions = {"http_version": recorded_response["http_version"].encode()}
+        )
+
+        return response, interaction["latency"]
+
+    def save(self) -> None:
+        """Writes the recorded requests to the archive."""
+        with self.__lock:
+            data = json.dumps({"version": 1, "interactions": self.__interactions}, separators = (",", ":"))
+
+        self.path.parent.mkdir(parents = True, exist_ok = True)
+        replace_file_atomically(self.path, gzip.compress(data.encode()))
+
+        logger.debug(f"Saved {len(self.__interactions)} recorded requests to '{self.path}'.")
+
+class CassetteTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    An httpx transport that records the responses of the ``transport`` it wraps 
+    into a :class:`Cassette` or, when replaying, answers from the cassette without any network.
+    """
+    def __init__(
+        self, 
+        cassette: Cassette, 
+        transport: Optional[httpx.BaseTransport | httpx.AsyncBaseTransport] = None
+    ) -> None:
+        self.cassette = cassette
+        self.transport = transport
+
+        super().__init__()
+
+    def handle_request(self, request: Request) -> Response:
+        request.read()
+
+        if self.cassette.mode == "replay":
+            response, latency = self.cassette.play(request)
+
+            if self.cassette.replay_latency:
+                time.sleep(latency)
+
+            return response
+
+        start = time.perf_counter()
+
+        response = self.transport.handle_request(request)
+
+        try:
+            content = b"".join(response.iter_raw())
+        finally:
+            response.close()
+
+        return self.__recorded(request, response, content, time.perf_counter() - start)
+
+    async def handle_async_request(self, request: Request) -> Response:
+        await request.aread()
+
+        if self.cassette.mode == "replay":
+            response, latency = self.cassette.play(request)
+
+            if self.cassette.replay_latency:
+                await asyncio.sleep(latency)
+
+            return response
+
+        start = time.perf_counter()
+
+        response = await self.transport.handle_async_request(request)
+
+        try:
+            content = b"".join([chunk async for chunk in response.aiter_raw()])
+        finally:
+            await response.aclose()
+
+        return self.__recorded(request, response, content, time.perf_counter() - start)
+
+    def close(self) -> None:
+
+        if self.transport is not None:
+            self.transport.close()
+
+    async def aclose(self) -> None:
+
+        if self.transport is not None:
+            await self.transport.aclose()
+
+    def __recorded(self, request: Request, response: Response, content: bytes, latency: float) -> Response:
+        self.cassette.record(request, response, content, latency)
+
+        return httpx.Response(
+            status_code = response.status_code, 
+            headers = response.headers, 
+            content = content, 
+            extensions = response.extensions
+        )
+
+def _hash_body(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
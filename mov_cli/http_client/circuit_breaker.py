@@ -0,0 +1,127 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional, Set
+
+    from ..cache import Cache
+
+import time
+import httpx
+import threading
+from devgoldyutils import LoggerAdapter, Colours
+
+from ..logger import mov_cli_logger
+from ..errors import HostUnavailableError
+
+__all__ = (
+    "CircuitBreaker",
+)
+
+logger = LoggerAdapter(
+    mov_cli_logger, prefix = Colours.RED.apply("CircuitBreaker")
+)
+
+HOST_DOWN_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+HOST_DOWN_STATUS_CODES = (502, 503, 504)
+
+class CircuitBreaker():
+    """
+    Keeps track of request failures per host and fails fast for hosts that failed 
+    ``failure_threshold`` times within ``window`` seconds, so a dead site costs nothing 
+    instead of a timeout on every request. A request that's retried counts once.
+
+    Once ``cooldown`` seconds pass one request is let through, if it succeeds the host is 
+    trusted again, if it fails the host is blocked for another cooldown. When a ``cache`` is 
+    passed blocked hosts are remembered across mov-cli runs until their cooldown ends.
+    """
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        window: float = 60,
+        cooldown: float = 120,
+        cache: Optional[Cache] = None
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.cooldown = cooldown
+        self.cache = cache
+
+        self.__lock = threading.Lock()
+        self.__failures: Dict[str, List[float]] = {}
+        self.__open_until: Dict[str, float] = {}
+        self.__half_open: Dict[str, float] = {}
+        """Hosts a trial request is being let through to, with when it was let through."""
+        self.__loaded_hosts: Set[str] = set()
+
+        super().__init__()
+
+    def check(self, host: str) -> None:
+        """Raises :class:`~mov_cli.errors.HostUnavailableError` if requests to the host should fail fast."""
+        now = time.time()
+
+        with self.__lock:
+            self.__load(host)
+
+            trial_started = self.__half_open.get(host)
+
+            # Only the one trial request finds out if the host is back, others wait on how it goes. A trial that 
+            # never reported back (e.g. its thread died) stops holding up the host after another cooldown.
+            if trial_started is not None and now - trial_started < self.cooldown:
+                raise HostUnavailableError(host, trial_started + self.cooldown - now)
+
+            open_until = self.__open_until.get(host)
+
+            if open_until is None and trial_started is None:
+                return None
+
+            if open_until is not None and now < open_until:
+                raise HostUnavailableError(host, open_until - now)
+
+            # Cooldown is over, let a trial request through.
+            self.__open_until.pop(host, None)
+            self.__half_open[host] = now
+
+    def record_success(self, host: str) -> None:
+
+        with self.__lock:
+            self.__failures.pop(host, None)
+            self.__half_open.pop(host, None)
+
+    def record_failure(self, host: str) -> bool:
+        """Records a failed request to the host, returns True if the host is now blocked."""
+        now = time.time()
+
+        with self.__lock:
+            failures = [failed_at for failed_at in self.__failures.get(host, []) if now - failed_at < self.window]
+            failures.append(now)
+
+            self.__failures[host] = failures
+
+            if host not in self.__half_open and len(failures) < self.failure_threshold:
+                return False
+
+            self.__failures.pop(host, None)
+            self.__half_open.pop(host, None)
+            self.__open_until[host] = now + self.cooldown
+
+        logger.warning(
+            f"'{host}' keeps failing so requests to it will fail fast for the next {self.cooldown:g} seconds."
+        )
+
+        if self.cache is not None:
+            self.cache.set_cache(host, now + self.cooldown, seconds_until_expired = int(self.cooldown))
+
+        return True
+
+    def __load(self, host: str) -> None:
+        """Picks up the host's block from the cache, only the first time the host is seen."""
+        if self.cache is None or host in self.__loaded_hosts:
+            return None
+
+        self.__loaded_hosts.add(host)
+
+        open_until = self.cache.get_cache(host)
+
+        if open_until is not None:
+            self.__open_until[host] = max(open_until, self.__open_until.get(host, 0))
@@ -0,0 +1,571 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Literal, Dict, Optional, Any, Tuple, List, Iterable, Set, Hashable, Callable
+
+    from pathlib import Path
+    from httpx import Response
+
+    from .retry import RetryPolicy
+    from .cache import HTTPCache, CachedResponse
+    from .rate_limit import RateLimiter
+    from .cassette import Cassette
+    from .hedging import HedgePolicy
+    from .latency import LatencyTracker, AdaptiveTimeout
+    from .pool import PoolPartitions
+    from .single_flight import ProcessSingleFlight
+    from .cookie_store import CookieStore
+    from .circuit_breaker import CircuitBreaker
+    from ..config import ConfigHTTPTimeoutData
+
+import os
+import re
+import time
+import httpx
+import threading
+from concurrent.futures import Future, wait, FIRST_COMPLETED
+from deprecation import deprecated
+
+from .. import __version__
+from ..utils import FileLock, hide_ip
+from ..errors import IncompleteDownloadError
+from .base import BaseHTTPClient
+from .single_flight import SingleFlight
+
+__all__ = ("HTTPClient",)
+
+PREWARM_DURATION = 60
+"""The longest connections opened by :meth:`HTTPClient.prewarm` are kept open for while no request uses them."""
+
+class HTTPClient(BaseHTTPClient):
+    """
+    mov-cli's http client scrapers make their requests with.
+
+    It's safe to share between threads (e.g. a scraper fanning requests out to a ``ThreadPoolExecutor``), 
+    requests never modify the headers passed to them or any other per request state on the client. Cookies 
+    only meant for one request should be passed to it with ``cookies`` rather than set with :meth:`set_cookies`, 
+    which changes the cookies of every request made after it.
+
+    ``transport`` is the httpx transport (and so connection pool) to send requests through, 
+    clients made with :meth:`for_namespace` share the transport of the client they were made from 
+    unless their plugin has a pool of its own.
+    """
+    def __init__(
+        self, 
+        headers: Optional[Dict[str, str]] = None, 
+        timeout: int | ConfigHTTPTimeoutData = 15, 
+        hide_ip: bool = True, 
+        cache: Optional[HTTPCache] = None, 
+        http2: bool = False, 
+        limits: Optional[httpx.Limits] = None, 
+        retry_policy: Optional[RetryPolicy] = None, 
+        circuit_breaker: Optional[CircuitBreaker] = None, 
+        rate_limiter: Optional[RateLimiter] = None, 
+        cassette: Optional[Cassette] = None, 
+        latency_tracker: Optional[LatencyTracker] = None, 
+        hedge_policy: Optional[HedgePolicy] = None, 
+        cookie_store: Optional[CookieStore] = None, 
+        adaptive_timeout: Optional[AdaptiveTimeout] = None, 
+        pool_partitions: Optional[PoolPartitions] = None, 
+        process_single_flight: Optional[ProcessSingleFlight] = None, 
+        transport: Optional[httpx.BaseTransport] = None
+    ) -> None:
+        super().__init__(headers, timeout, hide_ip, cache, http2, limits, retry_policy, circuit_breaker, rate_limiter, cassette, latency_tracker, hedge_policy, cookie_store, adaptive_timeout, pool_partitions, process_single_flight)
+
+        self.namespace: Optional[str] = None
+        """The plugin namespace the client was made for with :meth:`for_namespace`."""
+
+        self.__single_flight = SingleFlight()
+
+        # A transport that's passed in (e.g. by 'for_namespace') is shared, so a new one isn't built for nothing.
+        httpx_client_kwargs = self._httpx_client_kwargs(transport = transport)
+
+        self.__transport: httpx.BaseTransport = httpx_client_kwargs["transport"]
+
+        self.__httpx_client = httpx.Client(
+            cookies = None, 
+            **httpx_client_kwargs
+        )
+
+        self.__lock = threading.Lock()
+        self.__prewarming: Set[str] = set()
+        self.__requested_hosts: Set[str] = set()
+        self.__plugin_transports: Dict[str, httpx.BaseTransport] = {}
+
+    @property
+    def cookies(self) -> httpx.Cookies:
+        """The cookies requests are sent with, cookies responses set are added to it."""
+        return self.__httpx_client.cookies
+
+    def for_namespace(self, namespace: str) -> HTTPClient:
+        """
+        Returns a client with the same settings but a cookie jar of its own for a plugin namespace, it sends requests 
+        through the plugin's pool if :class:`~mov_cli.http_client.PoolPartitions` gives it one or else through this client's. 
+        If the client has a :class:`~mov_cli.http_client.CookieStore` the jar is loaded from and saved to it, 
+        so cookies a plugin got in an earlier run are sent again.
+        """
+        transport = self.__transport
+        plugin_limits = None if self.pool_partitions is None else self.pool_partitions.plugin_limits(namespace)
+
+        if plugin_limits is not None:
+
+            with self.__lock:
+                transport = self.__plugin_transports.get(namespace)
+
+                if transport is None:
+                    transport = self._httpx_transport(limits = plugin_limits, name = f"plugin '{namespace}'")
+                    self.__plugin_transports[namespace] = transport
+
+        http_client = HTTPClient(**self._settings(), transport = transport)
+        http_client.namespace = namespace
+        # The clients may share connections, so they share what's being and what doesn't need to be pre-warmed.
+        http_client.__lock = self.__lock
+        http_client.__prewarming = self.__prewarming
+        http_client.__requested_hosts = self.__requested_hosts
+        http_client.__plugin_transports = self.__plugin_transports
+
+        if self.cookie_store is not None:
+            self.cookie_store.attach(namespace, http_client.cookies)
+
+        return http_client
+
+    def prewarm(self, hosts: Iterable[str]) -> None:
+        """
+        Opens connections to hosts (e.g. ``example.com`` or ``https://example.com:8080``) in background threads 
+        so the first request to them doesn't have to wait for DNS, TCP and TLS setup. The connections are kept 
+        open until a request goes to the host or for :data:`PREWARM_DURATION` seconds.
+
+        Nothing is pre-warmed while recording or replaying a cassette.
+        """
+        if self.cassette is not None:
+            return None
+
+        for host in hosts:
+            url = httpx.URL(host if "://" in host else f"https://{host}")
+            origin = str(url.copy_with(path = "/", query = None, fragment = None))
+
+            with self.__lock:
+
+                if origin in self.__prewarming or url.host in self.__requested_hosts:
+                    continue
+
+                self.__prewarming.add(origin)
+
+            threading.Thread(target = self.__keep_warm, args = (origin,), name = "mov-cli-prewarm", daemon = True).start()
+
+    def request(
+        self, 
+        method: Literal["GET", "HEAD", "POST", "PUT", "DELETE", "CONNECT", "OPTIONS", "TRACE", "PATCH"],
+        url: str, 
+        params: Optional[Dict[str, str]] = None, 
+        headers: Optional[Dict[str, str]] = None, 
+        include_default_headers: bool = False, 
+        redirect: bool = False, 
+        cache: bool = True, 
+        cache_ttl: Optional[int] = None, 
+        retry: bool = True, 
+        hedge: bool = False, 
+        cookies: Optional[Dict[str, str]] = None, 
+        **kwargs
+    ) -> Response:
+        """
+        Performs a request with httpx and returns `httpx.Response`.
+
+        GET requests go through the client's :class:`~mov_cli.http_client.HTTPCache` if it has one, 
+        ``cache = False`` skips it and ``cache_ttl`` caches the response for that many seconds regardless of its headers.
+
+        Failed idempotent requests are retried following the client's :class:`~mov_cli.http_client.RetryPolicy` 
+        unless ``retry = False`` is passed.
+
+        Unless a ``timeout`` is passed, hosts with enough latency history get the connect and read timeouts 
+        the client's :class:`~mov_cli.http_client.AdaptiveTimeout` learned for them.
+
+        ``cookies`` are sent with this request only, instead of the client's cookies, and not 
+        with the requests that follow a redirect.
+
+        ``hedge = True`` sends a duplicate of an idempotent request that's taking longer than the host usually 
+        does and uses whichever response arrives first, following the client's :class:`~mov_cli.http_client.HedgePolicy`.
+
+        With a :class:`~mov_cli.http_client.ProcessSingleFlight` and an HTTP cache, a GET request another mov-cli process 
+        is already sending waits for that process's response instead of being sent again.
+        """
+        cached, headers, cached_response = self._before_request(
+            self.__httpx_client, method, url, params, headers, include_default_headers, cache, cache_ttl, cookies
+        )
+
+        if cached is not None:
+            return cached
+
+        self._check_circuit(url)
+
+        kwargs = self._learned_timeout(url, kwargs)
+
+        args = (method, url, params, headers, redirect, cached_response, cache, cache_ttl, retry, kwargs)
+        hedge_delay = self._hedge_delay(method, url, hedge)
+
+        def send() -> Response:
+
+            if hedge_delay is None:
+                return self.__send(*args)
+
+            return self.__send_hedged(hedge_delay, args)
+
+        single_flight_key = self._single_flight_key(method, url, params, headers, redirect, kwargs)
+
+        if single_flight_key is None:
+            return send()
+
+        if self.process_single_flight is not None and self.cache is not None and cache and method.upper() == "GET":
+            in_process_send = send
+
+            def send() -> Response:
+                return self.__send_across_processes(single_flight_key, method, url, params, headers, in_process_send)
+
+        response, leader = self.__single_flight.do(single_flight_key, send)
+
+        return response if leader else self._copy_response(response)
+
+    def download_to(
+        self, 
+        url: str, 
+        path: Path, 
+        headers: Optional[Dict[str, str]] = None, 
+        include_default_headers: bool = False, 
+        redirect: bool = True, 
+        chunk_size: int = 65536
+    ) -> Path:
+        """
+        Streams a response body to ``path`` without holding it in memory and returns the path.
+
+        The body is written to ``<path>.part`` which is renamed to ``path`` once it's complete, so ``path`` is never 
+        half written. If a previous download was cut off it's resumed with a Range request and if fewer bytes than the 
+        Content-Length arrive :class:`~mov_cli.errors.IncompleteDownloadError` is raised, leaving the part file to resume from.
+        """
+        _, headers, _ = self._before_request(
+            self.__httpx_client, "GET", url, None, headers, include_default_headers, False, None
+        )
+
+        # Compressed bodies can't be resumed by byte offset.
+        headers = {**headers, "Accept-Encoding": "identity"}
+
+        part_path = path.with_name(path.name + ".part")
+
+        self._check_circuit(url)
+
+        with FileLock(path.with_name(path.name + ".lock")):
+            attempt = 0
+
+            while True:
+
+                throttle_delay = self._throttle_delay(url)
+
+                if throttle_delay > 0:
+                    time.sleep(throttle_delay)
+
+                try:
+                    self.__stream_to_part_file(url, part_path, headers, redirect, chunk_size)
+                    break
+
+                except (httpx.TransportError, IncompleteDownloadError) as e:
+                    delay = self._retry_delay("GET", url, attempt, True, error = e)
+
+                    if delay is None:
+                        self._record_circuit(url, error = e)
+
+                        if isinstance(e, httpx.ConnectError):
+                            self._raise_connect_error(url, e)
+
+                        raise e
+
+                    time.sleep(delay)
+                    attempt += 1
+
+            os.replace(part_path, path)
+
+        return path
+
+    @deprecated(
+        deprecated_in = "4.4", 
+        current_version = __version__, 
+        details = "Switch to 'HTTPClient.request()' for the latest functionality."
+    )
+    def get(
+        self, 
+        url: str, 
+        headers: Dict[str, str] = {}, 
+        include_default_headers: bool = True, 
+        redirect: bool = False, 
+        **kwargs
+    ) -> Response:
+        """Performs a GET request and returns httpx.Response."""
+        return self.request(
+            "GET", 
+            url = url, 
+            headers = headers, 
+            include_default_headers = include_default_headers, 
+            redirect = redirect,
+            **kwargs
+        )
+
+    @deprecated(
+        deprecated_in = "4.4", 
+        current_version = __version__, 
+        details = "Switch to 'HTTPClient.request()' for the latest functionality."
+    )
+    def post(
+        self, 
+        url: str,
+        data: dict = {},
+        json: dict = {}, 
+        headers: dict = {}, 
+        include_default_headers: bool = True, 
+        redirect: bool = False, 
+        **kwargs
+    ) -> Response:
+        """Performs a POST request and returns httpx.Response."""
+
+        return self.request(
+            "POST", 
+            url = url, 
+            data = data, 
+            json = json, 
+            headers = headers, 
+            include_default_headers = include_default_headers, 
+            redirect = redirect,
+            **kwargs
+        )
+
+    def set_cookies(self, cookies: dict) -> None:
+        """Sets the cookies every request after this is sent with. Pass ``cookies`` to :meth:`request` for a single request instead."""
+        # Replaced in place as the jar may be attached to a cookie store.
+        self.cookies.clear()
+        self.cookies.update(cookies)
+
+    def __send(
+        self, 
+        method: str, 
+        url: str, 
+        params: Optional[Dict[str, str]], 
+        headers: Dict[str, str], 
+        redirect: bool, 
+        cached_response: Optional[CachedResponse], 
+        cache: bool, 
+        cache_ttl: Optional[int], 
+        retry: bool, 
+        kwargs: Dict[str, Any]
+    ) -> Response:
+        attempt = 0
+
+        self.__requested_hosts.add(httpx.URL(url).host)
+
+        while True:
+
+            throttle_delay = self._throttle_delay(url)
+
+            if throttle_delay > 0:
+                time.sleep(throttle_delay)
+
+            try:
+                self._log_request(method, url)
+
+                started = time.perf_counter()
+
+                response = self.__httpx_client.request(
+                    method = method, 
+                    url = url, 
+                    params = params, 
+                    headers = headers, 
+                    follow_redirects = redirect, 
+                    **kwargs
+                )
+
+            except httpx.TransportError as e:
+                self._record_timeout(url, e, kwargs)
+
+                delay = self._retry_delay(method, url, attempt, retry, error = e)
+
+                if delay is None:
+                    self._record_circuit(url, error = e)
+
+                    if isinstance(e, httpx.ConnectError):
+                        self._raise_connect_error(url, e)
+
+                    raise e
+
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            delay = self._retry_delay(method, url, attempt, retry, response = response)
+
+            if delay is None:
+                self._record_circuit(url, response = response)
+
+                return self._after_response(
+                    method, url, response, cached_response, cache, cache_ttl, elapsed = time.perf_counter() - started
+                )
+
+            response.close()
+
+            time.sleep(delay)
+            attempt += 1
+
+    def __send_hedged(self, hedge_delay: float, args: Tuple[Any, ...]) -> Response:
+        """Sends the request in a worker thread and a hedge alongside it if it's slower than ``hedge_delay``."""
+        futures = [_in_daemon_thread(self.__send, *args)]
+
+        done, _ = wait(futures, timeout = hedge_delay)
+
+        if not done and self.hedge_policy.try_acquire():
+            self.logger.debug(
+                f"No response from '{hide_ip(args[1], self.hide_ip)}' after {hedge_delay:.2f} seconds, sending a hedged request..."
+            )
+
+            hedge = _in_daemon_thread(self.__send, *args)
+            hedge.add_done_callback(lambda _: self.hedge_policy.release())
+
+            futures.append(hedge)
+
+        return _first_response(futures)
+
+    def __send_across_processes(
+        self,
+        key: Hashable,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, str]],
+        headers: Dict[str, str],
+        send: Callable[[], Response]
+    ) -> Response:
+        """Sends the request unless another mov-cli process is already sending it, in which case its response is used."""
+        request = self.__httpx_client.build_request(method, url, params = params, headers = headers)
+        since = time.time()
+
+        response, leader = self.process_single_flight.do(
+            key, send, lambda: self.cache.shared(request, since), self.cache.share
+        )
+
+        if not leader:
+            self.logger.debug(f"Got '{hide_ip(url, self.hide_ip)}' from another mov-cli process.")
+
+        return response
+
+    def __keep_warm(self, origin: str) -> None:
+        host = httpx.URL(origin).host
+        deadline = time.monotonic() + PREWARM_DURATION
+
+        # Pinged a bit before the pool would close the connection for being idle.
+        interval = max((self.limits.keepalive_expiry or 5) * 0.8, 1)
+
+        self.logger.debug(f"Pre-warming a connection to '{hide_ip(origin, self.hide_ip)}'...")
+
+        try:
+
+            while time.monotonic() < deadline and host not in self.__requested_hosts:
+                # Straight to the transport, pings aren't requests the rate limiter or circuit breaker should count.
+                # Read to the end (there's no body) or else the connection isn't put back in the pool.
+                self.__transport.handle_request(httpx.Request("HEAD", origin)).read()
+
+                time.sleep(interval)
+
+        except httpx.HTTPError as e:
+            self.logger.debug(f"Stopped pre-warming '{hide_ip(origin, self.hide_ip)}'. Error: {e}")
+
+        finally:
+
+            with self.__lock:
+                self.__prewarming.discard(origin)
+
+    def __stream_to_part_file(
+        self, 
+        url: str, 
+        part_path: Path, 
+        headers: Dict[str, str], 
+        redirect: bool, 
+        chunk_size: int
+    ) -> None:
+        offset = part_path.stat().st_size if part_path.exists() else 0
+
+        request_headers = headers if offset == 0 else {**headers, "Range": f"bytes={offset}-"}
+
+        self._log_request("GET", url)
+
+        with self.__httpx_client.stream("GET", url, headers = request_headers, follow_redirects = redirect) as response:
+            self._retry_delay("GET", url, 0, False, response = response)
+            self._record_circuit(url, response = response)
+
+            # The part file is bigger than the whole body (e.g. the file changed), start again. Without 
+            # a range sent the 416 can't be because of the part file, starting again would only loop.
+            if response.status_code == 416 and offset > 0:
+                part_path.unlink(missing_ok = True)
+                return self.__stream_to_part_file(url, part_path, headers, redirect, chunk_size)
+
+            response.raise_for_status()
+
+            content_range = re.match(r"bytes (\d+)-\d+/(\d+|\*)", response.headers.get("content-range", ""))
+
+            if response.status_code == 206 and content_range is not None and int(content_range.group(1)) == offset:
+                self.logger.debug(f"Resuming download of '{hide_ip(url, self.hide_ip)}' from byte {offset}...")
+                mode = "ab"
+            else:
+                offset = 0
+                mode = "wb"
+
+            content_length = response.headers.get("content-length")
+            expected = None if content_length is None else offset + int(content_length)
+
+            received = offset
+
+            with part_path.open(mode) as file:
+
+                # Raw bytes as Content-Length and byte ranges count the body as it's sent, not decoded.
+                for chunk in response.iter_raw(chunk_size):
+                    file.write(chunk)
+                    received += len(chunk)
+
+        if expected is not None and received != expected:
+            raise IncompleteDownloadError(url, received, expected)
+
+
+def _first_response(futures: List[Future[Response]]) -> Response:
+    """Returns the first response to arrive, closing the ones that arrive later. Errors are only raised if every request failed."""
+    pending = set(futures)
+    error = None
+
+    while pending:
+        done, pending = wait(pending, return_when = FIRST_COMPLETED)
+
+        for future in done:
+
+            if future.exception() is not None:
+                error = error or future.exception()
+                continue
+
+            for loser in pending:
+                loser.add_done_callback(
+                    lambda future: future.exception() is None and future.result().close()
+                )
+
+            return future.result()
+
+    raise error
+
+def _in_daemon_thread(function: Callable[..., Response], *args: Any) -> Future[Response]:
+    """
+    Calls the function in a thread of its own and returns the future of its response. A daemon thread (unlike 
+    a ``ThreadPoolExecutor``'s) so a losing hedge that's hung up on a slow host can't hold up mov-cli exiting.
+    """
+    future: Future[Response] = Future()
+
+    def call() -> None:
+
+        try:
+            future.set_result(function(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    future.set_running_or_notify_cancel()
+    threading.Thread(target = call, name = "mov-cli-hedge", daemon = True).start()
+
+    return future
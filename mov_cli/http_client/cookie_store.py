@@ -0,0 +1,103 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Any
+
+    from ..cache import Cache
+
+import atexit
+import threading
+from http.cookiejar import Cookie
+
+import httpx
+
+__all__ = (
+    "CookieStore",
+)
+
+class CookieStore():
+    """
+    Persists the cookie jar of each plugin namespace in a cache so sessions (tokens, challenge cookies, etc) 
+    survive across mov-cli runs. Jars passed to :meth:`attach` are saved when mov-cli exits.
+
+    Cookies without an expiry date are kept for ``ttl`` seconds after the jar was last saved.
+    """
+    def __init__(self, cache: Cache, ttl: int = 7 * 86400) -> None:
+        self.cache = cache
+        self.ttl = ttl
+
+        self.__lock = threading.Lock()
+        self.__jars: Dict[str, List[httpx.Cookies]] = {}
+
+        atexit.register(self.save)
+
+        super().__init__()
+
+    def attach(self, namespace: str, cookies: httpx.Cookies) -> None:
+        """Fills a jar with the namespace's cookies and saves it under the namespace from now on."""
+        with self.__lock:
+            jars = self.__jars.setdefault(namespace, [])
+
+            if jars:
+                stored = list(jars[0].jar)
+            else:
+                stored = [_dict_to_cookie(data) for data in self.cache.get_cache(namespace) or []]
+
+            for cookie in stored:
+
+                if not cookie.is_expired():
+                    cookies.jar.set_cookie(cookie)
+
+            jars.append(cookies)
+
+    def save(self) -> None:
+        """Writes the jars passed to :meth:`attach` to the cache, the last attached jar wins where jars of a namespace disagree."""
+        to_save = {}
+
+        with self.__lock:
+
+            for namespace, jars in self.__jars.items():
+                cookies = {}
+
+                for jar in jars:
+
+                    for cookie in list(jar.jar):
+
+                        if not cookie.is_expired():
+                            cookies[(cookie.domain, cookie.path, cookie.name)] = _cookie_to_dict(cookie)
+
+                to_save[namespace] = list(cookies.values())
+
+        if to_save:
+            self.cache.set_many(to_save, seconds_until_expired = self.ttl)
+
+def _cookie_to_dict(cookie: Cookie) -> Dict[str, Any]:
+    return {
+        "name": cookie.name, 
+        "value": cookie.value, 
+        "domain": cookie.domain, 
+        "path": cookie.path, 
+        "secure": cookie.secure, 
+        "expires": cookie.expires
+    }
+
+def _dict_to_cookie(data: Dict[str, Any]) -> Cookie:
+    return Cookie(
+        version = 0, 
+        name = data["name"], 
+        value = data["value"], 
+        port = None, 
+        port_specified = False, 
+        domain = data["domain"], 
+        domain_specified = bool(data["domain"]), 
+        domain_initial_dot = data["domain"].startswith("."), 
+        path = data["path"], 
+        path_specified = True, 
+        secure = data["secure"], 
+        expires = data["expires"], 
+        discard = data["expires"] is None, 
+        comment = None, 
+        comment_url = None, 
+        rest = {}
+    )
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import threading
+
+__all__ = (
+    "HedgePolicy",
+)
+
+class HedgePolicy():
+    """
+    Decides when a duplicate (hedged) request is sent for a request that's taking longer than usual.
+
+    A hedge goes out once a request has taken longer than the ``percentile`` of the host's 
+    past latencies (but at least ``min_delay`` seconds) and whichever response arrives first is used. 
+    At most ``max_hedges`` hedges are in flight at once across every client sharing the policy.
+    """
+    def __init__(self, percentile: float = 0.95, min_delay: float = 0.1, max_hedges: int = 4) -> None:
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_hedges = max_hedges
+
+        self.__hedges = threading.BoundedSemaphore(max_hedges)
+
+        super().__init__()
+
+    def try_acquire(self) -> bool:
+        """Takes a hedge slot if one is free."""
+        return self.__hedges.acquire(blocking = False)
+
+    def release(self) -> None:
+        self.__hedges.release()
@@ -0,0 +1,128 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional, Set
+
+    from ..cache import Cache
+
+import math
+import atexit
+import threading
+
+__all__ = (
+    "LatencyTracker",
+    "AdaptiveTimeout",
+)
+
+LATENCY_HISTORY_TTL = 7 * 86400
+"""How long a host's latency history is kept after it was last updated."""
+
+class LatencyTracker():
+    """
+    Keeps the latest ``max_samples`` response times of each host to work out latency percentiles from. 
+    When a ``cache`` is passed the history is loaded from and saved to it so it builds up across mov-cli runs.
+    """
+    def __init__(self, cache: Optional[Cache] = None, max_samples: int = 200, min_samples: int = 10) -> None:
+        self.cache = cache
+        self.max_samples = max_samples
+        self.min_samples = min_samples
+        """How many samples a host needs before percentiles are given for it."""
+
+        self.__lock = threading.Lock()
+        self.__samples: Dict[str, List[float]] = {}
+        self.__dirty: Set[str] = set()
+
+        if cache is not None:
+            atexit.register(self.save)
+
+        super().__init__()
+
+    def record(self, host: str, seconds: float) -> None:
+
+        with self.__lock:
+            samples = self.__get_samples(host)
+
+            samples.append(round(seconds, 3))
+            del samples[:-self.max_samples]
+
+            self.__dirty.add(host)
+
+    def samples(self, host: str) -> List[float]:
+        """Returns the host's latency history in seconds, oldest first."""
+        with self.__lock:
+            return list(self.__get_samples(host))
+
+    def percentile(self, host: str, percentile: float) -> Optional[float]:
+        """Returns the latency (in seconds) ``percentile`` (0 to 1) of requests to the host fall under or None if there's too little history."""
+        samples = sorted(self.samples(host))
+
+        if len(samples) < self.min_samples:
+            return None
+
+        return samples[max(math.ceil(percentile * len(samples)) - 1, 0)]
+
+    def hosts(self) -> List[str]:
+        """Returns every host there's a history for, in this run or saved in the cache."""
+        with self.__lock:
+            hosts = set(self.__samples)
+
+        if self.cache is not None:
+            self.cache.flush()
+            hosts.update(id for _, id, _ in self.cache.backend.iterate(self.cache.section))
+
+        return sorted(hosts)
+
+    def save(self) -> None:
+        """Writes the history of hosts that got new samples to the cache."""
+        if self.cache is None:
+            return None
+
+        with self.__lock:
+            to_save = {host: list(self.__samples[host]) for host in self.__dirty}
+            self.__dirty.clear()
+
+        if to_save:
+            self.cache.set_many(to_save, seconds_until_expired = LATENCY_HISTORY_TTL)
+
+    def __get_samples(self, host: str) -> List[float]:
+        samples = self.__samples.get(host)
+
+        if samples is None:
+            samples = []
+
+            if self.cache is not None:
+                samples = self.cache.get_cache(host) or []
+
+            self.__samples[host] = samples
+
+        return samples
+
+class AdaptiveTimeout():
+    """
+    Works out connect and read timeouts for a host from its latency history, the ``percentile`` latency 
+    times ``multiplier`` clamped between ``min_timeout`` and ``max_timeout``. Hosts that usually answer 
+    quickly fail fast while slow hosts get more time than a single timeout for every host would give them.
+    """
+    def __init__(
+        self, 
+        percentile: float = 0.99, 
+        multiplier: float = 3, 
+        min_timeout: float = 2, 
+        max_timeout: float = 60
+    ) -> None:
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+
+        super().__init__()
+
+    def timeout_for(self, latency_tracker: LatencyTracker, host: str) -> Optional[float]:
+        """Returns the host's timeout in seconds or None if there's too little history to tell."""
+        latency = latency_tracker.percentile(host, self.percentile)
+
+        if latency is None:
+            return None
+
+        return min(max(latency * self.multiplier, self.min_timeout), self.max_timeout)
@@ -0,0 +1,252 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Callable, Optional, Iterator, AsyncIterator, Tuple
+
+    from httpx import Request, Response, Limits, BaseTransport, AsyncBaseTransport
+
+    MakeTransportT = Callable[[Limits], BaseTransport | AsyncBaseTransport]
+
+import atexit
+import threading
+from fnmatch import fnmatchcase
+
+import httpx
+from devgoldyutils import LoggerAdapter, Colours
+
+from ..logger import mov_cli_logger
+
+__all__ = (
+    "PoolPartitions",
+    "PartitionedTransport",
+)
+
+logger = LoggerAdapter(
+    mov_cli_logger, prefix = Colours.BLUE.apply("Pools")
+)
+
+class PoolPartitions():
+    """
+    The hosts and plugins that get a connection pool (partition) of their own with its own limits,
+    so a host or plugin holding onto lots of slow connections can't starve everything else of connections.
+
+    ``hosts`` is keyed on host or glob of hosts (e.g. ``*.example.com``) and ``plugins`` on plugin namespace.
+    With ``per_plugin`` every plugin gets a pool of its own, plugins not in ``plugins`` get ``default_limits``.
+    """
+    def __init__(
+        self,
+        hosts: Optional[Dict[str, Limits]] = None,
+        plugins: Optional[Dict[str, Limits]] = None,
+        per_plugin: bool = True,
+        default_limits: Optional[Limits] = None
+    ) -> None:
+        self.hosts = hosts or {}
+        self.plugins = plugins or {}
+        self.per_plugin = per_plugin
+        self.default_limits = default_limits or httpx.Limits(max_connections = 100, max_keepalive_connections = 20)
+
+        super().__init__()
+
+    def host_partition(self, host: str) -> Optional[Tuple[str, Limits]]:
+        """
+        Returns the glob and limits of the host's partition or None if it goes through its client's pool. 
+        Like :class:`~mov_cli.http_client.RateLimiter` the host itself wins, then the longest (most specific) glob.
+        """
+        host = host.lower()
+
+        # 'fnmatch' would go by the OS's case rules, hosts are case insensitive everywhere.
+        matches: Tuple[str, ...] = tuple(pattern for pattern in self.hosts if fnmatchcase(host, pattern.lower()))
+
+        if not matches:
+            return None
+
+        pattern = next((pattern for pattern in matches if pattern.lower() == host), None) or max(matches, key = len)
+
+        return pattern, self.hosts[pattern]
+
+    def plugin_limits(self, namespace: str) -> Optional[Limits]:
+        """Returns the limits of the plugin's pool or None if the plugin shares the pool of the client it was made from."""
+        limits = self.plugins.get(namespace)
+
+        if limits is None and self.per_plugin:
+            return self.default_limits
+
+        return limits
+
+class PartitionedTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    An httpx transport that sends requests to hosts with a partition in :class:`PoolPartitions` through a pool
+    of their own and everything else through the ``limits`` pool. Transports (pools) are made with ``make_transport``.
+
+    Each pool keeps count of its requests, how many are in flight and how often a request had to queue
+    for a connection, which get logged in debug mode when mov-cli exits.
+    """
+    def __init__(
+        self,
+        name: str,
+        make_transport: MakeTransportT,
+        limits: Limits,
+        partitions: PoolPartitions
+    ) -> None:
+        self.name = name
+        self.make_transport = make_transport
+        self.partitions = partitions
+
+        self.__lock = threading.Lock()
+        self.__pools: Dict[str, _Pool] = {name: _Pool(make_transport(limits), limits)}
+
+        atexit.register(self.log_stats)
+
+        super().__init__()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Returns the requests, in flight requests, peak in flight requests and queued requests of each pool."""
+        with self.__lock:
+            return {name: pool.stats() for name, pool in self.__pools.items()}
+
+    def log_stats(self) -> None:
+
+        for name, stats in self.stats().items():
+
+            if stats["requests"] > 0:
+                logger.debug(
+                    f"{Colours.PURPLE.apply(name)}: {stats['requests']} requests, {stats['peak_in_flight']} at most in flight, " \
+                        f"{Colours.ORANGE.apply(str(stats['queued']))} queued for a connection."
+                )
+
+    def handle_request(self, request: Request) -> Response:
+        pool = self.__get_pool(request)
+
+        pool.started()
+
+        try:
+            response = pool.transport.handle_request(request)
+        except BaseException:
+            pool.finished()
+            raise
+
+        return _with_stream(response, _CountedStream(response.stream, pool))
+
+    async def handle_async_request(self, request: Request) -> Response:
+        pool = self.__get_pool(request)
+
+        pool.started()
+
+        try:
+            response = await pool.transport.handle_async_request(request)
+        except BaseException:
+            pool.finished()
+            raise
+
+        return _with_stream(response, _CountedStream(response.stream, pool))
+
+    def close(self) -> None:
+
+        for pool in self.__pools.values():
+            pool.transport.close()
+
+    async def aclose(self) -> None:
+
+        for pool in self.__pools.values():
+            await pool.transport.aclose()
+
+    def __get_pool(self, request: Request) -> _Pool:
+        partition = self.partitions.host_partition(request.url.host)
+
+        if partition is None:
+            return self.__pools[self.name]
+
+        pattern, limits = partition
+
+        with self.__lock:
+            pool = self.__pools.get(pattern)
+
+            if pool is None:
+                logger.debug(f"Opening a connection pool for '{pattern}' ({limits})...")
+
+                pool = _Pool(self.make_transport(limits), limits)
+                self.__pools[pattern] = pool
+
+        return pool
+
+class _Pool():
+    def __init__(self, transport: httpx.BaseTransport | httpx.AsyncBaseTransport, limits: Limits) -> None:
+        self.transport = transport
+        self.limits = limits
+
+        self.__lock = threading.Lock()
+        self.__requests = 0
+        self.__in_flight = 0
+        self.__peak_in_flight = 0
+        self.__queued = 0
+
+    def started(self) -> None:
+
+        with self.__lock:
+            self.__requests += 1
+
+            if self.limits.max_connections is not None and self.__in_flight >= self.limits.max_connections:
+                self.__queued += 1
+
+            self.__in_flight += 1
+            self.__peak_in_flight = max(self.__peak_in_flight, self.__in_flight)
+
+    def finished(self) -> None:
+
+        with self.__lock:
+            self.__in_flight -= 1
+
+    def stats(self) -> Dict[str, int]:
+
+        with self.__lock:
+            return {
+                "requests": self.__requests,
+                "in_flight": self.__in_flight,
+                "peak_in_flight": self.__peak_in_flight,
+                "queued": self.__queued
+            }
+
+class _CountedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Marks a request as finished with its pool once its response body is closed, as that's when the connection is freed."""
+    def __init__(self, stream: httpx.SyncByteStream | httpx.AsyncByteStream, pool: _Pool) -> None:
+        self.stream = stream
+        self.pool = pool
+
+        self.__closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self.stream
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+
+        async for chunk in self.stream:
+            yield chunk
+
+    def close(self) -> None:
+
+        try:
+            self.stream.close()
+        finally:
+            self.__finished()
+
+    async def aclose(self) -> None:
+
+        try:
+            await self.stream.aclose()
+        finally:
+            self.__finished()
+
+    def __finished(self) -> None:
+
+        if not self.__closed:
+            self.__closed = True
+            self.pool.finished()
+
+def _with_stream(response: Response, stream: _CountedStream) -> Response:
+    return httpx.Response(
+        status_code = response.status_code,
+        headers = response.headers,
+        stream = stream,
+        extensions = response.extensions
+    )
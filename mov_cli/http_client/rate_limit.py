@@ -0,0 +1,172 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Optional, Tuple
+
+    from httpx import Response
+
+    from ..config import ConfigHTTPRateLimitData
+
+import math
+import time
+import threading
+from fnmatch import fnmatchcase
+from email.utils import parsedate_to_datetime
+from devgoldyutils import LoggerAdapter, Colours
+
+from ..logger import mov_cli_logger
+
+__all__ = (
+    "TokenBucket",
+    "RateLimiter",
+)
+
+logger = LoggerAdapter(
+    mov_cli_logger, prefix = Colours.ORANGE.apply("RateLimiter")
+)
+
+MAX_RETRY_AFTER = 60
+"""The longest a Retry-After header can hold back requests to a host for, so a huge value can't hang mov-cli."""
+
+class TokenBucket():
+    """Lets ``rate`` requests through per second on average, with bursts of up to ``burst`` requests."""
+    def __init__(self, rate: float, burst: Optional[int] = None) -> None:
+        self.rate = rate
+        self.burst = burst or max(1, math.ceil(rate))
+
+        self.__lock = threading.Lock()
+        self.__tokens = float(self.burst)
+        self.__updated = time.monotonic()
+
+        super().__init__()
+
+    def reserve(self) -> float:
+        """Takes a token and returns how many seconds the caller has to wait before it's allowed to use it."""
+        with self.__lock:
+            now = time.monotonic()
+
+            self.__tokens = min(self.burst, self.__tokens + (now - self.__updated) * self.rate)
+            self.__updated = now
+
+            self.__tokens -= 1
+
+            return 0 if self.__tokens >= 0 else -self.__tokens / self.rate
+
+class RateLimiter():
+    """
+    Paces requests per host with token buckets. Limits are keyed on a host (``example.com``) 
+    or a glob of hosts (``*.example.com``) that then share one bucket, exact hosts win over globs 
+    and longer globs win over shorter ones.
+
+    Hosts that answer with a 429 or 503 and a Retry-After header are held back for that long.
+    """
+    def __init__(self, limits: Optional[Dict[str, float | ConfigHTTPRateLimitData]] = None) -> None:
+        self.__lock = threading.Lock()
+
+        self.__buckets: Dict[str, TokenBucket] = {}
+        self.__host_patterns: Dict[str, Optional[str]] = {}
+        self.__blocked_until: Dict[str, float] = {}
+        self.__throttled: Dict[str, float] = {}
+
+        self.add_limits(limits or {})
+
+        super().__init__()
+
+    def add_limits(self, limits: Dict[str, float | ConfigHTTPRateLimitData], override: bool = True) -> None:
+        """
+        Adds limits, either as requests per second or a dict with ``rate`` and ``burst``. 
+        With ``override = False`` limits already set for a pattern are kept (e.g. the user's over a plugin's).
+        """
+        with self.__lock:
+
+            for pattern, limit in limits.items():
+                pattern = pattern.lower()
+
+                if not override and pattern in self.__buckets:
+                    continue
+
+                if isinstance(limit, dict):
+                    self.__buckets[pattern] = TokenBucket(limit["rate"], limit.get("burst"))
+                else:
+                    self.__buckets[pattern] = TokenBucket(limit)
+
+            self.__host_patterns.clear()
+
+    def reserve(self, host: str) -> float:
+        """Returns how many seconds a request to the host has to wait before it can be sent."""
+        host = host.lower()
+
+        with self.__lock:
+            pattern = self.__host_patterns.get(host, "")
+
+            if pattern == "":
+                pattern = self.__match(host)
+                self.__host_patterns[host] = pattern
+
+            blocked_for = self.__blocked_until.get(host, 0) - time.time()
+
+        delay = 0 if pattern is None else self.__buckets[pattern].reserve()
+        delay = max(delay, blocked_for, 0)
+
+        if delay > 0:
+
+            with self.__lock:
+                throttled = self.__throttled.get(host, 0) + delay
+                self.__throttled[host] = throttled
+
+            logger.debug(
+                f"Throttling request to '{host}' for {delay:.2f} seconds ({throttled:.2f} seconds in total)."
+            )
+
+        return delay
+
+    def handle_response(self, host: str, response: Response) -> None:
+        """Holds back requests to the host if the response asks us to slow down with a Retry-After header."""
+        if response.status_code not in (429, 503):
+            return None
+
+        retry_after = parse_retry_after(response.headers.get("retry-after"))
+
+        if retry_after is None:
+            return None
+
+        retry_after = min(retry_after, MAX_RETRY_AFTER)
+
+        with self.__lock:
+            host = host.lower()
+            self.__blocked_until[host] = max(self.__blocked_until.get(host, 0), time.time() + retry_after)
+
+        logger.debug(f"'{host}' asked us to retry after {retry_after:.0f} seconds.")
+
+    def throttled(self) -> Dict[str, float]:
+        """Returns how many seconds requests to each host have spent waiting on the rate limiter."""
+        with self.__lock:
+            return dict(self.__throttled)
+
+    def __match(self, host: str) -> Optional[str]:
+
+        if host in self.__buckets:
+            return host
+
+        matches: Tuple[str, ...] = tuple(pattern for pattern in self.__buckets if fnmatchcase(host, pattern))
+
+        if not matches:
+            return None
+
+        return max(matches, key = len)
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header, which is either a delay in seconds or a date."""
+    if value is None:
+        return None
+
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0)
+    except (TypeError, ValueError, IndexError):
+        return None
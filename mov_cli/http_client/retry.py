@@ -0,0 +1,61 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional, FrozenSet, Iterable
+
+    from httpx import Response
+
+import random
+
+__all__ = (
+    "RetryPolicy",
+)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "TRACE", "PUT", "DELETE"})
+"""Methods that are safe to send again (RFC 9110 section 9.2.2)."""
+
+class RetryPolicy():
+    """
+    Decides whether a failed request should be sent again and how long to wait before doing so.
+
+    Only idempotent methods are retried, on transport errors (connection resets, timeouts, etc) 
+    and on the ``statuses`` given. The wait grows exponentially with every attempt, with full jitter 
+    so clients that failed together don't all retry at the same moment. A Retry-After header on a 
+    429 or 503 is honoured by the client's :class:`~mov_cli.http_client.RateLimiter` instead.
+    """
+    def __init__(
+        self,
+        attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 8,
+        statuses: Iterable[int] = (429, 500, 502, 503, 504)
+    ) -> None:
+        self.attempts = attempts
+        """How many times a request is sent in total, including the first time."""
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.statuses: FrozenSet[int] = frozenset(statuses)
+
+        super().__init__()
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        response: Optional[Response] = None,
+        error: Optional[Exception] = None
+    ) -> bool:
+        """Returns whether a request that failed on the ``attempt`` (starting from 0) should be sent again."""
+        if attempt + 1 >= self.attempts or method.upper() not in IDEMPOTENT_METHODS:
+            return False
+
+        if error is not None:
+            # Certificate errors won't fix themselves, they most likely mean the site is blocked.
+            return "[SSL: CERTIFICATE_VERIFY_FAILED]" not in str(error)
+
+        return response is not None and response.status_code in self.statuses
+
+    def backoff(self, attempt: int) -> float:
+        """Returns how many seconds to wait before sending the request again after the ``attempt`` failed."""
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** attempt))
@@ -0,0 +1,203 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Tuple, Hashable, Callable, Awaitable, TypeVar, Optional, Any
+
+    from pathlib import Path
+
+    T = TypeVar("T")
+
+import time
+import random
+import asyncio
+import hashlib
+import threading
+from devgoldyutils import LoggerAdapter, Colours
+
+from ..logger import mov_cli_logger
+from ..utils import FileLock
+
+__all__ = (
+    "SingleFlight",
+    "AsyncSingleFlight",
+    "ProcessSingleFlight",
+)
+
+logger = LoggerAdapter(
+    mov_cli_logger, prefix = Colours.BLUE.apply("ProcessSingleFlight")
+)
+
+LOCK_FILE_MAX_AGE = 86400
+"""How old lock files get before they're deleted."""
+LOCK_FILE_PRUNE_CHANCE = 1 / 64
+"""The chance a call will also delete old lock files."""
+
+class _Call():
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+class SingleFlight():
+    """
+    Coalesces identical calls made at the same time from different threads: the first 
+    caller of a key (the leader) runs the function while the others wait for its result.
+    """
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__calls: Dict[Hashable, _Call] = {}
+
+        super().__init__()
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> Tuple[T, bool]:
+        """Returns the result of the function for the key and whether this caller was the one that ran it."""
+        with self.__lock:
+            call = self.__calls.get(key)
+            leader = call is None
+
+            if leader:
+                call = _Call()
+                self.__calls[key] = call
+
+        if not leader:
+            call.done.wait()
+
+            if call.error is not None:
+                raise call.error
+
+            return call.result, False
+
+        try:
+            call.result = function()
+
+        except BaseException as e:
+            call.error = e
+            raise e
+
+        finally:
+
+            with self.__lock:
+                del self.__calls[key]
+
+            call.done.set()
+
+        return call.result, True
+
+class AsyncSingleFlight():
+    """The asyncio version of :class:`SingleFlight`, coalescing identical calls from tasks of the same event loop."""
+    def __init__(self) -> None:
+        self.__calls: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future] = {}
+
+        super().__init__()
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """Returns the result of the function for the key and whether this caller was the one that ran it."""
+        loop = asyncio.get_running_loop()
+
+        future = self.__calls.get((loop, key))
+
+        if future is not None:
+            return await asyncio.shield(future), False
+
+        future = loop.create_future()
+        self.__calls[(loop, key)] = future
+
+        try:
+            result = await function()
+
+        except asyncio.CancelledError as e:
+            future.cancel()
+            raise e
+
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception() # Marks it retrieved so it isn't logged when no one else was waiting.
+            raise e
+
+        else:
+            future.set_result(result)
+
+        finally:
+            del self.__calls[(loop, key)]
+
+        return result, True
+
+class ProcessSingleFlight():
+    """
+    Coalesces identical calls made at the same time by different mov-cli processes (e.g. tmux panes, 
+    scripts or fzf previews) with a lock file per key in ``lock_dir``. The first process to take a key's 
+    lock runs the function while the others wait for the lock and then use the leader's shared result.
+
+    Results are only shared when another process is waiting, which it signals by leaving a marker 
+    file next to the lock. A process gives up waiting after ``timeout`` seconds and runs the function itself.
+    """
+    def __init__(self, lock_dir: Path, timeout: float = 30) -> None:
+        self.lock_dir = lock_dir
+        self.timeout = timeout
+
+        super().__init__()
+
+    def do(
+        self, 
+        key: Hashable, 
+        function: Callable[[], T], 
+        get_shared: Callable[[], Optional[T]], 
+        share: Callable[[T], Any]
+    ) -> Tuple[T, bool]:
+        """
+        Returns the result of the function for the key and whether this process was the one that ran it. 
+        ``share`` hands the leader's result to waiting processes and ``get_shared`` picks it up, returning None if there's none.
+        """
+        self.lock_dir.mkdir(parents = True, exist_ok = True)
+
+        name = hashlib.sha256(repr(key).encode()).hexdigest()[:32]
+
+        lock = FileLock(self.lock_dir.joinpath(f"{name}.lock"))
+        waiting_path = self.lock_dir.joinpath(f"{name}.waiting")
+
+        waited = False
+
+        if not lock.acquire(blocking = False):
+            waited = True
+            waiting_path.touch()
+
+            if not lock.acquire(timeout = self.timeout):
+                logger.debug(f"Gave up waiting on another process after {self.timeout} seconds.")
+                return function(), True
+
+        try:
+
+            if waited:
+                result = get_shared()
+
+                if result is not None:
+                    return result, False
+
+            result = function()
+
+            if waiting_path.exists():
+                share(result)
+                waiting_path.unlink(missing_ok = True)
+
+        finally:
+            lock.release()
+
+        if random.random() < LOCK_FILE_PRUNE_CHANCE:
+            self.prune()
+
+        return result, True
+
+    def prune(self) -> None:
+        """Deletes lock files that haven't been made in a while."""
+        now = time.time()
+
+        for path in self.lock_dir.iterdir():
+
+            try:
+
+                if now - path.stat().st_mtime >= LOCK_FILE_MAX_AGE:
+                    path.unlink()
+
+            except OSError:
+                pass
@@ -14,8 +14,9 @@ import unicodedata
 from devgoldyutils import Colours, LoggerAdapter
 
 from ..logger import mov_cli_logger
+from ..http_client import HTTPClient
 from ..utils import get_temp_directory
-from ..errors import ReferrerNotSupportedError
+from ..errors import ReferrerNotSupportedError, MovCliException
 
 from .player import Player
 
@@ -30,8 +31,11 @@ class VLC(Player):
         args: Optional[List[str]] = None, 
         args_override: bool = False, 
         debug: bool = False, 
+        http_client: Optional[HTTPClient] = None, 
         **kwargs
     ) -> None:
+        self.http_client = http_client
+
         super().__init__(
             platform = platform, 
             args = args, 
@@ -99,12 +103,18 @@ class VLC(Player):
             if media.subtitles is not None:
 
                 for subtitle in media.subtitles:
+                    subtitle_path = subtitle.url
 
-                    if subtitle.startswith("https://"):
+                    if subtitle_path.startswith("https://"):
                         logger.debug("Subtitles detected as a url.")
-                        subtitle = str(self.__url_subtitles_to_file(media, subtitle.url))
+                        subtitle_file = self.__url_subtitles_to_file(media, subtitle.url)
+
+                        if subtitle_file is None:
+                            continue
 
-                    args.append(f"--sub-file={subtitle}")
+                        subtitle_path = str(subtitle_file)
+
+                    args.append(f"--sub-file={subtitle_path}")
 
             if self.debug is False:
                 args.append("--quiet")
@@ -115,7 +125,8 @@ class VLC(Player):
 
         return None
 
-    def __url_subtitles_to_file(self, media: Media, subtitles_url: str) -> Path:
+    def __url_subtitles_to_file(self, media: Media, subtitles_url: str) -> Optional[Path]:
+        """Downloads the subtitles to the temp directory, returns None if that fails so the media plays without them."""
         sub_file_exists_already = False
         temp_dir = get_temp_directory(self.platform)
 
@@ -128,9 +139,13 @@ class VLC(Player):
 
         if sub_file_exists_already is False:
             logger.debug("Downloading subtitles to temp directory as vlc does not support streaming of subs via url...")
-            response = httpx.get(url = subtitles_url)
-
-            with file_path.open("wb") as file:
-                file.write(response.content)
+            if self.http_client is None:
+                self.http_client = HTTPClient()
+
+            try:
+                self.http_client.download_to(subtitles_url, file_path)
+            except (httpx.HTTPError, MovCliException) as e:
+                logger.warning(f"Failed to download subtitles so playing without them. Error: {e}")
+                return None
 
         return file_path
\ No newline at end of file
@@ -3,12 +3,14 @@ Module containing mov-cli plugin related stuff.
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING, TypedDict, TypeVar
+from typing_extensions import NotRequired
 
 if TYPE_CHECKING:
     from types import ModuleType
     from typing import Optional, Dict, List, Tuple, Literal, Type
 
     from .utils.platform import SUPPORTED_PLATFORMS
+    from .config import ConfigHTTPRateLimitData
 
 import importlib
 from dataclasses import dataclass
@@ -34,6 +36,10 @@ class PluginHookData(TypedDict):
     """The name of the pypi package. This is required for the plugin update notifier to work."""
     scrapers: Dict[str, Type[Scraper]] | PluginHookScrapersT
     args: Dict[str, T]
+    rate_limits: NotRequired[Dict[str, float | ConfigHTTPRateLimitData]]
+    """Requests per second the plugin's sites allow, keyed on host or a glob of hosts. The user's config overrides these."""
+    hosts: NotRequired[List[str]]
+    """Hosts the plugin's scrapers make requests to, connections to them are opened while the user is still choosing."""
 
 PluginHookScrapersT = TypedDict(
     "PluginHookScrapersT",
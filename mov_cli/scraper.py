@@ -2,16 +2,20 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Dict, Literal, Iterable, Optional
+    from typing import Dict, Literal, Iterable, AsyncIterable, Awaitable, Optional, TypeVar
 
+    from .cache import Cache
     from .config import Config
     from .utils import EpisodeSelector
-    from .http_client import HTTPClient
+    from .http_client import HTTPClient, AsyncHTTPClient
     from .media import Metadata, Multi, Single
 
     ScraperOptionsT = Dict[str, str | bool]
     ScrapeEpisodesT = Dict[int, int] | Dict[None, Literal[1]]
 
+    T = TypeVar("T")
+
+import inspect
 from bs4 import BeautifulSoup
 from abc import ABC, abstractmethod
 from devgoldyutils import LoggerAdapter
@@ -20,6 +24,8 @@ from .logger import mov_cli_logger
 
 __all__ = (
     "Scraper",
+    "AsyncScraper",
+    "AsyncScraperAdapter",
 )
 
 class Scraper(ABC):
@@ -28,17 +34,58 @@ class Scraper(ABC):
             self, 
             config: Config, 
             http_client: HTTPClient, 
-            options: Optional[ScraperOptionsT] = None
+            options: Optional[ScraperOptionsT] = None, 
+            async_http_client: Optional[AsyncHTTPClient] = None
         ) -> None:
 
         self.config = config
         self.http_client = http_client
         self.options = options or {}
 
+        self._async_http_client = async_http_client
+        self._session_state: Optional[Cache] = None
+
         self.logger = LoggerAdapter(mov_cli_logger, prefix = self.__class__.__name__)
 
         super().__init__()
 
+    @property
+    def async_http_client(self) -> AsyncHTTPClient:
+        """
+        An :class:`~mov_cli.http_client.AsyncHTTPClient` for fanning out requests with ``asyncio.gather``. 
+        If one wasn't passed in, it's made with the same settings and cookie jar as :attr:`http_client`.
+        """
+        if self._async_http_client is None:
+            from .http_client import AsyncHTTPClient # Imported here as 'http_client' indirectly imports this module.
+
+            self._async_http_client = AsyncHTTPClient.from_http_client(self.http_client)
+
+        return self._async_http_client
+
+    @async_http_client.setter
+    def async_http_client(self, async_http_client: AsyncHTTPClient) -> None:
+        self._async_http_client = async_http_client
+
+    @property
+    def session_state(self) -> Cache:
+        """
+        A key value store that survives across mov-cli runs for keeping the results of expensive handshakes 
+        (tokens, solved challenges, etc) so the next run can skip them. Entries expire after the 
+        ``seconds_until_expired`` passed to :meth:`~mov_cli.cache.Cache.set_cache`.
+
+        It's shared by every scraper of the plugin, the plugin is known by the namespace of :attr:`http_client`.
+        """
+        if self._session_state is None:
+            # Imported here as both indirectly import this module.
+            from .cache import Cache
+            from .utils import what_platform
+
+            namespace = self.http_client.namespace or self.__class__.__name__.lower()
+
+            self._session_state = Cache(what_platform(), section = f"session_state.{namespace}", config = self.config)
+
+        return self._session_state
+
     def soup(self, html: str, **kwargs) -> BeautifulSoup:
         """A ready to use beautiful soup instance."""
         return BeautifulSoup(html, self.config.parser, **kwargs)
@@ -58,4 +105,79 @@ class Scraper(ABC):
 
     def scrape_episodes(self, metadata: Metadata) -> ScrapeEpisodesT:
         """Returns episode count for each season in that Media."""
-        return {None: 1}
\ No newline at end of file
+        return {None: 1}
+
+class AsyncScraper(Scraper):
+    """
+    A base class for building scrapers whose ``search``, ``scrape`` and ``scrape_episodes`` are async, so requests 
+    inside them can be made at the same time with :attr:`async_http_client` and ``asyncio.gather``.
+
+    mov-cli runs them on its own event loop (see :func:`~mov_cli.utils.get_event_loop`) wrapped in an 
+    :class:`AsyncScraperAdapter`, don't run an event loop of your own in them.
+    """
+    @abstractmethod
+    def search(self, query: str, limit: Optional[int] = None) -> AsyncIterable[Metadata] | Awaitable[Iterable[Metadata]]:
+        """Where your searching for media should be done. Should be an async generator yielding Metadata or a coroutine returning them."""
+        ...
+
+    @abstractmethod
+    async def scrape(self, metadata: Metadata, episode: EpisodeSelector) -> Optional[Multi | Single]:
+        """
+        Where your scraping for the media should be performed. 
+        Should return an instance of `Media()` but return `None` if the media is unavailable.
+        """
+        ...
+
+    async def scrape_episodes(self, metadata: Metadata) -> ScrapeEpisodesT:
+        """Returns episode count for each season in that Media."""
+        return {None: 1}
+
+class AsyncScraperAdapter(Scraper):
+    """
+    Wraps an :class:`AsyncScraper` so it can be used like any other scraper from blocking code, 
+    its methods are run on mov-cli's event loop. Search results are still streamed as they're yielded.
+    """
+    def __init__(self, async_scraper: AsyncScraper) -> None:
+        self.async_scraper = async_scraper
+
+        super().__init__(async_scraper.config, async_scraper.http_client, async_scraper.options)
+
+        self.logger = async_scraper.logger
+
+    @property
+    def async_http_client(self) -> AsyncHTTPClient:
+        return self.async_scraper.async_http_client
+
+    @async_http_client.setter
+    def async_http_client(self, async_http_client: AsyncHTTPClient) -> None:
+        self.async_scraper.async_http_client = async_http_client
+
+    @property
+    def session_state(self) -> Cache:
+        return self.async_scraper.session_state
+
+    def search(self, query: str, limit: Optional[int] = None) -> Iterable[Metadata]:
+        from .utils import run_coroutine, iterate_async # Imported here as 'utils' indirectly imports this module.
+
+        search_results = self.async_scraper.search(query, limit)
+
+        if inspect.isawaitable(search_results):
+            search_results = run_coroutine(_await(search_results))
+
+        if hasattr(search_results, "__aiter__"):
+            return iterate_async(search_results)
+
+        return search_results
+
+    def scrape(self, metadata: Metadata, episode: EpisodeSelector) -> Optional[Multi | Single]:
+        from .utils import run_coroutine
+
+        return run_coroutine(self.async_scraper.scrape(metadata, episode))
+
+    def scrape_episodes(self, metadata: Metadata) -> ScrapeEpisodesT:
+        from .utils import run_coroutine
+
+        return run_coroutine(self.async_scraper.scrape_episodes(metadata))
+
+async def _await(awaitable: Awaitable[T]) -> T:
+    return await awaitable
\ No newline at end of file
@@ -2,6 +2,8 @@ from .paths import *
 from .version import *
 from .platform import *
 from .ip import *
+from .file_lock import *
+from .event_loop import *
 
 # Backwards compatibility for pre v4.5 plugins.
 from ..media.episode_selector import *
\ No newline at end of file
@@ -0,0 +1,81 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional, Coroutine, AsyncIterable, Generator, TypeVar, Any
+
+    T = TypeVar("T")
+
+import asyncio
+import threading
+
+__all__ = (
+    "get_event_loop",
+    "run_coroutine",
+    "iterate_async"
+)
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Returns mov-cli's event loop, starting it if it isn't running yet. The loop runs forever in a daemon
+    thread of its own so coroutines from any thread (e.g. several async scrapers at once) share that one thread.
+    """
+    global _loop, _loop_thread
+
+    with _lock:
+
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+
+            _loop_thread = threading.Thread(target = _loop.run_forever, name = "mov-cli-event-loop", daemon = True)
+            _loop_thread.start()
+
+    return _loop
+
+def run_coroutine(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Runs a coroutine on mov-cli's event loop and blocks until it returns. It can't be called from the event loop itself."""
+    loop = get_event_loop()
+
+    if threading.current_thread() is _loop_thread:
+        coroutine.close()
+        raise RuntimeError("Blocking on a coroutine from mov-cli's event loop would deadlock it, await it instead.")
+
+    future = asyncio.run_coroutine_threadsafe(coroutine, loop)
+
+    try:
+        return future.result()
+
+    except BaseException:
+        # E.g. a KeyboardInterrupt, the coroutine shouldn't carry on without anyone waiting on it.
+        future.cancel()
+        raise
+
+def iterate_async(async_iterable: AsyncIterable[T]) -> Generator[T, Any, None]:
+    """
+    Iterates an async iterable (e.g. an async generator) on mov-cli's event loop from blocking code,
+    an item at a time so it's still streamed. Closing the generator closes the async iterable.
+    """
+    async_iterator = async_iterable.__aiter__()
+
+    try:
+
+        while True:
+
+            try:
+                yield run_coroutine(_anext(async_iterator))
+            except StopAsyncIteration:
+                break
+
+    finally:
+        aclose = getattr(async_iterator, "aclose", None)
+
+        if aclose is not None:
+            run_coroutine(aclose())
+
+async def _anext(async_iterator: Any) -> Any:
+    # 'run_coroutine_threadsafe' only takes coroutines and '__anext__' may return any awaitable.
+    return await async_iterator.__anext__()
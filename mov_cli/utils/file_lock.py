@@ -0,0 +1,112 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional, IO
+
+    from pathlib import Path
+
+import os
+import time
+
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+    import msvcrt
+
+__all__ = (
+    "FileLock",
+    "replace_file_atomically"
+)
+
+class FileLock():
+    """
+    An advisory lock on a file that is respected across processes.
+
+    Shared locks can be held by many processes at once while an exclusive lock 
+    can only be held by one. On Windows every lock is exclusive.
+    """
+    def __init__(self, path: Path, shared: bool = False) -> None:
+        self.path = path
+        self.shared = shared
+
+        self.__file: Optional[IO] = None
+
+    def acquire(self, blocking: bool = True, timeout: Optional[float] = None) -> bool:
+        """Acquires the lock, returns False if it couldn't be acquired without blocking or within the timeout."""
+        file = self.path.open("a+b")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+
+            try:
+                self.__lock(file, blocking = blocking and deadline is None)
+                break
+
+            except OSError:
+
+                if deadline is None or time.monotonic() >= deadline:
+                    file.close()
+                    return False
+
+                time.sleep(0.05)
+
+        self.__file = file
+        return True
+
+    def release(self) -> None:
+
+        if self.__file is None:
+            return None
+
+        if fcntl is not None:
+            fcntl.flock(self.__file, fcntl.LOCK_UN)
+        else:
+            self.__file.seek(0)
+            msvcrt.locking(self.__file.fileno(), msvcrt.LK_UNLCK, 1)
+
+        self.__file.close()
+        self.__file = None
+
+    def __lock(self, file: IO, blocking: bool) -> None:
+
+        if fcntl is not None:
+            operation = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+            fcntl.flock(file, operation if blocking else operation | fcntl.LOCK_NB)
+            return None
+
+        file.seek(0)
+
+        # LK_LOCK only retries for 10 seconds so we loop ourselves for a truly blocking lock.
+        while True:
+
+            try:
+                msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+                return None
+
+            except OSError:
+
+                if not blocking:
+                    raise
+
+                time.sleep(0.05)
+
+    def __enter__(self) -> FileLock:
+        self.acquire()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
+
+def replace_file_atomically(path: Path, data: bytes) -> None:
+    """Writes data to a temporary file next to the path then renames it over the path, so readers never see a partial file."""
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+    with temp_path.open("wb") as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(temp_path, path)
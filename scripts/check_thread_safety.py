@@ -0,0 +1,144 @@
+"""
+Script that checks the http client holds up when it's used from many threads at once, against a local http server.
+
+It covers concurrent requests not leaking headers or cookies into each other, cookie jars being updated
+from several threads (and the async client sharing the jar) and identical requests being coalesced by single-flight.
+
+You must run it like so in the **root directory** -> python scripts/check_thread_safety.py
+"""
+import sys
+sys.path.insert(0, ".")
+
+import gzip
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from mov_cli.utils import run_coroutine
+from mov_cli.http_client import HTTPClient, AsyncHTTPClient
+
+THREADS = 32
+REQUESTS = 400
+
+class Handler(BaseHTTPRequestHandler):
+    slow_hits = 0
+    slow_hits_lock = threading.Lock()
+
+    def do_GET(self) -> None:
+        headers = {}
+
+        if self.path.startswith("/set/"):
+            headers["Set-Cookie"] = f"{self.path[len('/set/'):]}=1; Path=/"
+
+        elif self.path.startswith("/slow"):
+
+            with Handler.slow_hits_lock:
+                Handler.slow_hits += 1
+
+            time.sleep(0.5)
+
+        body = json.dumps(
+            {"path": self.path, "id": self.headers.get("X-Id"), "cookie": self.headers.get("Cookie")}
+        ).encode()
+
+        if self.path.endswith("/gzip"):
+            headers["Content-Encoding"] = "gzip"
+            body = gzip.compress(body)
+
+        self.send_response(200)
+
+        for name, value in headers.items():
+            self.send_header(name, value)
+
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+def check_concurrent_requests(base_url: str) -> None:
+    """Requests from many threads at once each get sent with their own headers and cookies only."""
+    http_client = HTTPClient(headers = {"User-Agent": "check_thread_safety"})
+
+    def request(number: int) -> None:
+        headers = {"X-Id": str(number)}
+
+        response = http_client.request(
+            "GET", f"{base_url}/{number}", headers = headers, include_default_headers = True, cookies = {"id": str(number)}, cache = False
+        ).json()
+
+        assert headers == {"X-Id": str(number)}, f"The caller's headers were modified: {headers}"
+        assert response == {"path": f"/{number}", "id": str(number), "cookie": f"id={number}"}, f"Request {number} got mixed up: {response}"
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        list(executor.map(request, range(REQUESTS)))
+
+def check_cookie_updates(base_url: str) -> None:
+    """Cookies set on responses from many threads, and from an async client sharing the jar, all end up in the jar."""
+    http_client = HTTPClient()
+    async_http_client = AsyncHTTPClient.from_http_client(http_client)
+
+    def request(number: int) -> None:
+
+        if number % 3 == 0:
+            run_coroutine(async_http_client.request("GET", f"{base_url}/set/async{number}", cache = False))
+        elif number % 3 == 1:
+            http_client.request("GET", f"{base_url}/set/sync{number}", cache = False)
+        else:
+            # Reads the jar while the other threads are writing to it.
+            dict(http_client.cookies)
+            http_client.request("GET", f"{base_url}/{number}", cache = False)
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        list(executor.map(request, range(REQUESTS)))
+
+    expected = {f"async{number}" for number in range(0, REQUESTS, 3)} | {f"sync{number}" for number in range(1, REQUESTS, 3)}
+    missing = expected - set(http_client.cookies.keys())
+
+    assert not missing, f"{len(missing)} cookies went missing from the jar, e.g. {sorted(missing)[:5]}"
+
+def check_single_flight(base_url: str) -> None:
+    """
+    Identical requests made at the same time are sent once and every caller gets a response object of its own, 
+    with a body that's readable (only decoded once) even if the response was compressed.
+    """
+    for path in ("/slow", "/slow/gzip"):
+        http_client = HTTPClient()
+        Handler.slow_hits = 0
+
+        barrier = threading.Barrier(THREADS)
+
+        def request(_: int):
+            barrier.wait()
+            return http_client.request("GET", base_url + path, cache = False)
+
+        with ThreadPoolExecutor(THREADS) as executor:
+            responses = list(executor.map(request, range(THREADS)))
+
+        assert Handler.slow_hits == 1, f"The request to '{path}' was sent {Handler.slow_hits} times instead of once."
+        assert len({id(response) for response in responses}) == THREADS, "Coalesced callers were handed the same response object."
+        assert all(response.json()["path"] == path for response in responses), f"A coalesced caller of '{path}' got the wrong body."
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target = server.serve_forever, daemon = True).start()
+
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    failed = False
+
+    for check in (check_concurrent_requests, check_cookie_updates, check_single_flight):
+
+        try:
+            check(base_url)
+            print(f"{check.__name__}: ok")
+
+        except Exception as e:
+            failed = True
+            print(f"{check.__name__}: FAILED, {e!r}")
+
+    server.shutdown()
+
+    sys.exit(1 if failed else 0)